@@ -7,6 +7,7 @@ common functionality shared between local and cloud agents.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import uuid
 from abc import ABC, abstractmethod
@@ -45,8 +46,19 @@ from openhands.sdk import (
 from openhands_cli import __version__
 from openhands_cli.acp_impl.agent.util import AgentType, get_session_mode_state
 from openhands_cli.acp_impl.confirmation import ConfirmationMode
-from openhands_cli.acp_impl.events.event import EventSubscriber
+from openhands_cli.acp_impl.events.replay import replay_history
 from openhands_cli.acp_impl.runner import run_conversation_with_confirmation
+from openhands_cli.acp_impl.session_eviction import (
+    DEFAULT_MAX_RESIDENT_SESSIONS,
+    DEFAULT_SESSION_IDLE_TTL,
+    SessionEvictionPolicy,
+    SessionSetup,
+    resident_memory_summary,
+)
+from openhands_cli.acp_impl.session_scheduler import (
+    DEFAULT_MAX_CONCURRENT_SESSIONS,
+    SessionScheduler,
+)
 from openhands_cli.acp_impl.slash_commands import (
     VALID_CONFIRMATION_MODE,
     apply_confirmation_mode_to_conversation,
@@ -94,6 +106,10 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
         initial_confirmation_mode: ConfirmationMode,
         resume_conversation_id: str | None = None,
         cloud_api_url: str = "https://app.all-hands.dev",
+        replay_turns: int | None = None,
+        max_concurrent_sessions: int = DEFAULT_MAX_CONCURRENT_SESSIONS,
+        max_resident_sessions: int | None = DEFAULT_MAX_RESIDENT_SESSIONS,
+        session_idle_ttl: float | None = DEFAULT_SESSION_IDLE_TTL,
     ):
         """Initialize the base ACP agent.
 
@@ -102,12 +118,31 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             initial_confirmation_mode: Default confirmation mode for new sessions
             resume_conversation_id: Optional conversation ID to resume
             cloud_api_url: OpenHands Cloud API URL for authentication
+            replay_turns: Only replay the last N turns of history when a session
+                is loaded or resumed (None replays everything)
+            max_concurrent_sessions: Maximum number of sessions whose
+                conversations run at the same time; others wait in FIFO order
+            max_resident_sessions: Maximum number of conversations kept in
+                memory; least recently used idle ones are closed and reloaded
+                on their next use (None for no limit)
+            session_idle_ttl: Close conversations idle for this many seconds
+                (None to keep them until evicted by the limit)
         """
         self._conn = conn
         self._active_sessions: dict[str, BaseConversation] = {}
         self._running_tasks: dict[str, asyncio.Task] = {}
         self._initial_confirmation_mode: ConfirmationMode = initial_confirmation_mode
         self._resume_conversation_id: str | None = resume_conversation_id
+        self._replay_turns: int | None = replay_turns
+        self._session_scheduler = SessionScheduler(max_concurrent_sessions)
+        self._eviction_policy = SessionEvictionPolicy(
+            max_resident_sessions, session_idle_ttl
+        )
+        # Setup of every session created by this agent, kept to reload them
+        self._session_setups: dict[str, SessionSetup] = {}
+        # Confirmation mode of sessions closed by eviction
+        self._evicted_sessions: dict[str, ConfirmationMode] = {}
+        self._eviction_timer: asyncio.TimerHandle | None = None
 
         # Auth-related state
         self._store = TokenStorage()
@@ -158,6 +193,114 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
         """
         ...
 
+    async def _replay_history(
+        self, session_id: str, conversation: BaseConversation
+    ) -> None:
+        """Send the conversation's history to the client in batches."""
+        await replay_history(
+            session_id,
+            self._conn,
+            conversation.state.events,
+            conversation,
+            last_turns=self._replay_turns,
+        )
+
+    async def _flush_session_updates(self, session_id: str) -> None:
+        """Send session updates still buffered at the end of a turn.
+
+        No-op by default; agents that batch streamed updates override this.
+        """
+        del session_id
+
+    async def _allocate_session_id(
+        self,
+        working_dir: str | None,  # noqa: ARG002
+        mcp_servers: dict[str, dict[str, Any]] | None,  # noqa: ARG002
+    ) -> str:
+        """Return the ID of a new session.
+
+        Agents that prepare conversations ahead of time override this to hand
+        out the ID of a matching pre-built conversation.
+        """
+        return str(uuid.uuid4())
+
+    async def _get_session(self, session_id: str) -> BaseConversation:
+        """Return the session's conversation, reloading it if it was evicted."""
+        if session_id in self._evicted_sessions:
+            setup = self._session_setups.get(session_id, SessionSetup())
+            logger.info(f"Reloading evicted session {session_id}")
+            conversation = await self._get_or_create_conversation(
+                session_id=session_id,
+                working_dir=setup.working_dir,
+                mcp_servers=setup.mcp_servers,
+                is_resuming=True,
+            )
+            mode = self._evicted_sessions.pop(session_id)
+            apply_confirmation_mode_to_conversation(conversation, mode, session_id)
+        else:
+            conversation = await self._get_or_create_conversation(session_id=session_id)
+
+        self._touch_session(session_id)
+        return conversation
+
+    def _touch_session(self, session_id: str) -> None:
+        """Mark a session as used and evict others if needed."""
+        self._eviction_policy.touch(session_id)
+        self._evict_sessions(keep=session_id)
+
+        if self._eviction_timer is None:
+            delay = self._eviction_policy.next_expiry()
+            if delay is not None:
+                self._eviction_timer = asyncio.get_running_loop().call_later(
+                    delay, self._on_eviction_timer
+                )
+
+    def _on_eviction_timer(self) -> None:
+        self._eviction_timer = None
+        self._evict_sessions()
+
+        delay = self._eviction_policy.next_expiry()
+        if delay is not None and self._active_sessions:
+            # Busy sessions may keep the oldest entry alive; check again later.
+            delay = max(delay, 1.0)
+            self._eviction_timer = asyncio.get_running_loop().call_later(
+                delay, self._on_eviction_timer
+            )
+
+    def _evict_sessions(self, keep: str | None = None) -> None:
+        """Close resident conversations that are over the limit or idle."""
+        scheduler = self._session_scheduler
+        busy = {
+            session_id
+            for session_id in self._active_sessions
+            if session_id == keep
+            or session_id in self._running_tasks
+            or scheduler.is_queued(session_id)
+            or scheduler.is_running(session_id)
+        }
+        victims = self._eviction_policy.select_victims(self._active_sessions, busy)
+        for session_id, reason in victims:
+            self._evict_session(session_id, reason)
+
+    def _evict_session(self, session_id: str, reason: str) -> None:
+        conversation = self._active_sessions.get(session_id)
+        if conversation is None:
+            return
+
+        idle = self._eviction_policy.idle_for(session_id)
+        self._evicted_sessions[session_id] = get_confirmation_mode_from_conversation(
+            conversation
+        )
+        self._eviction_policy.discard(session_id)
+        # Events are persisted as they happen; closing releases LLM and MCP
+        # resources. The conversation is reloaded on the next prompt.
+        self._cleanup_session(session_id)
+        self._active_sessions.pop(session_id, None)
+        logger.info(
+            f"Evicted session {session_id} ({reason}, idle {idle:.0f}s); "
+            f"{resident_memory_summary(self._active_sessions)}"
+        )
+
     @abstractmethod
     async def _is_authenticated(self) -> bool:
         """Check if the user is authenticated.
@@ -189,6 +332,9 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             conversation = self._active_sessions[session_id]
             apply_confirmation_mode_to_conversation(conversation, mode, session_id)
             logger.debug(f"Confirmation mode for session {session_id}: {mode}")
+        elif session_id in self._evicted_sessions:
+            # Applied when the session is reloaded
+            self._evicted_sessions[session_id] = mode
         else:
             logger.warning(
                 f"Cannot set confirmation mode for session {session_id}: "
@@ -372,6 +518,9 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
     async def cancel(self, session_id: str, **_kwargs: Any) -> None:
         """Cancel the current operation."""
         logger.info(f"Cancel requested for session: {session_id}")
+        if session_id in self._evicted_sessions:
+            # Only idle sessions are evicted, so there is nothing to cancel
+            return
 
         try:
             conversation = await self._get_or_create_conversation(session_id=session_id)
@@ -381,6 +530,13 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             if not running_task or running_task.done():
                 return
 
+            scheduler = self._session_scheduler
+            if scheduler.is_queued(session_id) and not scheduler.is_running(session_id):
+                # Still waiting for a slot: nothing to stop, just leave the queue.
+                running_task.cancel()
+                await asyncio.gather(running_task, return_exceptions=True)
+                return
+
             logger.debug(
                 f"Waiting for conversation thread to terminate for session {session_id}"
             )
@@ -423,7 +579,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             is_resuming = True
             logger.info(f"Resuming conversation: {session_id}")
         else:
-            session_id = str(uuid.uuid4())
+            session_id = await self._allocate_session_id(working_dir, mcp_servers_dict)
 
         try:
             conversation = await self._get_or_create_conversation(
@@ -434,6 +590,10 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
             )
 
             logger.info(f"Created new {self.agent_type} session {session_id}")
+            self._session_setups[session_id] = SessionSetup(
+                working_dir=working_dir, mcp_servers=mcp_servers_dict
+            )
+            self._touch_session(session_id)
 
             await self.send_available_commands(session_id)
 
@@ -449,9 +609,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
                     f"Replaying {len(conversation.state.events)} historic events "
                     f"for resumed session {session_id}"
                 )
-                subscriber = EventSubscriber(session_id, self._conn)
-                for event in conversation.state.events:
-                    await subscriber(event)
+                await self._replay_history(session_id, conversation)
 
             return response
 
@@ -488,7 +646,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
         """
         try:
             # Get or create conversation (preserves state like pause/confirmation)
-            conversation = await self._get_or_create_conversation(session_id=session_id)
+            conversation = await self._get_session(session_id)
 
             # Convert ACP prompt format to OpenHands message content
             message_content = convert_acp_prompt_to_message_content(prompt)
@@ -534,15 +692,27 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
                     conversation=conversation,
                     conn=self._conn,
                     session_id=session_id,
+                    run_in_thread=functools.partial(
+                        self._session_scheduler.run, session_id
+                    ),
                 )
             )
 
             self._running_tasks[session_id] = run_task
             try:
                 await run_task
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise
+                # The run itself was cancelled (e.g. while queued for a slot)
+                return PromptResponse(stop_reason="cancelled")
             finally:
                 self._running_tasks.pop(session_id, None)
+                # Idle time counts from the end of the turn
+                self._touch_session(session_id)
 
+            await self._flush_session_updates(session_id)
             return PromptResponse(stop_reason="end_turn")
 
         except RequestError:
@@ -585,7 +755,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
                 )
 
             # Get or create conversation (loads from disk if not in cache)
-            conversation = await self._get_or_create_conversation(session_id=session_id)
+            conversation = await self._get_session(session_id)
 
             # Check if there's actually any history to load
             if not conversation.state.events:
@@ -600,9 +770,7 @@ class BaseOpenHandsACPAgent(ACPAgent, ABC):
                 f"Streaming {len(conversation.state.events)} events from "
                 f"conversation history"
             )
-            subscriber = EventSubscriber(session_id, self._conn)
-            for event in conversation.state.events:
-                await subscriber(event)
+            await self._replay_history(session_id, conversation)
 
             logger.info(f"Successfully loaded session {session_id}")
 
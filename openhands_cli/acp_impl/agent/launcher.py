@@ -8,6 +8,7 @@ from openhands_cli.acp_impl.agent.remote_agent import (
     OpenHandsCloudACPAgent,
 )
 from openhands_cli.acp_impl.confirmation import ConfirmationMode
+from openhands_cli.acp_impl.session_scheduler import DEFAULT_MAX_CONCURRENT_SESSIONS
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,9 @@ async def run_acp_server(
     streaming_enabled: bool = False,
     cloud: bool = False,
     cloud_api_url: str = "https://app.all-hands.dev",
+    replay_turns: int | None = None,
+    max_concurrent_sessions: int = DEFAULT_MAX_CONCURRENT_SESSIONS,
+    prewarm_sessions: bool = False,
 ) -> None:
     """Run the OpenHands ACP server.
 
@@ -27,6 +31,15 @@ async def run_acp_server(
         resume_conversation_id: Optional conversation ID to resume when a new
             session is created
         streaming_enabled: Whether to enable token streaming for LLM outputs
+            (local agent only)
+        cloud: Whether to use the OpenHands Cloud workspace
+        cloud_api_url: OpenHands Cloud API URL
+        replay_turns: Only replay the last N turns of history when a session is
+            loaded or resumed
+        max_concurrent_sessions: Maximum number of sessions whose conversations
+            run at the same time (local agent only)
+        prewarm_sessions: Build the next session's conversation in the
+            background (local agent only)
     """
     logger.info(
         f"Starting OpenHands ACP server with confirmation mode: "
@@ -46,6 +59,9 @@ async def run_acp_server(
                 initial_confirmation_mode,
                 resume_conversation_id,
                 streaming_enabled,
+                replay_turns=replay_turns,
+                max_concurrent_sessions=max_concurrent_sessions,
+                prewarm_sessions=prewarm_sessions,
             )
 
         AgentSideConnection(create_local_agent, writer, reader)
@@ -58,6 +74,7 @@ async def run_acp_server(
                 initial_confirmation_mode=initial_confirmation_mode,
                 cloud_api_url=cloud_api_url,
                 resume_conversation_id=resume_conversation_id,
+                replay_turns=replay_turns,
             )
 
         AgentSideConnection(create_agent, writer, reader)
@@ -2,11 +2,13 @@
 
 import asyncio
 import logging
+import shutil
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
 from acp import Client, NewSessionResponse, RequestError
+from acp.schema import ListSessionsResponse, SessionInfo
 
 from openhands.sdk import (
     BaseConversation,
@@ -18,20 +20,32 @@ from openhands.sdk import (
 from openhands.sdk.hooks import HookConfig
 from openhands_cli.acp_impl.agent.base_agent import BaseOpenHandsACPAgent
 from openhands_cli.acp_impl.agent.util import AgentType
+from openhands_cli.acp_impl.agent.warm_pool import ConversationWarmPool
 from openhands_cli.acp_impl.confirmation import ConfirmationMode
 from openhands_cli.acp_impl.events.event import EventSubscriber
 from openhands_cli.acp_impl.events.token_streamer import TokenBasedEventSubscriber
+from openhands_cli.acp_impl.session_scheduler import DEFAULT_MAX_CONCURRENT_SESSIONS
 from openhands_cli.acp_impl.slash_commands import (
     apply_confirmation_mode_to_conversation,
 )
-from openhands_cli.acp_impl.utils import RESOURCE_SKILL
+from openhands_cli.acp_impl.utils import (
+    RESOURCE_SKILL,
+    convert_acp_mcp_servers_to_agent_format,
+)
+from openhands_cli.conversations.store.index import IndexEntry
+from openhands_cli.conversations.store.local import LocalFileStore
+from openhands_cli.conversations.store.packed import unpack_conversation
 from openhands_cli.locations import MCP_CONFIG_FILE, get_conversations_dir, get_work_dir
+from openhands_cli.mcp.mcp_pool import install_shared_mcp_pool
 from openhands_cli.mcp.mcp_utils import MCPConfigurationError
 from openhands_cli.setup import MissingAgentSpec, load_agent_specs
 
 
 logger = logging.getLogger(__name__)
 
+# Number of sessions returned per list_sessions page.
+LIST_SESSIONS_PAGE_SIZE = 50
+
 
 class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
     """OpenHands Local ACP Agent that uses local workspace."""
@@ -42,6 +56,9 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         initial_confirmation_mode: ConfirmationMode,
         resume_conversation_id: str | None = None,
         streaming_enabled: bool = False,
+        replay_turns: int | None = None,
+        max_concurrent_sessions: int = DEFAULT_MAX_CONCURRENT_SESSIONS,
+        prewarm_sessions: bool = False,
     ):
         """Initialize the local ACP agent.
 
@@ -50,9 +67,31 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
             initial_confirmation_mode: Default confirmation mode for new sessions
             resume_conversation_id: Optional conversation ID to resume
             streaming_enabled: Whether to enable token streaming for LLM outputs
+            replay_turns: Only replay the last N turns when loading or resuming
+            max_concurrent_sessions: Maximum number of sessions whose
+                conversations run at the same time
+            prewarm_sessions: Build the conversation for the next new session
+                in the background, so that new_session returns immediately
         """
-        super().__init__(conn, initial_confirmation_mode, resume_conversation_id)
+        super().__init__(
+            conn,
+            initial_confirmation_mode,
+            resume_conversation_id,
+            replay_turns=replay_turns,
+            max_concurrent_sessions=max_concurrent_sessions,
+        )
         self._streaming_enabled: bool = streaming_enabled
+        self._token_subscribers: dict[str, TokenBasedEventSubscriber] = {}
+        # Created on first use: it registers the tools needed to read events.
+        self._conversation_store: LocalFileStore | None = None
+        self._warm_pool: ConversationWarmPool | None = None
+        # Sessions reuse each other's MCP server connections
+        install_shared_mcp_pool()
+        if prewarm_sessions:
+            self._warm_pool = ConversationWarmPool(
+                build=self._build_warm_conversation,
+                discard=self._discard_warm_conversation,
+            )
 
         logger.info(
             f"OpenHands Local ACP Agent initialized with confirmation mode: "
@@ -75,9 +114,53 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         except MissingAgentSpec:
             return False
 
+    async def list_sessions(
+        self,
+        cursor: str | None = None,
+        cwd: str | None = None,
+        **_kwargs: Any,
+    ) -> ListSessionsResponse:
+        """List locally persisted sessions, latest first.
+
+        Pages are served from the conversation index, so listing does not
+        re-read conversation directories.
+        """
+        logger.info(f"List sessions requested (cursor: {cursor}, cwd: {cwd})")
+        if self._conversation_store is None:
+            self._conversation_store = LocalFileStore(get_conversations_dir())
+
+        try:
+            entries, next_cursor = await asyncio.to_thread(
+                self._conversation_store.list_page,
+                cursor=cursor,
+                limit=LIST_SESSIONS_PAGE_SIZE,
+                working_dir=cwd,
+            )
+        except ValueError as e:
+            raise RequestError.invalid_params({"reason": str(e), "cursor": cursor})
+
+        sessions = [
+            info for entry in entries if (info := _to_session_info(entry)) is not None
+        ]
+        return ListSessionsResponse(sessions=sessions, next_cursor=next_cursor)
+
     def _cleanup_session(self, session_id: str) -> None:
-        """Clean up resources for a session (no-op for local agent)."""
-        pass
+        """Clean up resources for a session."""
+        self._token_subscribers.pop(session_id, None)
+        self._session_scheduler.forget(session_id)
+
+        conversation = self._active_sessions.pop(session_id, None)
+        if conversation:
+            try:
+                conversation.close()
+            except Exception as e:
+                logger.warning(f"Error closing conversation for {session_id}: {e}")
+
+    async def _flush_session_updates(self, session_id: str) -> None:
+        """Send streamed updates still buffered by the session's subscriber."""
+        token_subscriber = self._token_subscribers.get(session_id)
+        if token_subscriber is not None:
+            await token_subscriber.flush_updates()
 
     async def _get_or_create_conversation(
         self,
@@ -105,13 +188,67 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         self._active_sessions[session_id] = conversation
         return conversation
 
+    async def _allocate_session_id(
+        self,
+        working_dir: str | None,
+        mcp_servers: dict[str, dict[str, Any]] | None,
+    ) -> str:
+        """Hand out the pre-warmed conversation if it matches the request."""
+        if self._warm_pool is not None:
+            warm = await self._warm_pool.take(working_dir, mcp_servers)
+            if warm is not None:
+                session_id, conversation = warm
+                self._active_sessions[session_id] = conversation
+                return session_id
+        return await super()._allocate_session_id(working_dir, mcp_servers)
+
+    def _build_warm_conversation(
+        self,
+        session_id: str,
+        working_dir: str | None,
+        mcp_servers: dict[str, dict[str, Any]] | None,
+        loop: asyncio.AbstractEventLoop,
+    ) -> LocalConversation:
+        """Build a conversation ahead of time. Runs in a worker thread."""
+        conversation = self._setup_conversation(
+            session_id=session_id,
+            working_dir=working_dir,
+            mcp_servers=mcp_servers,
+            loop=loop,
+        )
+        apply_confirmation_mode_to_conversation(
+            conversation, self._initial_confirmation_mode, session_id
+        )
+        return conversation
+
+    def _discard_warm_conversation(
+        self, session_id: str, conversation: BaseConversation
+    ) -> None:
+        """Close an unused pre-warmed conversation and remove its directory."""
+        self._token_subscribers.pop(session_id, None)
+        try:
+            conversation.close()
+        except Exception as e:
+            logger.warning(f"Error closing pre-warmed conversation: {e}")
+
+        # It never received a message, so there is nothing worth keeping.
+        conversation_dir = Path(get_conversations_dir()) / UUID(session_id).hex
+        events_dir = conversation_dir / "events"
+        if not events_dir.exists() or not any(events_dir.iterdir()):
+            shutil.rmtree(conversation_dir, ignore_errors=True)
+
     def _setup_conversation(
         self,
         session_id: str,
         working_dir: str | None = None,
         mcp_servers: dict[str, dict[str, Any]] | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
     ) -> LocalConversation:
-        """Set up a local conversation with event streaming support."""
+        """Set up a local conversation with event streaming support.
+
+        `loop` is the event loop that receives the conversation's events; it
+        defaults to the current one and must be given from worker threads.
+        """
         try:
             agent = load_agent_specs(
                 conversation_id=session_id,
@@ -156,7 +293,8 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
             )
 
         workspace = Workspace(working_dir=str(working_path))
-        loop = asyncio.get_event_loop()
+        if loop is None:
+            loop = asyncio.get_event_loop()
 
         subscriber = EventSubscriber(session_id, self._conn)
         token_subscriber = TokenBasedEventSubscriber(
@@ -176,6 +314,9 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         if not hook_config.is_empty():
             logger.info("Hooks loaded from hooks.json")
 
+        # The SDK only reads loose event files, so expand compacted conversations
+        unpack_conversation(Path(get_conversations_dir()) / UUID(session_id).hex)
+
         conversation = Conversation(
             agent=agent,
             workspace=workspace,
@@ -189,6 +330,8 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
 
         subscriber.conversation = conversation
         token_subscriber.conversation = conversation
+        if streaming_enabled:
+            self._token_subscribers[session_id] = token_subscriber
 
         return conversation
 
@@ -210,9 +353,36 @@ class LocalOpenHandsACPAgent(BaseOpenHandsACPAgent):
         effective_working_dir = working_dir or cwd or str(Path.cwd())
         logger.info(f"Using working directory: {effective_working_dir}")
 
-        return await super().new_session(
+        response = await super().new_session(
             cwd=cwd,
             mcp_servers=mcp_servers,
             working_dir=effective_working_dir,
             **_kwargs,
         )
+
+        if self._warm_pool is not None:
+            # The next session most likely uses the same directory and servers.
+            self._warm_pool.prepare(
+                effective_working_dir,
+                convert_acp_mcp_servers_to_agent_format(mcp_servers)
+                if mcp_servers
+                else None,
+            )
+        return response
+
+
+def _to_session_info(entry: IndexEntry) -> SessionInfo | None:
+    """Convert an index entry to an ACP session, or None if it isn't one."""
+    try:
+        # Conversations are stored under the hex form of the session ID.
+        session_id = str(UUID(entry.id))
+    except ValueError:
+        return None
+
+    updated_at = entry.last_modified or entry.created_at
+    return SessionInfo(
+        session_id=session_id,
+        cwd=entry.working_dir or get_work_dir(),
+        title=entry.title,
+        updated_at=updated_at.isoformat() if updated_at else None,
+    )
@@ -43,6 +43,7 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
         initial_confirmation_mode: ConfirmationMode,
         cloud_api_url: str = "https://app.all-hands.dev",
         resume_conversation_id: str | None = None,
+        replay_turns: int | None = None,
     ):
         """Initialize the cloud ACP agent.
 
@@ -51,9 +52,14 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
             initial_confirmation_mode: Default confirmation mode for new sessions
             cloud_api_url: OpenHands Cloud API URL
             resume_conversation_id: Optional conversation ID to resume
+            replay_turns: Only replay the last N turns when loading a session
         """
         super().__init__(
-            conn, initial_confirmation_mode, resume_conversation_id, cloud_api_url
+            conn,
+            initial_confirmation_mode,
+            resume_conversation_id,
+            cloud_api_url,
+            replay_turns=replay_turns,
         )
 
         self._active_workspaces: dict[str, OpenHandsCloudWorkspace] = {}
@@ -278,6 +284,10 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
 
         Overrides base class to handle workspace resuming when workspace is not alive.
         """
+        # Evicted sessions are resumed by the base class
+        if session_id in self._evicted_sessions:
+            return await super().prompt(prompt, session_id, **_kwargs)
+
         # Check if workspace needs to be resumed
         workspace = self._active_workspaces.get(session_id)
         if not workspace:
@@ -314,18 +324,19 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
                     {"reason": "Invalid session ID format", "sessionId": session_id}
                 )
 
-            # For cloud mode, we can only load sessions that are already in memory
-            if session_id in self._active_sessions:
-                conversation = self._active_sessions[session_id]
+            # For cloud mode, we can only load sessions created by this agent
+            if (
+                session_id in self._active_sessions
+                or session_id in self._evicted_sessions
+            ):
+                conversation = await self._get_session(session_id)
 
                 if conversation.state.events:
                     logger.info(
                         f"Streaming {len(conversation.state.events)} events from "
                         f"conversation history"
                     )
-                    subscriber = EventSubscriber(session_id, self._conn)
-                    for event in conversation.state.events:
-                        await subscriber(event)
+                    await self._replay_history(session_id, conversation)
 
                 current_mode = get_confirmation_mode_from_conversation(conversation)
                 return LoadSessionResponse(modes=get_session_mode_state(current_mode))
@@ -353,6 +364,9 @@ class OpenHandsCloudACPAgent(BaseOpenHandsACPAgent):
         """Close a session and clean up resources."""
         logger.info(f"Closing cloud session: {session_id}")
         self._cleanup_session(session_id)
+        self._evicted_sessions.pop(session_id, None)
+        self._session_setups.pop(session_id, None)
+        self._eviction_policy.discard(session_id)
 
     def __del__(self) -> None:
         """Clean up all active workspaces on agent destruction."""
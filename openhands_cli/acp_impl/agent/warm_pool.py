@@ -0,0 +1,175 @@
+"""Pre-built conversations for fast ACP `new_session` responses.
+
+Setting up a conversation loads and validates the agent spec, project skills,
+MCP and hook configuration, and creates the workspace and SDK conversation.
+That work dominates the time between opening a new chat in the client and
+being able to prompt.
+
+`ConversationWarmPool` keeps one conversation built ahead of time in a worker
+thread, under a reserved session ID. It is handed out to the next
+`new_session` only if that session asks for the same working directory and
+MCP servers and none of the configuration files the setup reads from changed
+since it was built; otherwise it is discarded and the session is set up from
+scratch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from openhands.sdk import BaseConversation
+from openhands_cli.locations import (
+    AGENT_SETTINGS_PATH,
+    MCP_CONFIG_FILE,
+    get_persistence_dir,
+    get_work_dir,
+)
+from openhands_cli.stores.cli_settings import CliSettings
+
+
+logger = logging.getLogger(__name__)
+
+WarmBuild = Callable[
+    [str, str | None, dict[str, dict[str, Any]] | None, asyncio.AbstractEventLoop],
+    BaseConversation,
+]
+WarmDiscard = Callable[[str, BaseConversation], None]
+
+
+def setup_fingerprint(working_dir: str | None) -> tuple[int, ...]:
+    """Return the mtimes of the files a conversation setup is read from.
+
+    Missing files count as 0, so creating one also changes the fingerprint.
+    Project skills are covered by the mtimes of their directories.
+    """
+    persistence_dir = Path(get_persistence_dir())
+    project_dir = Path(get_work_dir()) / ".openhands"
+    paths = [
+        persistence_dir / AGENT_SETTINGS_PATH,
+        persistence_dir / MCP_CONFIG_FILE,
+        CliSettings.get_config_path(),
+        Path(os.path.expanduser("~/.openhands/hooks.json")),
+        project_dir,
+        project_dir / "skills",
+        project_dir / "microagents",
+    ]
+    if working_dir is not None:
+        paths.append(Path(working_dir) / ".openhands" / "hooks.json")
+
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return tuple(mtimes)
+
+
+def _warm_key(
+    working_dir: str | None, mcp_servers: dict[str, dict[str, Any]] | None
+) -> tuple[Any, ...]:
+    return (
+        working_dir,
+        json.dumps(mcp_servers, sort_keys=True, default=str),
+        setup_fingerprint(working_dir),
+    )
+
+
+@dataclass
+class _WarmEntry:
+    key: tuple[Any, ...]
+    session_id: str
+    future: asyncio.Future[BaseConversation]
+
+
+class ConversationWarmPool:
+    """Holds at most one conversation built ahead of the next `new_session`."""
+
+    def __init__(self, build: WarmBuild, discard: WarmDiscard):
+        """Initialize the warm pool.
+
+        Args:
+            build: Builds a conversation for (session ID, working dir, MCP
+                servers, event loop). Runs in a worker thread.
+            discard: Releases a built conversation that won't be used. Runs in
+                a worker thread.
+        """
+        self._build = build
+        self._discard = discard
+        self._entry: _WarmEntry | None = None
+
+    def prepare(
+        self,
+        working_dir: str | None,
+        mcp_servers: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """Start building a conversation for the next matching `new_session`."""
+        key = _warm_key(working_dir, mcp_servers)
+        if self._entry is not None:
+            if self._entry.key == key:
+                return
+            self._drop(self._entry)
+
+        loop = asyncio.get_running_loop()
+        session_id = str(uuid.uuid4())
+        future = asyncio.ensure_future(
+            asyncio.to_thread(self._build, session_id, working_dir, mcp_servers, loop)
+        )
+        self._entry = _WarmEntry(key, session_id, future)
+        logger.debug(f"Pre-warming conversation {session_id} for {working_dir}")
+
+    async def take(
+        self,
+        working_dir: str | None,
+        mcp_servers: dict[str, dict[str, Any]] | None = None,
+    ) -> tuple[str, BaseConversation] | None:
+        """Return the pre-built (session ID, conversation) if it matches.
+
+        Waits for the build to finish if it is still running. Returns None if
+        nothing matching is available.
+        """
+        entry, self._entry = self._entry, None
+        if entry is None:
+            return None
+        if entry.key != _warm_key(working_dir, mcp_servers):
+            logger.debug("Pre-warmed conversation is stale, discarding it")
+            self._drop(entry)
+            return None
+
+        try:
+            conversation = await asyncio.shield(entry.future)
+        except asyncio.CancelledError:
+            self._drop(entry)
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to pre-warm conversation: {e}")
+            return None
+
+        logger.info(f"Using pre-warmed conversation {entry.session_id}")
+        return entry.session_id, conversation
+
+    def close(self) -> None:
+        """Discard the pre-built conversation, if any."""
+        if self._entry is not None:
+            self._drop(self._entry)
+            self._entry = None
+
+    def _drop(self, entry: _WarmEntry) -> None:
+        def discard(future: asyncio.Future[BaseConversation]) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            conversation = future.result()
+            asyncio.get_running_loop().run_in_executor(
+                None, self._discard, entry.session_id, conversation
+            )
+
+        # Discard once built; the worker thread itself can't be interrupted.
+        entry.future.add_done_callback(discard)
@@ -0,0 +1,147 @@
+"""Bulk replay of conversation history as ACP session updates.
+
+Loading or resuming a session sends the whole conversation history to the
+client. Converting and sending one event at a time keeps the event loop busy
+with serialization for the whole replay, so instead events are converted to
+ACP updates in a worker thread, one batch at a time, while the previous batch
+is being sent. Metrics metadata is computed once for the whole replay.
+
+With `last_turns`, only the last N user turns are replayed, preceded by a
+short note saying how much history was skipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any, cast
+
+from acp import Client, update_agent_thought_text
+
+from openhands.sdk import BaseConversation, get_logger
+from openhands.sdk.event import Event, MessageEvent
+from openhands_cli.acp_impl.events.event import EventSubscriber
+from openhands_cli.acp_impl.events.update_scheduler import ACPUpdate
+from openhands_cli.acp_impl.events.utils import get_metadata
+
+
+# Number of events converted per worker-thread batch.
+REPLAY_BATCH_SIZE = 100
+
+
+logger = get_logger(__name__)
+
+
+class _RecordingClient:
+    """Connection stand-in that records session updates instead of sending them."""
+
+    def __init__(self) -> None:
+        self.updates: list[ACPUpdate] = []
+
+    async def session_update(
+        self, session_id: str, update: ACPUpdate, **_kwargs: Any
+    ) -> None:
+        del session_id  # Updates are resent under the caller's session
+        self.updates.append(update)
+
+
+def _convert_events(
+    session_id: str, events: Sequence[Event], start: int, end: int
+) -> list[ACPUpdate]:
+    """Convert `events[start:end]` to ACP updates. Runs in a worker thread."""
+    recorder = _RecordingClient()
+    # No conversation: metrics are attached once by the caller instead.
+    subscriber = EventSubscriber(session_id, cast(Client, recorder))
+
+    async def _run() -> None:
+        for index in range(start, end):
+            await subscriber(events[index])
+
+    asyncio.run(_run())
+    return recorder.updates
+
+
+def find_tail_start(events: Sequence[Event], turns: int) -> int:
+    """Return the index of the first event of the last `turns` user turns."""
+    seen = 0
+    for index in range(len(events) - 1, -1, -1):
+        event = events[index]
+        if isinstance(event, MessageEvent) and event.source == "user":
+            seen += 1
+            if seen >= turns:
+                return index
+    return 0
+
+
+async def replay_history(
+    session_id: str,
+    conn: Client,
+    events: Sequence[Event],
+    conversation: BaseConversation | None = None,
+    *,
+    last_turns: int | None = None,
+    batch_size: int = REPLAY_BATCH_SIZE,
+) -> int:
+    """Send conversation history to the client.
+
+    Args:
+        session_id: The ACP session ID
+        conn: The ACP connection for sending notifications
+        events: The conversation events, oldest first
+        conversation: Conversation to read metrics from, if any
+        last_turns: Only replay the last N user turns
+        batch_size: Number of events converted per worker-thread batch
+
+    Returns:
+        The number of session updates sent.
+    """
+    total = len(events)
+    start = 0
+    if last_turns is not None and last_turns > 0:
+        start = find_tail_start(events, last_turns)
+
+    field_meta = get_metadata(conversation)
+    held: ACPUpdate | None = None
+    sent = 0
+
+    async def send(update: ACPUpdate, meta: Any = None) -> None:
+        nonlocal sent
+        await conn.session_update(session_id=session_id, update=update, field_meta=meta)
+        sent += 1
+
+    if start:
+        held = update_agent_thought_text(
+            f"{start} earlier event(s) not shown; replaying the last "
+            f"{last_turns} turn(s) of this conversation.\n"
+        )
+
+    def convert(batch_start: int) -> asyncio.Future[list[ACPUpdate]]:
+        batch_end = min(batch_start + batch_size, total)
+        return asyncio.ensure_future(
+            asyncio.to_thread(
+                _convert_events, session_id, events, batch_start, batch_end
+            )
+        )
+
+    next_batch = convert(start) if start < total else None
+    try:
+        batch_start = start
+        while next_batch is not None:
+            updates = await next_batch
+            batch_start += batch_size
+            # Convert the next batch while this one is being sent.
+            next_batch = convert(batch_start) if batch_start < total else None
+            for update in updates:
+                if held is not None:
+                    await send(held)
+                held = update
+    finally:
+        if next_batch is not None:
+            next_batch.cancel()
+
+    # The metrics metadata goes with the last update of the replay.
+    if held is not None:
+        await send(held, field_meta)
+
+    logger.debug(f"Replayed {total - start} event(s) as {sent} update(s)")
+    return sent
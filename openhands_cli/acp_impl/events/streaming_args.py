@@ -0,0 +1,310 @@
+"""Incremental parser for streamed tool-call arguments.
+
+Tool-call arguments arrive as a JSON object split into arbitrary chunks.
+Re-completing and re-parsing the whole accumulated buffer on every chunk is
+quadratic in the argument size, which hurts for large payloads such as a
+`file_editor` create with a big file body.
+
+`StreamingArgsParser` consumes each chunk exactly once. Top-level string values
+(the large ones: file contents, commands, thoughts) are decoded as they arrive
+and kept as a list of pieces; other values (arrays, objects, numbers, literals)
+are buffered until complete and only best-effort completed when asked for.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+from streamingjson import Lexer
+
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_RAW_SPECIAL = re.compile(r'["\\{}\[\],]')
+_LOW_SURROGATE = re.compile(r"\\u[dD][c-fC-F][0-9a-fA-F]{2}")
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+# Parser states
+_BEFORE_OBJECT = 0
+_EXPECT_KEY = 1
+_IN_KEY = 2
+_AFTER_KEY = 3
+_EXPECT_VALUE = 4
+_IN_STRING = 5
+_IN_RAW = 6
+_DONE = 7
+_FAILED = 8
+
+
+class _TextValue:
+    """A top-level string value, decoded incrementally."""
+
+    def __init__(self) -> None:
+        self.pieces: list[str] = []
+        self.length = 0
+
+    def append(self, piece: str) -> None:
+        if piece:
+            self.pieces.append(piece)
+            self.length += len(piece)
+
+    def text(self) -> str:
+        if len(self.pieces) > 1:
+            self.pieces[:] = ["".join(self.pieces)]
+        return self.pieces[0] if self.pieces else ""
+
+    def since(self, offset: int) -> str:
+        """Return the text after `offset`, touching only the trailing pieces."""
+        remaining = self.length - offset
+        tail: list[str] = []
+        for piece in reversed(self.pieces):
+            if remaining <= 0:
+                break
+            tail.append(piece[-remaining:] if len(piece) > remaining else piece)
+            remaining -= len(piece)
+        return "".join(reversed(tail))
+
+
+class _RawValue:
+    """A top-level non-string value, buffered until it is complete."""
+
+    def __init__(self) -> None:
+        self.lexer = Lexer()
+        self.parts: list[str] = []
+        self.length = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.done = False
+        self._value: Any = None
+        self._completed_length = -1
+
+    def append(self, part: str) -> None:
+        if part:
+            self.parts.append(part)
+            self.length += len(part)
+            self.lexer.append_string(part)
+
+    def finish(self) -> None:
+        self.done = True
+        try:
+            self._value = json.loads("".join(self.parts))
+        except ValueError:
+            self._complete()
+
+    def value(self) -> Any:
+        if not self.done and self._completed_length != self.length:
+            self._complete()
+        return self._value
+
+    def _complete(self) -> None:
+        try:
+            self._value = json.loads(self.lexer.complete_json())
+        except ValueError:
+            self._value = None
+        self._completed_length = self.length
+
+
+class StreamingArgsParser:
+    """Incrementally parse a streamed JSON object of tool-call arguments.
+
+    Keys are only exposed once complete. If the arguments turn out not to be
+    a JSON object, the parser stops and exposes no values.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, _TextValue | _RawValue] = {}
+        self._state = _BEFORE_OBJECT
+        self._pending = ""
+        self._key_parts: list[str] = []
+        self._key = ""
+        self._current: _TextValue | _RawValue | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._values
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk of the arguments string."""
+        text = self._pending + chunk
+        self._pending = ""
+        pos = 0
+        end = len(text)
+        while pos < end and self._state not in (_DONE, _FAILED):
+            state = self._state
+            if state in (_IN_KEY, _IN_STRING):
+                pos = self._read_string(text, pos)
+                continue
+            if state == _IN_RAW:
+                pos = self._read_raw(text, pos)
+                continue
+
+            char = text[pos]
+            if char.isspace():
+                pos += 1
+                continue
+            if state == _BEFORE_OBJECT:
+                self._state = _EXPECT_KEY if char == "{" else _FAILED
+            elif state == _EXPECT_KEY:
+                if char == '"':
+                    self._key_parts = []
+                    self._state = _IN_KEY
+                elif char == "}":
+                    self._state = _DONE
+                elif char != ",":
+                    self._state = _FAILED
+            elif state == _AFTER_KEY:
+                self._state = _EXPECT_VALUE if char == ":" else _FAILED
+            elif state == _EXPECT_VALUE:
+                if char == '"':
+                    self._current = _TextValue()
+                    self._state = _IN_STRING
+                else:
+                    # The first character belongs to the value itself.
+                    self._current = _RawValue()
+                    self._state = _IN_RAW
+                    self._values[self._key] = self._current
+                    continue
+                self._values[self._key] = self._current
+            pos += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the (possibly partial) value of `key`."""
+        value = self._values.get(key)
+        if value is None:
+            return default
+        if isinstance(value, _TextValue):
+            return value.text()
+        result = value.value()
+        return default if result is None else result
+
+    def text_length(self, key: str) -> int:
+        """Return the decoded length of a string value, or 0 if absent."""
+        value = self._values.get(key)
+        return value.length if isinstance(value, _TextValue) else 0
+
+    def text_since(self, key: str, offset: int) -> str:
+        """Return the part of a string value decoded after `offset`."""
+        value = self._values.get(key)
+        return value.since(offset) if isinstance(value, _TextValue) else ""
+
+    def has_content(self) -> bool:
+        """Whether any value is non-null and not an empty string."""
+        for value in self._values.values():
+            if isinstance(value, _TextValue):
+                if value.length:
+                    return True
+            elif value.value() is not None:
+                return True
+        return False
+
+    def _read_string(self, text: str, pos: int) -> int:
+        if self._state == _IN_KEY:
+            append = self._key_parts.append
+        else:
+            assert isinstance(self._current, _TextValue)
+            append = self._current.append
+
+        while True:
+            match = _STRING_SPECIAL.search(text, pos)
+            if match is None:
+                append(text[pos:])
+                return len(text)
+            index = match.start()
+            if index > pos:
+                append(text[pos:index])
+            if text[index] == '"':
+                if self._state == _IN_KEY:
+                    self._key = "".join(self._key_parts)
+                    self._state = _AFTER_KEY
+                else:
+                    self._state = _EXPECT_KEY
+                return index + 1
+            decoded, pos = _decode_escape(text, index)
+            if decoded is None:
+                # Incomplete escape sequence; wait for the next chunk.
+                self._pending = text[index:]
+                return len(text)
+            append(decoded)
+
+    def _read_raw(self, text: str, pos: int) -> int:
+        value = self._current
+        assert isinstance(value, _RawValue)
+        start = pos
+        end = len(text)
+        if value.escaped:
+            value.escaped = False
+            pos += 1
+
+        while pos < end:
+            match = _RAW_SPECIAL.search(text, pos)
+            if match is None:
+                break
+            index = match.start()
+            char = text[index]
+            pos = index + 1
+            if value.in_string:
+                if char == "\\":
+                    pos += 1
+                    if pos > end:
+                        value.escaped = True
+                        pos = end
+                elif char == '"':
+                    value.in_string = False
+            elif char == '"':
+                value.in_string = True
+            elif char in "{[":
+                value.depth += 1
+            elif value.depth:
+                if char in "}]":
+                    value.depth -= 1
+            elif char in "},":
+                # End of the value; the delimiter is handled as a key separator.
+                value.append(text[start:index])
+                value.finish()
+                self._state = _EXPECT_KEY
+                return index
+
+        value.append(text[start:end])
+        return end
+
+
+def _decode_escape(text: str, index: int) -> tuple[str | None, int]:
+    """Decode the escape sequence at `text[index]`.
+
+    Returns (None, index) if the sequence is cut off by the end of the chunk.
+    """
+    if index + 1 >= len(text):
+        return None, index
+    char = text[index + 1]
+    if char != "u":
+        return _ESCAPES.get(char, char), index + 2
+
+    digits = text[index + 2 : index + 6]
+    if len(digits) < 4:
+        return None, index
+    try:
+        code = int(digits, 16)
+    except ValueError:
+        return digits, index + 6
+
+    if 0xD800 <= code < 0xDC00:
+        # A high surrogate may be followed by its low half in the next chunk.
+        tail = text[index + 6 : index + 12]
+        if len(tail) < 6 and "\\u".startswith(tail[:2]):
+            return None, index
+        if _LOW_SURROGATE.match(tail):
+            low = int(tail[2:], 16)
+            combined = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+            return chr(combined), index + 12
+    return chr(code), index + 6
@@ -11,6 +11,8 @@ Refactor: split token streaming into a dedicated class.
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Callable
 
 from acp import (
     Client,
@@ -19,13 +21,6 @@ from acp import (
     update_agent_thought_text,
     update_tool_call,
 )
-from acp.schema import (
-    AgentMessageChunk,
-    AgentPlanUpdate,
-    AgentThoughtChunk,
-    ToolCallProgress,
-    ToolCallStart,
-)
 
 from openhands.sdk import BaseConversation, Event, get_logger
 from openhands.sdk.event import (
@@ -45,23 +40,26 @@ from openhands_cli.acp_impl.events.shared_event_handler import (
     SharedEventHandler,
 )
 from openhands_cli.acp_impl.events.tool_state import ToolCallState
+from openhands_cli.acp_impl.events.update_scheduler import (
+    UPDATE_FLUSH_CHARS,
+    UPDATE_FLUSH_INTERVAL,
+    UPDATE_MAX_PENDING,
+    ACPUpdate,
+    SessionUpdateScheduler,
+)
 from openhands_cli.acp_impl.events.utils import (
     format_content_blocks,
     get_metadata,
 )
 
 
-ACPUpdate = (
-    AgentMessageChunk
-    | AgentThoughtChunk
-    | ToolCallStart
-    | ToolCallProgress
-    | AgentPlanUpdate
-)
-
-
 logger = get_logger(__name__)
 
+# Minimum delay between two argument snapshots sent for a streaming tool call.
+# Each snapshot carries the full arguments, so sending one per chunk would be
+# quadratic in the argument size.
+TOOL_CALL_UPDATE_INTERVAL = 0.1
+
 
 class TokenBasedEventSubscriber:
     """Owns all token streaming logic + state (tool-call streaming included)."""
@@ -73,11 +71,25 @@ class TokenBasedEventSubscriber:
         conn: Client,
         loop: asyncio.AbstractEventLoop,
         conversation: BaseConversation | None = None,
+        flush_interval: float = UPDATE_FLUSH_INTERVAL,
+        flush_chars: int = UPDATE_FLUSH_CHARS,
+        max_pending: int = UPDATE_MAX_PENDING,
+        clock: Callable[[], float] = time.monotonic,
     ):
         self.session_id = session_id
         self.conn = conn
         self.loop = loop
         self.conversation = conversation
+        self._clock = clock
+        self._updates = SessionUpdateScheduler(
+            session_id=session_id,
+            conn=conn,
+            loop=loop,
+            get_metadata=lambda: get_metadata(self.conversation),
+            flush_interval=flush_interval,
+            flush_chars=flush_chars,
+            max_pending=max_pending,
+        )
 
         # index -> ToolCallState
         self._streaming_tool_calls: dict[int, ToolCallState] = {}
@@ -94,6 +106,10 @@ class TokenBasedEventSubscriber:
         """
         self._reasoning_header_emitted = False
 
+    async def flush_updates(self) -> None:
+        """Send any streamed updates that are still buffered."""
+        await self._updates.flush()
+
     def _prune_tool_call_state(self, tool_call_id: str) -> None:
         """Remove any ToolCallState entries matching the given tool_call_id.
 
@@ -147,6 +163,9 @@ class TokenBasedEventSubscriber:
         if isinstance(event, ConversationStateUpdateEvent):
             return
 
+        # Streamed deltas for this event must reach the client before it does
+        await self._updates.flush()
+
         # Reset header state for next streaming response
         self.reset_header_state()
 
@@ -224,19 +243,11 @@ class TokenBasedEventSubscriber:
     # -----------------------
 
     def _schedule_update(self, update: ACPUpdate) -> None:
-        """Schedule a session_update for an ACP update, thread-safe."""
+        """Queue a session_update for an ACP update, thread-safe.
 
-        async def _send() -> None:
-            await self.conn.session_update(
-                session_id=self.session_id,
-                update=update,
-                field_meta=get_metadata(self.conversation),
-            )
-
-        if self.loop.is_running():
-            asyncio.run_coroutine_threadsafe(_send(), self.loop)
-        else:
-            self.loop.run_until_complete(_send())
+        Updates are coalesced and sent in batches by the session's scheduler.
+        """
+        self._updates.submit(update)
 
     def _handle_tool_call_streaming(self, tool_call) -> None:
         if not tool_call:
@@ -297,13 +308,20 @@ class TokenBasedEventSubscriber:
             )
             self._schedule_update(tool_call_start)
 
-        if state.started and arguments_chunk:
-            self._schedule_update(
-                update_tool_call(
-                    tool_call_id=state.tool_call_id,
-                    title=state.title,
-                    kind=state.kind,
-                    status="in_progress",
-                    content=format_content_blocks(state.args),
-                ),
-            )
+        if not arguments_chunk:
+            return
+
+        # Throttle snapshots; the final arguments are sent with the ActionEvent.
+        now = self._clock()
+        if now - state.last_update_at < TOOL_CALL_UPDATE_INTERVAL:
+            return
+        state.last_update_at = now
+        self._schedule_update(
+            update_tool_call(
+                tool_call_id=state.tool_call_id,
+                title=state.title,
+                kind=state.kind,
+                status="in_progress",
+                content=format_content_blocks(state.args),
+            ),
+        )
@@ -0,0 +1,256 @@
+"""Coalescing, rate-limited scheduler for streamed ACP session updates.
+
+Token streaming produces one delta per LLM token. Sending each of them as its
+own `session/update` notification floods the client with tiny JSON-RPC
+messages, and attaching metrics metadata to each one aggregates the
+conversation stats on every token.
+
+`SessionUpdateScheduler` buffers updates submitted from the conversation
+thread and sends them from the event loop in batches:
+
+- consecutive `agent_message_chunk` / `agent_thought_chunk` text is merged,
+- repeated `tool_call_update`s for the same tool call collapse into one,
+- a batch is sent after `flush_interval` seconds or once `flush_chars`
+  characters of text are buffered, whichever comes first,
+- metrics metadata is computed once per batch and attached to its last update.
+
+The buffer is bounded to `max_pending` entries so that a slow client applies
+backpressure instead of letting updates pile up: when it is full, thought text
+is merged into the latest buffered thought (or dropped if there is none) and
+any other update blocks the submitting thread until a batch has been sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from acp import Client
+from acp.schema import (
+    AgentMessageChunk,
+    AgentPlanUpdate,
+    AgentThoughtChunk,
+    TextContentBlock,
+    ToolCallProgress,
+    ToolCallStart,
+)
+
+from openhands.sdk import get_logger
+
+
+ACPUpdate = (
+    AgentMessageChunk
+    | AgentThoughtChunk
+    | ToolCallStart
+    | ToolCallProgress
+    | AgentPlanUpdate
+)
+
+# Default batching window: at most ~20 notifications per second per session.
+UPDATE_FLUSH_INTERVAL = 0.05
+# Flush early once this many characters of streamed text are buffered.
+UPDATE_FLUSH_CHARS = 4096
+# Maximum number of buffered (already coalesced) updates per session.
+UPDATE_MAX_PENDING = 256
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _PendingUpdate:
+    update: ACPUpdate
+    # Text pieces of a mergeable message/thought chunk, None for other updates.
+    parts: list[str] | None = None
+
+    def build(self) -> ACPUpdate:
+        if self.parts is None or len(self.parts) == 1:
+            return self.update
+        assert isinstance(self.update, AgentMessageChunk | AgentThoughtChunk)
+        content = self.update.content.model_copy(update={"text": "".join(self.parts)})
+        return self.update.model_copy(update={"content": content})
+
+
+def _chunk_text(update: ACPUpdate) -> str | None:
+    """Return the text of a mergeable message/thought chunk, else None."""
+    if isinstance(update, AgentMessageChunk | AgentThoughtChunk) and isinstance(
+        update.content, TextContentBlock
+    ):
+        return update.content.text
+    return None
+
+
+def _merge_progress(
+    previous: ToolCallProgress, update: ToolCallProgress
+) -> ToolCallProgress:
+    """Overlay the fields set on `update` onto an earlier pending update."""
+    changes = {
+        name: value
+        for name in update.model_fields_set
+        if (value := getattr(update, name)) is not None
+    }
+    return previous.model_copy(update=changes)
+
+
+class SessionUpdateScheduler:
+    """Per-session outbound queue that batches streamed ACP updates.
+
+    `submit` is thread-safe and may be called from the conversation thread;
+    updates are always sent from `loop`, in submission order (apart from
+    collapsed tool call updates, which keep the position of the first one).
+    When the loop is not running, each update is sent synchronously.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_id: str,
+        conn: Client,
+        loop: asyncio.AbstractEventLoop,
+        get_metadata: Callable[[], dict[str, Any] | None] = lambda: None,
+        flush_interval: float = UPDATE_FLUSH_INTERVAL,
+        flush_chars: int = UPDATE_FLUSH_CHARS,
+        max_pending: int = UPDATE_MAX_PENDING,
+    ):
+        self.session_id = session_id
+        self.conn = conn
+        self.loop = loop
+        self.flush_interval = flush_interval
+        self.flush_chars = flush_chars
+        self.max_pending = max_pending
+        self._get_metadata = get_metadata
+
+        self._lock = threading.Lock()
+        # Signalled whenever a batch is taken out of the buffer.
+        self._space = threading.Condition(self._lock)
+        self._pending: list[_PendingUpdate] = []
+        self._pending_chars = 0
+        self._timer_armed = False
+        self._flush_requested = False
+        # Serializes batches so that two flushes can't interleave their sends.
+        self._send_lock = asyncio.Lock()
+
+    def submit(self, update: ACPUpdate) -> None:
+        """Queue an update for the next batch.
+
+        Blocks while the buffer is full, unless called from the event loop
+        itself (which would deadlock) or the update is thought text.
+        """
+        running = self.loop.is_running()
+        can_block = running and not self._on_loop_thread()
+        with self._space:
+            while not self._add(update, append=len(self._pending) < self.max_pending):
+                if isinstance(update, AgentThoughtChunk):
+                    logger.debug("Update buffer full, dropping streamed thought")
+                    break
+                if not can_block or not self.loop.is_running():
+                    self._add(update, append=True)
+                    break
+                if not self._flush_requested:
+                    self._flush_requested = True
+                    self._schedule_flush(0.0)
+                # Re-check periodically in case the loop stopped meanwhile.
+                self._space.wait(timeout=1.0)
+
+            if running:
+                self._arm_flush()
+
+        if not running:
+            self.loop.run_until_complete(self.flush())
+
+    async def flush(self) -> None:
+        """Send every buffered update now."""
+        async with self._send_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                self._pending_chars = 0
+                self._timer_armed = self._flush_requested = False
+                self._space.notify_all()
+            if not batch:
+                return
+
+            field_meta = self._get_metadata()
+            last = len(batch) - 1
+            for position, pending in enumerate(batch):
+                await self.conn.session_update(
+                    session_id=self.session_id,
+                    update=pending.build(),
+                    field_meta=field_meta if position == last else None,
+                )
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _arm_flush(self) -> None:
+        """Schedule a flush for the buffered updates if none is pending yet."""
+        if self._pending_chars >= self.flush_chars:
+            if not self._flush_requested:
+                self._flush_requested = True
+                self._schedule_flush(0.0)
+        elif not self._timer_armed:
+            self._timer_armed = True
+            self._schedule_flush(self.flush_interval)
+
+    def _schedule_flush(self, delay: float) -> None:
+        asyncio.run_coroutine_threadsafe(self._flush_after(delay), self.loop)
+
+    async def _flush_after(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning("Failed to send session updates: %s", e, exc_info=True)
+
+    def _add(self, update: ACPUpdate, append: bool) -> bool:
+        """Coalesce `update` into the buffer.
+
+        Returns False if it needs a new entry and `append` is False.
+        """
+        text = _chunk_text(update)
+        if text is not None:
+            target = self._pending[-1] if self._pending else None
+            if not append and isinstance(update, AgentThoughtChunk):
+                # Under pressure, thoughts merge into the latest buffered thought.
+                target = next(
+                    (
+                        pending
+                        for pending in reversed(self._pending)
+                        if pending.parts is not None
+                        and isinstance(pending.update, AgentThoughtChunk)
+                    ),
+                    None,
+                )
+            if (
+                target is not None
+                and target.parts is not None
+                and target.update.session_update == update.session_update
+            ):
+                target.parts.append(text)
+            elif append:
+                self._pending.append(_PendingUpdate(update, [text]))
+            else:
+                return False
+            self._pending_chars += len(text)
+            return True
+
+        if isinstance(update, ToolCallProgress):
+            for pending in reversed(self._pending):
+                previous = pending.update
+                if (
+                    isinstance(previous, ToolCallProgress)
+                    and previous.tool_call_id == update.tool_call_id
+                ):
+                    pending.update = _merge_progress(previous, update)
+                    return True
+
+        if not append:
+            return False
+        self._pending.append(_PendingUpdate(update))
+        return True
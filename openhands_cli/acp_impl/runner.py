@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
 from openhands.sdk import BaseConversation, ConversationExecutionStatus
@@ -27,6 +28,7 @@ async def run_conversation_with_confirmation(
     conversation: BaseConversation,
     conn: "Client",
     session_id: str,
+    run_in_thread: Callable[[Callable[[], None]], Awaitable[None]] = asyncio.to_thread,
 ) -> None:
     """Run the conversation with confirmation mode enabled.
 
@@ -37,6 +39,8 @@ async def run_conversation_with_confirmation(
         conversation: The conversation to run
         conn: ACP connection for permission requests
         session_id: The session ID
+        run_in_thread: Runs the synchronous `conversation.run` off the event
+            loop (e.g. on the agent's session scheduler)
     """
     # If agent was paused at WAITING_FOR_CONFIRMATION, handle it first
     if (
@@ -51,7 +55,7 @@ async def run_conversation_with_confirmation(
 
     while True:
         # Run conversation in a thread (SDK's run() is synchronous)
-        await asyncio.to_thread(conversation.run)
+        await run_in_thread(conversation.run)
 
         # Check execution status
         if conversation.state.execution_status == ConversationExecutionStatus.FINISHED:
@@ -0,0 +1,121 @@
+"""Bounding the number of conversations an ACP agent keeps in memory.
+
+A long-lived ACP process (e.g. the one started by an editor) creates a new
+session for every chat and previously kept each conversation, with its event
+list, LLM client and MCP tool connections, until the process exited.
+
+`SessionEvictionPolicy` tracks when each resident session was last used and
+picks sessions to evict: the least recently used ones beyond `max_resident`,
+and any session idle for longer than `idle_ttl` seconds. Evicted conversations
+are closed; their events are already persisted, so the agent reloads them
+transparently the next time the session is used.
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Container, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from openhands.sdk import BaseConversation
+
+
+DEFAULT_MAX_RESIDENT_SESSIONS = 8
+DEFAULT_SESSION_IDLE_TTL = 30 * 60.0
+
+
+@dataclass
+class SessionSetup:
+    """Arguments a session was created with, needed to reload it."""
+
+    working_dir: str | None = None
+    mcp_servers: dict[str, dict[str, Any]] | None = None
+
+
+class SessionEvictionPolicy:
+    """LRU / idle-TTL bookkeeping for resident sessions."""
+
+    def __init__(
+        self,
+        max_resident: int | None = DEFAULT_MAX_RESIDENT_SESSIONS,
+        idle_ttl: float | None = DEFAULT_SESSION_IDLE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_resident is not None and max_resident < 1:
+            raise ValueError("max_resident must be at least 1")
+        self.max_resident = max_resident
+        self.idle_ttl = idle_ttl
+        self._clock = clock
+        # Least recently used first
+        self._last_used: OrderedDict[str, float] = OrderedDict()
+
+    def touch(self, session_id: str) -> None:
+        """Mark a session as just used."""
+        self._last_used[session_id] = self._clock()
+        self._last_used.move_to_end(session_id)
+
+    def discard(self, session_id: str) -> None:
+        self._last_used.pop(session_id, None)
+
+    def idle_for(self, session_id: str) -> float:
+        """Seconds since the session was last used."""
+        last_used = self._last_used.get(session_id)
+        return 0.0 if last_used is None else self._clock() - last_used
+
+    def next_expiry(self) -> float | None:
+        """Seconds until the least recently used session exceeds the idle TTL."""
+        if self.idle_ttl is None or not self._last_used:
+            return None
+        oldest = next(iter(self._last_used.values()))
+        return max(0.0, oldest + self.idle_ttl - self._clock())
+
+    def select_victims(
+        self, resident: Iterable[str], busy: Container[str]
+    ) -> list[tuple[str, str]]:
+        """Pick resident sessions to evict, least recently used first.
+
+        Sessions in `busy` are never picked.
+
+        Returns:
+            (session_id, reason) pairs
+        """
+        resident_ids = set(resident)
+        # Sessions never touched (e.g. created directly) count as most recent.
+        for session_id in resident_ids.difference(self._last_used):
+            self.touch(session_id)
+
+        now = self._clock()
+        excess = 0
+        if self.max_resident is not None:
+            excess = len(resident_ids) - self.max_resident
+        victims: list[tuple[str, str]] = []
+        for session_id, last_used in self._last_used.items():
+            if session_id not in resident_ids or session_id in busy:
+                continue
+            if excess > 0:
+                victims.append((session_id, "over capacity"))
+                excess -= 1
+            elif self.idle_ttl is not None and now - last_used >= self.idle_ttl:
+                victims.append((session_id, "idle"))
+        return victims
+
+
+def resident_memory_summary(sessions: Mapping[str, BaseConversation]) -> str:
+    """Describe how much conversation state the resident sessions hold."""
+    events = 0
+    for conversation in sessions.values():
+        try:
+            events += len(conversation.state.events)
+        except Exception:
+            pass
+    summary = f"{len(sessions)} resident session(s) holding {events} event(s)"
+
+    try:
+        import resource
+    except ImportError:  # Windows
+        return summary
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return f"{summary}, peak RSS {max_rss / divisor:.0f} MiB"
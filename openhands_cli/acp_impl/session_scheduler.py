@@ -0,0 +1,113 @@
+"""Bounded, fair execution of conversation runs across ACP sessions.
+
+The SDK's `conversation.run()` is synchronous, so each ACP session runs it in a
+worker thread. Running those on the default executor means that several busy
+sessions contend with each other (and with every other `to_thread` user) for
+an unbounded number of threads.
+
+`SessionScheduler` gives conversation runs their own bounded executor and
+admits them in FIFO order, so at most `max_concurrent` conversations run at
+once and a session waiting for a slot is served before later arrivals. A run
+that is cancelled while still queued simply leaves the queue; a run cancelled
+while executing keeps its slot until the worker thread actually returns, so
+the executor never silently oversubscribes.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+
+DEFAULT_MAX_CONCURRENT_SESSIONS = 4
+
+
+@dataclass
+class SessionRunState:
+    """Scheduling state of a single session."""
+
+    queued: int = 0
+    running: bool = False
+    # time.monotonic() at which the current run started
+    started_at: float | None = None
+    # Total time spent executing conversation runs
+    run_seconds: float = 0.0
+    runs: int = 0
+
+
+class SessionScheduler:
+    """Run conversation steps for many sessions on a bounded executor."""
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT_SESSIONS):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="acp-session"
+        )
+        # asyncio.Semaphore wakes waiters in FIFO order.
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._sessions: dict[str, SessionRunState] = {}
+
+    def state(self, session_id: str) -> SessionRunState:
+        """Return the scheduling state of a session."""
+        return self._sessions.setdefault(session_id, SessionRunState())
+
+    def is_queued(self, session_id: str) -> bool:
+        """Whether the session has a run waiting for a free slot."""
+        state = self._sessions.get(session_id)
+        return state is not None and state.queued > 0
+
+    def is_running(self, session_id: str) -> bool:
+        """Whether a run of the session is executing in a worker thread."""
+        state = self._sessions.get(session_id)
+        return state is not None and state.running
+
+    @property
+    def running_count(self) -> int:
+        return sum(state.running for state in self._sessions.values())
+
+    def forget(self, session_id: str) -> None:
+        """Drop the bookkeeping of a session that is no longer active."""
+        state = self._sessions.get(session_id)
+        if state is not None and not state.queued and not state.running:
+            del self._sessions[session_id]
+
+    async def run(self, session_id: str, func: Callable[[], None]) -> None:
+        """Run `func` in the session executor once a slot is free.
+
+        Raises:
+            asyncio.CancelledError: If cancelled while queued or running. A
+                running `func` cannot be interrupted; its slot is released
+                when it returns.
+        """
+        state = self.state(session_id)
+        state.queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            state.queued -= 1
+
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, func)
+        except BaseException:
+            self._slots.release()
+            raise
+        state.running = True
+        state.started_at = time.monotonic()
+        future.add_done_callback(lambda _future: self._finish(state))
+        # Shield so that cancelling the caller doesn't orphan the slot
+        await asyncio.shield(future)
+
+    def _finish(self, state: SessionRunState) -> None:
+        if state.started_at is not None:
+            state.run_seconds += time.monotonic() - state.started_at
+        state.running = False
+        state.started_at = None
+        state.runs += 1
+        self._slots.release()
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running conversation steps finish in background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
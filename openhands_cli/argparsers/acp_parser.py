@@ -1,6 +1,7 @@
 import argparse
 import os
 
+from openhands_cli.acp_impl.session_scheduler import DEFAULT_MAX_CONCURRENT_SESSIONS
 from openhands_cli.argparsers.util import (
     add_confirmation_mode_args,
     add_env_override_args,
@@ -28,6 +29,49 @@ def add_acp_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentP
     # Environment variable override option
     add_env_override_args(acp_parser)
 
+    acp_parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=False,
+        help=(
+            "Stream LLM output to the client token by token. "
+            "Only supported with the local workspace."
+        ),
+    )
+
+    acp_parser.add_argument(
+        "--replay-turns",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "When loading or resuming a session, only replay the last N turns "
+            "of its history"
+        ),
+    )
+
+    acp_parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_SESSIONS,
+        metavar="N",
+        help=(
+            "Maximum number of sessions whose conversations run at the same "
+            "time; prompts for other sessions wait in order "
+            f"(default: {DEFAULT_MAX_CONCURRENT_SESSIONS})"
+        ),
+    )
+
+    acp_parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        default=False,
+        help=(
+            "Prepare the next session's conversation in the background so "
+            "that new sessions start immediately"
+        ),
+    )
+
     acp_parser.add_argument(
         "--cloud",
         action="store_true",
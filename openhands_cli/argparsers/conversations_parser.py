@@ -0,0 +1,50 @@
+"""Argument parser for the conversations subcommand."""
+
+import argparse
+
+
+def add_conversations_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the conversations subcommand parser.
+
+    Args:
+        subparsers: The subparsers action to add the conversations parser to
+    """
+    description = """
+Manage locally stored conversations.
+
+Examples:
+
+  # Pack a conversation's event files into a single append-only log
+  openhands conversations compact <conversation-id>
+"""
+    conversations_parser = subparsers.add_parser(
+        "conversations",
+        help="Manage locally stored conversations",
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    conversations_subparsers = conversations_parser.add_subparsers(
+        dest="conversations_command",
+        help="Conversation commands",
+        required=True,
+    )
+
+    compact_description = """
+Pack a conversation's event files into a single append-only log.
+
+The packed log is read transparently by 'openhands view', '--resume' and the
+history panel. It is expanded back into individual files automatically when
+the conversation is resumed. Do not compact a conversation that is currently
+open in another OpenHands session.
+"""
+    compact_parser = conversations_subparsers.add_parser(
+        "compact",
+        help="Pack a conversation's event files into a single log",
+        description=compact_description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    compact_parser.add_argument(
+        "conversation_id",
+        type=str,
+        help="The conversation ID to compact",
+    )
@@ -6,6 +6,7 @@ from openhands_cli import __version__
 from openhands_cli.argparsers.acp_parser import add_acp_parser
 from openhands_cli.argparsers.auth_parser import add_login_parser, add_logout_parser
 from openhands_cli.argparsers.cloud_parser import add_cloud_parser
+from openhands_cli.argparsers.conversations_parser import add_conversations_parser
 from openhands_cli.argparsers.mcp_parser import add_mcp_parser
 from openhands_cli.argparsers.serve_parser import add_serve_parser
 from openhands_cli.argparsers.util import (
@@ -49,6 +50,7 @@ def create_main_parser() -> argparse.ArgumentParser:
                                                       server (e.g., Toad CLI, Zed IDE)
                 openhands login                     # Authenticate with OpenHands Cloud
                 openhands logout                    # Log out from OpenHands Cloud
+                openhands conversations compact ID  # Pack a conversation's events
         """,
     )
 
@@ -132,4 +134,7 @@ def create_main_parser() -> argparse.ArgumentParser:
     # Add view subcommand
     add_view_parser(subparsers)
 
+    # Add conversations subcommand
+    add_conversations_parser(subparsers)
+
     return parser
@@ -0,0 +1,57 @@
+"""Command handlers for the conversations subcommand."""
+
+import argparse
+from pathlib import Path
+
+from rich.console import Console
+
+from openhands_cli.conversations.store.packed import (
+    PACK_FILENAME,
+    PackFormatError,
+    compact_conversation,
+)
+from openhands_cli.locations import get_conversations_dir
+from openhands_cli.theme import OPENHANDS_THEME
+
+
+console = Console()
+
+
+def handle_conversations_compact(args: argparse.Namespace) -> None:
+    """Handle the 'conversations compact' command.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    conversation_dir = Path(get_conversations_dir()) / args.conversation_id
+    if not conversation_dir.is_dir():
+        console.print(
+            f"Conversation not found: {args.conversation_id}",
+            style=OPENHANDS_THEME.error,
+        )
+        raise SystemExit(1)
+
+    try:
+        moved = compact_conversation(conversation_dir)
+    except (OSError, PackFormatError) as e:
+        console.print(f"Error: {e}", style=OPENHANDS_THEME.error, markup=False)
+        raise SystemExit(1)
+
+    console.print(
+        f"Packed {moved} event file(s) into {conversation_dir / PACK_FILENAME}",
+        style=OPENHANDS_THEME.success,
+        markup=False,
+    )
+
+
+def handle_conversations_command(args: argparse.Namespace) -> None:
+    """Main handler for conversations commands.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    if args.conversations_command == "compact":
+        handle_conversations_compact(args)
+    else:
+        console.print("Unknown conversations command", style=OPENHANDS_THEME.error)
+        raise SystemExit(1)
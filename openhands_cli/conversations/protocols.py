@@ -21,6 +21,14 @@ class ConversationStore(Protocol):
         """
         ...
 
+    def get_latest_conversation_id(self) -> str | None:
+        """Get the ID of the most recently created conversation.
+
+        Returns:
+            The conversation ID, or None if there are no conversations.
+        """
+        ...
+
     def get_metadata(self, conversation_id: str) -> ConversationMetadata | None:
         """Get metadata for a specific conversation.
 
@@ -48,6 +56,8 @@ class ConversationStore(Protocol):
         conversation_id: str,
         limit: int | None = None,
         start_from_newest: bool = False,
+        offset: int = 0,
+        reverse: bool = False,
     ) -> Iterator[Event]:
         """Load events for a conversation.
 
@@ -56,6 +66,9 @@ class ConversationStore(Protocol):
             limit: Optional maximum number of events to load.
             start_from_newest: If True and limit is set, loads the *last* N events
                              (chronologically). If False, loads the *first* N events.
+            offset: Number of events to skip, counted from the oldest event (or
+                  from the newest one when start_from_newest is True).
+            reverse: If True, yields the selected events newest first.
 
         Returns:
             Iterator of events.
@@ -24,6 +24,10 @@ class CloudStore(ConversationStore):
         # TODO: Implement API call to GET /conversations
         raise NotImplementedError("Cloud storage is not yet implemented")
 
+    def get_latest_conversation_id(self) -> str | None:
+        # TODO: Implement API call to GET /conversations?limit=1
+        raise NotImplementedError("Cloud storage is not yet implemented")
+
     def get_metadata(self, conversation_id: str) -> ConversationMetadata | None:
         # TODO: Implement API call to GET /conversations/{id}
         raise NotImplementedError("Cloud storage is not yet implemented")
@@ -37,6 +41,8 @@ class CloudStore(ConversationStore):
         conversation_id: str,
         limit: int | None = None,
         start_from_newest: bool = False,
+        offset: int = 0,
+        reverse: bool = False,
     ) -> Iterator[Event]:
         # TODO: Implement API call to GET /conversations/{id}/events (streaming)
         raise NotImplementedError("Cloud storage is not yet implemented")
@@ -0,0 +1,254 @@
+"""Persistent metadata index for locally stored conversations.
+
+The index caches the per-conversation metadata that is otherwise expensive to
+derive (creation time, title, working directory, event count) so that listing
+conversations does not have to re-parse every conversation directory on each
+call.
+
+The index lives in a hidden ``.index`` directory inside the conversations
+directory. Keeping it in a subdirectory means that rewriting the index does not
+touch the mtime of the conversations directory itself, which is what we use to
+detect added or removed conversations.
+"""
+
+from __future__ import annotations
+
+import base64
+import heapq
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from openhands_cli.conversations.models import ConversationMetadata
+
+
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "conversations.json"
+LATEST_FILENAME = "latest.json"
+INDEX_VERSION = 2
+
+
+class IndexEntry(BaseModel):
+    """Cached metadata for a single conversation directory."""
+
+    id: str
+    created_at: datetime | None = None
+    title: str | None = None
+    event_count: int = 0
+    # Number of leading events already checked for the first user prompt.
+    title_scanned: int = 0
+    # Workspace directory the conversation was created in, if known.
+    working_dir: str | None = None
+    last_modified: datetime | None = None
+    # mtime of the conversation's events directory when this entry was built.
+    # Used to decide whether the entry needs to be refreshed.
+    events_mtime_ns: int = 0
+
+    @property
+    def is_listable(self) -> bool:
+        """Whether the entry has enough data to be shown in listings."""
+        return self.created_at is not None
+
+    def to_metadata(self) -> ConversationMetadata:
+        assert self.created_at is not None
+        return ConversationMetadata(
+            id=self.id,
+            created_at=self.created_at,
+            title=self.title,
+            last_modified=self.last_modified,
+        )
+
+
+class _IndexData(BaseModel):
+    version: int = INDEX_VERSION
+    # mtime of the conversations directory at the time of the last full sync.
+    base_mtime_ns: int = 0
+    entries: dict[str, IndexEntry] = Field(default_factory=dict)
+
+
+class LatestPointer(BaseModel):
+    """Pointer to the most recently created conversation.
+
+    The pointer is only valid while the conversations directory and the
+    events directories of not-yet-listable conversations are unchanged, since
+    either could introduce a newer conversation.
+    """
+
+    id: str | None = None
+    base_mtime_ns: int = 0
+    pending: dict[str, int] = Field(default_factory=dict)
+
+
+class ConversationIndex:
+    """On-disk index of conversation metadata.
+
+    The index is a cache: it is rebuilt from scratch whenever it is missing,
+    corrupted or written by an incompatible version, and failures to persist it
+    are ignored.
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.index_dir = base_dir / INDEX_DIRNAME
+        self.path = self.index_dir / INDEX_FILENAME
+        self.latest_path = self.index_dir / LATEST_FILENAME
+        self._data = _IndexData()
+        self._loaded_mtime_ns: int | None = None
+
+    @property
+    def base_mtime_ns(self) -> int:
+        return self._data.base_mtime_ns
+
+    @base_mtime_ns.setter
+    def base_mtime_ns(self, value: int) -> None:
+        self._data.base_mtime_ns = value
+
+    @property
+    def entries(self) -> dict[str, IndexEntry]:
+        return self._data.entries
+
+    def load(self) -> None:
+        """Load the index from disk if it changed since the last load."""
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            self._data = _IndexData()
+            self._loaded_mtime_ns = None
+            return
+
+        if mtime_ns == self._loaded_mtime_ns:
+            return
+
+        try:
+            data = _IndexData.model_validate_json(self.path.read_bytes())
+        except (OSError, ValidationError, ValueError):
+            data = _IndexData()
+
+        if data.version != INDEX_VERSION:
+            data = _IndexData()
+
+        self._data = data
+        self._loaded_mtime_ns = mtime_ns
+
+    def save(self) -> None:
+        """Atomically persist the index. Errors are ignored."""
+        if self._write(self.path, self._data):
+            try:
+                self._loaded_mtime_ns = self.path.stat().st_mtime_ns
+            except OSError:
+                pass
+
+    def load_latest(self) -> LatestPointer | None:
+        """Read the latest-conversation pointer, if one was recorded."""
+        try:
+            return LatestPointer.model_validate_json(self.latest_path.read_bytes())
+        except (OSError, ValidationError, ValueError):
+            return None
+
+    def update_latest(self) -> None:
+        """Record the newest conversation, rewriting the pointer only if needed."""
+        newest = self.newest(1)
+        pointer = LatestPointer(
+            id=newest[0].id if newest else None,
+            base_mtime_ns=self.base_mtime_ns,
+            pending={
+                entry.id: entry.events_mtime_ns
+                for entry in self.entries.values()
+                if not entry.is_listable
+            },
+        )
+        if pointer != self.load_latest():
+            self._write(self.latest_path, pointer)
+
+    def _write(self, path: Path, model: BaseModel) -> bool:
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(model.model_dump_json().encode("utf-8"))
+                os.replace(tmp_path, path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return False
+        return True
+
+    def ensure_dir(self) -> None:
+        """Create the index directory so it doesn't perturb later mtime checks."""
+        try:
+            self.index_dir.mkdir(exist_ok=True)
+        except OSError:
+            pass
+
+    def newest(self, limit: int | None = None) -> list[IndexEntry]:
+        """Return listable entries sorted by creation date, latest first."""
+        listable = (entry for entry in self.entries.values() if entry.is_listable)
+        if limit is None:
+            return sorted(listable, key=_created_at, reverse=True)
+        return heapq.nlargest(limit, listable, key=_created_at)
+
+    def page(
+        self,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+        working_dir: str | None = None,
+    ) -> list[IndexEntry]:
+        """Return up to `limit` listable entries, latest first.
+
+        Args:
+            limit: Maximum number of entries to return
+            after: Sort key of the last entry of the previous page
+            working_dir: Only return conversations created in this directory
+        """
+        if working_dir is not None:
+            working_dir = os.path.normpath(working_dir)
+        entries = (
+            entry
+            for entry in self.entries.values()
+            if entry.is_listable
+            and (after is None or _page_key(entry) < after)
+            and (
+                working_dir is None
+                or (
+                    entry.working_dir is not None
+                    and os.path.normpath(entry.working_dir) == working_dir
+                )
+            )
+        )
+        return heapq.nlargest(limit, entries, key=_page_key)
+
+
+def encode_cursor(entry: IndexEntry) -> str:
+    """Return an opaque cursor pointing after `entry` in a paged listing."""
+    created_at, entry_id = _page_key(entry)
+    raw = f"{created_at.isoformat()}|{entry_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor returned by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode()
+        created_at, entry_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), entry_id
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _created_at(entry: IndexEntry) -> datetime:
+    assert entry.created_at is not None
+    return entry.created_at
+
+
+def _page_key(entry: IndexEntry) -> tuple[datetime, str]:
+    # The ID breaks ties so that paging is stable.
+    return _created_at(entry), entry.id
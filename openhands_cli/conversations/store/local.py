@@ -3,22 +3,104 @@
 from __future__ import annotations
 
 import json
+import os
+import re
+import time
 import uuid
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from pydantic import TypeAdapter
 
-from openhands.sdk import MessageEvent
+from openhands.sdk.conversation.persistence_const import BASE_STATE
 from openhands.sdk.event.base import Event
-
-# from openhands.tools.preset.default import register_default_tools (moved to __init__)
 from openhands_cli.conversations.models import ConversationMetadata
 from openhands_cli.conversations.protocols import ConversationStore
+from openhands_cli.conversations.store.index import (
+    ConversationIndex,
+    IndexEntry,
+    LatestPointer,
+    decode_cursor,
+    encode_cursor,
+)
+from openhands_cli.conversations.store.packed import (
+    PACK_FILENAME,
+    EventPack,
+    PackFormatError,
+)
 from openhands_cli.locations import get_conversations_dir
-from openhands_cli.utils import extract_text_from_message_content
+
+
+# Directory mtimes closer than this to "now" may still change without the
+# timestamp moving on filesystems with coarse resolution, so they are not
+# trusted for freshness checks.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+# Bounds for the parallel scan of conversation directories missing from the
+# index. Scanning is dominated by file I/O, so threads are sufficient.
+_SCAN_MAX_WORKERS = 8
+_SCAN_BATCH_SIZE = 64
+
+
+def _trusted_mtime_ns(mtime_ns: int) -> int:
+    """Return the mtime if it is safe to cache, or 0 to force a re-check."""
+    if time.time_ns() - mtime_ns < _RACY_MTIME_WINDOW_NS:
+        return 0
+    return mtime_ns
+
+
+def _event_window(
+    total: int, limit: int | None, offset: int, start_from_newest: bool
+) -> tuple[int, int]:
+    """Compute the [start, stop) slice of a conversation's events to load.
+
+    `offset` is counted from the oldest event, or from the newest one when
+    `start_from_newest` is set.
+    """
+    offset = max(offset, 0)
+    if start_from_newest:
+        stop = max(total - offset, 0)
+        start = 0 if limit is None else max(stop - limit, 0)
+    else:
+        start = min(offset, total)
+        stop = total if limit is None else min(start + limit, total)
+    return start, stop
+
+
+# The SDK serializes `source` right after `id` and `timestamp`, so peeking at
+# the start of an event is enough to skip events that aren't from the user.
+_SOURCE_PEEK_BYTES = 512
+_SOURCE_PATTERN = re.compile(rb'"source"\s*:\s*"([^"]*)"')
+
+
+def _extract_user_prompt(event_data: Any) -> str | None:
+    """Return the text of a user MessageEvent without validating the event.
+
+    Mirrors `extract_text_from_message_content(..., has_exactly_one=False)`:
+    the text of the first content block, if it is a text block.
+    """
+    if not isinstance(event_data, dict) or event_data.get("source") != "user":
+        return None
+    if event_data.get("kind", "MessageEvent") != "MessageEvent":
+        return None
+
+    llm_message = event_data.get("llm_message")
+    if not isinstance(llm_message, dict):
+        return None
+    content = llm_message.get("content")
+    if not isinstance(content, list) or not content:
+        return None
+
+    first_block = content[0]
+    if not isinstance(first_block, dict) or first_block.get("type", "text") != "text":
+        return None
+    text = first_block.get("text")
+    return text if isinstance(text, str) else None
 
 
 class LocalFileStore(ConversationStore):
@@ -31,36 +113,156 @@ class LocalFileStore(ConversationStore):
             base_dir: Base directory for storing conversations.
                 Defaults to get_conversations_dir().
         """
-        # Register default tools to ensure all Action subclasses are available
-        # for proper deserialization of events.
-        # Import locally to avoid hard dependency on browser-use at module level.
-        from openhands.tools.preset.default import register_default_tools
-
-        register_default_tools(enable_browser=False)
         self.base_dir = Path(
             base_dir if base_dir is not None else get_conversations_dir()
         )
-        self._event_adapter = TypeAdapter(Event)
+        # Built on first use, see _get_event_adapter()
+        self._event_adapter: TypeAdapter[Event] | None = None
+        self._index = ConversationIndex(self.base_dir)
+        # conversation_id -> (events dir mtime, sorted loose event file names)
+        self._manifests: dict[str, tuple[int, list[str]]] = {}
+        # conversation_id -> ((pack size, pack mtime), open pack)
+        self._packs: dict[str, tuple[tuple[int, int], EventPack]] = {}
+        # conversation_id -> (loose manifest, pack, merged manifest)
+        self._merged_manifests: dict[str, tuple[list[str], EventPack, list[str]]] = {}
 
     def list_conversations(self, limit: int = 100) -> list[ConversationMetadata]:
-        """List recent conversations."""
-        conversations = []
+        """List recent conversations.
 
+        Metadata is served from a persistent index (see `ConversationIndex`).
+        Only the returned entries are checked for staleness, so the cost of a
+        call grows with `limit` rather than with the total number of events.
+        """
+        # Only the final, complete listing is of interest here.
+        return deque(self.iter_conversations(limit), maxlen=1)[0]
+
+    def iter_conversations(
+        self, limit: int = 100
+    ) -> Iterator[list[ConversationMetadata]]:
+        """Yield increasingly complete listings of recent conversations.
+
+        Conversation directories missing from the index are scanned in
+        parallel, most recently modified first. While that scan is running a
+        partial listing is yielded after each batch so callers can render
+        early results. The last listing yielded is the complete one.
+        """
         if not self.base_dir.exists():
-            return conversations
+            yield []
+            return
 
-        # Iterate through all conversation directories
-        for conversation_dir in self.base_dir.iterdir():
-            if not conversation_dir.is_dir():
-                continue
+        index = self._index
+        index.load()
+        index.ensure_dir()
+
+        dirty = False
+        base_mtime_ns = self.base_dir.stat().st_mtime_ns
+        if base_mtime_ns != index.base_mtime_ns:
+            for _ in self._scan_entries(self._sync_conversation_ids()):
+                yield [entry.to_metadata() for entry in index.newest(limit)]
+            index.base_mtime_ns = _trusted_mtime_ns(base_mtime_ns)
+            dirty = True
+
+        # Entries that are not listable yet (e.g. directories whose first event
+        # has not been written) are re-checked on every call.
+        for entry in list(index.entries.values()):
+            if not entry.is_listable and self._refresh_entry(entry) is not entry:
+                dirty = True
+
+        conversations: list[ConversationMetadata] = []
+        for entry in index.newest(limit):
+            refreshed = self._refresh_entry(entry)
+            if refreshed is not entry:
+                dirty = True
+            if refreshed is not None and refreshed.is_listable:
+                conversations.append(refreshed.to_metadata())
+
+        if dirty:
+            index.save()
+        index.update_latest()
+
+        yield conversations
+
+    def list_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 50,
+        working_dir: str | None = None,
+    ) -> tuple[list[IndexEntry], str | None]:
+        """Return one page of conversations, latest first.
 
-            metadata = self._parse_conversation_dir(conversation_dir)
-            if metadata:
-                conversations.append(metadata)
+        Served from the index like `list_conversations`; only the entries of
+        the returned page are checked for staleness.
 
-        # Sort by creation date, latest first
-        conversations.sort(key=lambda x: x.created_at, reverse=True)
-        return conversations[:limit]
+        Args:
+            cursor: Cursor returned with the previous page, None for the first
+            limit: Maximum number of conversations per page
+            working_dir: Only list conversations created in this directory
+
+        Returns:
+            The page's index entries and the cursor of the next page (None if
+            this is the last page).
+
+        Raises:
+            ValueError: If `cursor` is malformed.
+        """
+        after = decode_cursor(cursor) if cursor is not None else None
+        # Bring the index up to date without building a listing.
+        deque(self.iter_conversations(limit=0), maxlen=0)
+
+        index = self._index
+        # One extra entry tells whether there is a next page.
+        candidates = index.page(limit + 1, after=after, working_dir=working_dir)
+        has_more = len(candidates) > limit
+
+        entries: list[IndexEntry] = []
+        dirty = False
+        for entry in candidates[:limit]:
+            refreshed = self._refresh_entry(entry)
+            if refreshed is not entry:
+                dirty = True
+            if refreshed is not None and refreshed.is_listable:
+                entries.append(refreshed)
+        if dirty:
+            index.save()
+
+        next_cursor = None
+        if has_more and limit > 0:
+            next_cursor = encode_cursor(candidates[limit - 1])
+        return entries, next_cursor
+
+    def pending_scan_count(self) -> int:
+        """Return how many conversation directories are missing from the index.
+
+        Callers can use this to decide whether listing conversations will be
+        fast, or whether to stream results with `iter_conversations` instead.
+        """
+        if not self.base_dir.exists():
+            return 0
+        self._index.load()
+        try:
+            if self.base_dir.stat().st_mtime_ns == self._index.base_mtime_ns:
+                return 0
+        except OSError:
+            return 0
+        return len(self._list_conversation_ids() - self._index.entries.keys())
+
+    def get_latest_conversation_id(self) -> str | None:
+        """Get the ID of the most recently created conversation.
+
+        Served from a pointer file maintained alongside the index. The pointer
+        is trusted while nothing that could introduce a newer conversation has
+        changed, which costs a handful of `stat` calls; otherwise the index is
+        refreshed through `list_conversations`.
+        """
+        if not self.base_dir.exists():
+            return None
+
+        pointer = self._index.load_latest()
+        if pointer is not None and self._is_latest_fresh(pointer):
+            return pointer.id
+
+        conversations = self.list_conversations(limit=1)
+        return conversations[0].id if conversations else None
 
     def get_metadata(self, conversation_id: str) -> ConversationMetadata | None:
         """Get metadata for a specific conversation."""
@@ -71,39 +273,29 @@ class LocalFileStore(ConversationStore):
 
     def get_event_count(self, conversation_id: str) -> int:
         """Get the total number of events in a conversation."""
-        conversation_dir = self.base_dir / conversation_id
-        events_dir = conversation_dir / "events"
-
-        if not events_dir.exists() or not events_dir.is_dir():
-            return 0
-
-        return len(list(events_dir.glob("event-*.json")))
+        return len(self._event_manifest(conversation_id))
 
     def load_events(
         self,
         conversation_id: str,
         limit: int | None = None,
         start_from_newest: bool = False,
+        offset: int = 0,
+        reverse: bool = False,
     ) -> Iterator[Event]:
-        """Load events for a conversation."""
-        conversation_dir = self.base_dir / conversation_id
-        events_dir = conversation_dir / "events"
+        """Load events for a conversation.
 
-        if not events_dir.exists() or not events_dir.is_dir():
-            return
-
-        # Get all event files and sort them
-        event_files = list(events_dir.glob("event-*.json"))
-        event_files.sort()
-
-        if limit is not None:
-            if start_from_newest:
-                event_files = event_files[-limit:]
-            else:
-                event_files = event_files[:limit]
+        Only the event files inside the requested window are read, and each
+        one is validated lazily as it is yielded.
+        """
+        names = self._event_manifest(conversation_id)
+        start, stop = _event_window(len(names), limit, offset, start_from_newest)
+        positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
 
-        for event_file in event_files:
-            event = self._load_event_from_file(event_file)
+        for position in positions:
+            event = self._load_event(
+                self._read_event_bytes(conversation_id, names, position)
+            )
             if event:
                 yield event
 
@@ -131,81 +323,374 @@ class LocalFileStore(ConversationStore):
 
         return conversation_id
 
+    def _event_manifest(self, conversation_id: str) -> list[str]:
+        """Return the ordered event names of a conversation.
+
+        Events stored in the conversation's packed log (see `EventPack`) come
+        first, followed by any loose event files that are not in the pack.
+        """
+        loose = self._loose_event_names(conversation_id)
+        pack = self._open_pack(conversation_id)
+        if pack is None:
+            return loose
+
+        cached = self._merged_manifests.get(conversation_id)
+        # The loose manifest is replaced (not mutated) whenever the events
+        # directory changes, so identity tells us whether it is still current.
+        if cached is not None and cached[0] is loose and cached[1] is pack:
+            return cached[2]
+
+        packed = pack.names()
+        packed_set = set(packed)
+        merged = packed + [name for name in loose if name not in packed_set]
+        self._merged_manifests[conversation_id] = (loose, pack, merged)
+        return merged
+
+    def _loose_event_names(self, conversation_id: str) -> list[str]:
+        """Return the sorted loose event file names of a conversation.
+
+        The manifest is cached per conversation and keyed by the events
+        directory mtime. Event files are only ever appended, so when the
+        directory changes only the newly added names are sorted and appended.
+        """
+        events_dir = self.base_dir / conversation_id / "events"
+        try:
+            mtime_ns = events_dir.stat().st_mtime_ns
+        except OSError:
+            self._manifests.pop(conversation_id, None)
+            return []
+
+        cached = self._manifests.get(conversation_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            names = [
+                entry.name
+                for entry in os.scandir(events_dir)
+                if entry.name.startswith("event-") and entry.name.endswith(".json")
+            ]
+        except OSError:
+            self._manifests.pop(conversation_id, None)
+            return []
+        previous = cached[1] if cached is not None else []
+        known = set(previous)
+        added = sorted(name for name in names if name not in known)
+        if len(known) + len(added) == len(names) and (
+            not previous or not added or previous[-1] < added[0]
+        ):
+            manifest = previous + added
+        else:
+            # Files were removed or inserted out of order: rebuild from scratch.
+            manifest = sorted(names)
+
+        self._manifests[conversation_id] = (_trusted_mtime_ns(mtime_ns), manifest)
+        return manifest
+
+    def _open_pack(self, conversation_id: str) -> EventPack | None:
+        """Return the (cached) packed event log of a conversation, if any."""
+        conversation_dir = self.base_dir / conversation_id
+        try:
+            stat = (conversation_dir / PACK_FILENAME).stat()
+        except OSError:
+            stat = None
+
+        cached = self._packs.get(conversation_id)
+        if cached is not None:
+            if stat is not None and (stat.st_size, stat.st_mtime_ns) == cached[0]:
+                return cached[1]
+            cached[1].close()
+            del self._packs[conversation_id]
+
+        if stat is None:
+            return None
+
+        try:
+            pack = EventPack.open(conversation_dir)
+        except (OSError, PackFormatError):
+            return None
+        if pack is not None:
+            self._packs[conversation_id] = ((stat.st_size, stat.st_mtime_ns), pack)
+        return pack
+
+    def _read_event_bytes(
+        self,
+        conversation_id: str,
+        names: list[str],
+        position: int,
+        limit: int | None = None,
+    ) -> bytes | None:
+        """Read the raw JSON (or its first `limit` bytes) of an event.
+
+        Args:
+            conversation_id: The conversation ID.
+            names: The conversation's event manifest.
+            position: Position of the event in the manifest.
+            limit: Optional maximum number of bytes to read.
+        """
+        cached = self._packs.get(conversation_id)
+        if cached is not None and position < len(cached[1]):
+            return cached[1].read(position, limit)
+        event_file = self.base_dir / conversation_id / "events" / names[position]
+        try:
+            with open(event_file, "rb") as f:
+                return f.read(-1 if limit is None else limit)
+        except OSError:
+            return None
+
+    def _is_latest_fresh(self, pointer: LatestPointer) -> bool:
+        """Check whether a latest-conversation pointer can still be trusted."""
+        if pointer.base_mtime_ns == 0:
+            return False
+        try:
+            if self.base_dir.stat().st_mtime_ns != pointer.base_mtime_ns:
+                return False
+        except OSError:
+            return False
+
+        if pointer.id is not None and not (self.base_dir / pointer.id).is_dir():
+            return False
+
+        for conversation_id, events_mtime_ns in pointer.pending.items():
+            events_dir = self.base_dir / conversation_id / "events"
+            try:
+                mtime_ns = events_dir.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = 0
+            if mtime_ns != events_mtime_ns:
+                return False
+
+        return True
+
+    def _list_conversation_ids(self) -> set[str]:
+        return {
+            entry.name
+            for entry in os.scandir(self.base_dir)
+            if not entry.name.startswith(".") and entry.is_dir()
+        }
+
+    def _sync_conversation_ids(self) -> list[str]:
+        """Drop index entries for removed conversations.
+
+        Returns:
+            IDs of conversations missing from the index, most recently
+            modified first.
+        """
+        index = self._index
+        names = self._list_conversation_ids()
+        for stale_id in index.entries.keys() - names:
+            del index.entries[stale_id]
+
+        def dir_mtime_ns(conversation_id: str) -> int:
+            try:
+                return (self.base_dir / conversation_id).stat().st_mtime_ns
+            except OSError:
+                return 0
+
+        return sorted(names - index.entries.keys(), key=dir_mtime_ns, reverse=True)
+
+    def _scan_entries(self, conversation_ids: list[str]) -> Iterator[None]:
+        """Build index entries for `conversation_ids` on a bounded thread pool.
+
+        Yields after every batch except the last one, once the batch's entries
+        have been added to the index.
+        """
+        if not conversation_ids:
+            return
+
+        if len(conversation_ids) == 1:
+            self._index.entries[conversation_ids[0]] = self._build_entry(
+                conversation_ids[0]
+            )
+            return
+
+        workers = min(_SCAN_MAX_WORKERS, len(conversation_ids))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="conversation-scan"
+        ) as executor:
+            for start in range(0, len(conversation_ids), _SCAN_BATCH_SIZE):
+                batch = conversation_ids[start : start + _SCAN_BATCH_SIZE]
+                for entry in executor.map(self._build_entry, batch):
+                    self._index.entries[entry.id] = entry
+                if start + _SCAN_BATCH_SIZE < len(conversation_ids):
+                    yield
+
+    def _refresh_entry(self, entry: IndexEntry) -> IndexEntry | None:
+        """Rebuild an index entry if its events directory changed.
+
+        Returns:
+            The same entry object if it is still fresh, otherwise the rebuilt
+            entry (which replaces the old one in the index), or None if the
+            conversation directory disappeared.
+        """
+        events_dir = self.base_dir / entry.id / "events"
+        try:
+            mtime_ns = events_dir.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+
+        if mtime_ns == entry.events_mtime_ns:
+            return entry
+
+        if not (self.base_dir / entry.id).is_dir():
+            self._index.entries.pop(entry.id, None)
+            return None
+
+        refreshed = self._build_entry(entry.id, previous=entry)
+        self._index.entries[entry.id] = refreshed
+        return refreshed
+
+    def _build_entry(
+        self, conversation_id: str, previous: IndexEntry | None = None
+    ) -> IndexEntry:
+        """Build an index entry by scanning a conversation directory.
+
+        Values that can't change once known (creation time, title) are reused
+        from `previous` instead of being parsed again.
+        """
+        events_dir = self.base_dir / conversation_id / "events"
+        try:
+            mtime_ns = events_dir.stat().st_mtime_ns
+        except OSError:
+            return IndexEntry(id=conversation_id)
+
+        names = self._event_manifest(conversation_id)
+        entry = IndexEntry(
+            id=conversation_id,
+            event_count=len(names),
+            last_modified=datetime.fromtimestamp(mtime_ns / 1e9).astimezone(),
+            events_mtime_ns=_trusted_mtime_ns(mtime_ns),
+        )
+        if previous is not None and previous.is_listable:
+            entry.created_at = previous.created_at
+            entry.title = previous.title
+            entry.title_scanned = previous.title_scanned
+
+        if entry.created_at is None:
+            entry.created_at = self._read_created_at(conversation_id, names)
+
+        # Once found, the title is never recomputed; until then only events
+        # added since the last scan are checked.
+        if entry.created_at is not None and entry.title is None:
+            entry.title, entry.title_scanned = self._find_first_user_prompt(
+                conversation_id, names, start=entry.title_scanned
+            )
+
+        if previous is not None and previous.working_dir is not None:
+            entry.working_dir = previous.working_dir
+        elif entry.created_at is not None:
+            entry.working_dir = self._read_working_dir(conversation_id)
+
+        return entry
+
+    def _read_working_dir(self, conversation_id: str) -> str | None:
+        """Read the workspace directory from the persisted conversation state."""
+        try:
+            with open(self.base_dir / conversation_id / BASE_STATE, "rb") as f:
+                state = json.load(f)
+            working_dir = state["workspace"]["working_dir"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return working_dir if isinstance(working_dir, str) else None
+
     def _parse_conversation_dir(
         self, conversation_dir: Path
     ) -> ConversationMetadata | None:
         """Parse a single conversation directory."""
-        events_dir = conversation_dir / "events"
+        conversation_id = conversation_dir.name
+        return self._parse_event_files(
+            conversation_id, self._event_manifest(conversation_id)
+        )
 
-        # Check if events directory exists
-        if not events_dir.exists() or not events_dir.is_dir():
+    def _parse_event_files(
+        self, conversation_id: str, names: list[str]
+    ) -> ConversationMetadata | None:
+        """Build conversation metadata from its ordered event names."""
+        created_at = self._read_created_at(conversation_id, names)
+        if created_at is None:
             return None
 
-        # Get all event files
-        event_files = list(events_dir.glob("event-*.json"))
-        if not event_files:
-            return None
+        # Find the first user message for the title
+        first_user_prompt, _ = self._find_first_user_prompt(conversation_id, names)
 
-        # Sort event files to find the first one
-        event_files.sort()
-        first_event_file = event_files[0]
+        return ConversationMetadata(
+            id=conversation_id,
+            created_at=created_at,
+            title=first_user_prompt,
+        )
 
-        try:
-            # Parse the first event file to get timestamp
-            with open(first_event_file, encoding="utf-8") as f:
-                first_event = json.load(f)
+    def _read_created_at(
+        self, conversation_id: str, names: list[str]
+    ) -> datetime | None:
+        """Read the conversation creation time from its first event."""
+        if not names:
+            return None
 
+        try:
+            first_event = json.loads(
+                self._read_event_bytes(conversation_id, names, 0) or b""
+            )
             timestamp_str = first_event.get("timestamp")
             if not timestamp_str:
                 return None
+            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            return None
 
-            created_at = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+    def _find_first_user_prompt(
+        self, conversation_id: str, names: list[str], start: int = 0
+    ) -> tuple[str | None, int]:
+        """Find the first user prompt in the conversation events.
 
-            # Find the first user message for the title
-            first_user_prompt = self._find_first_user_prompt(event_files)
+        Only a bounded prefix of each event is read to rule out events that
+        don't come from the user, so large observations are never parsed.
 
-            return ConversationMetadata(
-                id=conversation_dir.name,
-                created_at=created_at,
-                title=first_user_prompt,
+        Returns:
+            The prompt text (or None), and the position up to which events
+            were checked. Events that can't be decoded are skipped.
+        """
+        for position in range(start, len(names)):
+            prefix = self._read_event_bytes(
+                conversation_id, names, position, limit=_SOURCE_PEEK_BYTES
             )
-
-        except (json.JSONDecodeError, ValueError, KeyError):
-            return None
-
-    def _find_first_user_prompt(self, event_files: list[Path]) -> str | None:
-        """Find the first user prompt in the conversation events."""
-        for event_file in event_files:
-            try:
-                with open(event_file, encoding="utf-8") as f:
-                    event_data = json.load(f)
-            except (OSError, json.JSONDecodeError):
+            if prefix is None:
+                continue
+            match = _SOURCE_PATTERN.search(prefix)
+            if match is not None and match.group(1) != b"user":
                 continue
 
-            message_event = self._to_message_event(event_data)
-            if message_event is None or message_event.source != "user":
+            event_bytes = self._read_event_bytes(conversation_id, names, position)
+            try:
+                event_data = json.loads(event_bytes or b"")
+            except ValueError:
                 continue
 
-            text = extract_text_from_message_content(
-                list(message_event.llm_message.content), has_exactly_one=False
-            )
+            text = _extract_user_prompt(event_data)
             if text:
-                return text
+                return text, position + 1
 
-        return None
+        return None, len(names)
 
-    def _to_message_event(self, event_data: dict[str, Any]) -> MessageEvent | None:
-        """Convert raw event data to a MessageEvent."""
-        try:
-            return MessageEvent(**event_data)
-        except Exception:
-            return None
+    def _get_event_adapter(self) -> TypeAdapter[Event]:
+        """Return the event adapter, creating it on first use.
 
-    def _load_event_from_file(self, event_file: Path) -> Event | None:
-        """Load and validate an event from a file."""
+        Default tools are registered first so all Action subclasses are
+        available for deserialization. This is deferred to the first decoded
+        event so commands that never read events don't import the tools.
+        """
+        if self._event_adapter is None:
+            # Import locally to avoid hard dependency on browser-use at module level.
+            from openhands.tools.preset.default import register_default_tools
+
+            register_default_tools(enable_browser=False)
+            self._event_adapter = TypeAdapter(Event)
+        return self._event_adapter
+
+    def _load_event(self, event_bytes: bytes | None) -> Event | None:
+        """Validate an event from its raw JSON."""
+        if event_bytes is None:
+            return None
         try:
-            with open(event_file, encoding="utf-8") as f:
-                event_data = json.load(f)
-            return self._event_adapter.validate_python(event_data)
-        except (OSError, json.JSONDecodeError, ValueError):
+            return self._get_event_adapter().validate_python(json.loads(event_bytes))
+        except ValueError:
             return None
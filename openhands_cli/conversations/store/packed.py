@@ -0,0 +1,306 @@
+"""Packed, append-only event log for conversation persistence.
+
+The SDK persists every event as its own ``events/event-*.json`` file. For long
+conversations that means tens of thousands of small files. A packed log stores
+the same events in a single segment file inside the conversation directory::
+
+    events.pack      magic header, then one record per event:
+                     <u16 name length><u32 payload length><name><JSON payload>
+    events.pack.idx  sidecar index: one little-endian u64 offset per record
+
+Records keep the original file name so a packed conversation can be expanded
+back into loose files, which is what the SDK needs in order to resume it.
+The pack file is memory-mapped for random access.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+
+
+PACK_FILENAME = "events.pack"
+PACK_INDEX_FILENAME = "events.pack.idx"
+
+_MAGIC = b"OHEVPK01"
+_RECORD_HEADER = struct.Struct("<HI")
+_OFFSET = struct.Struct("<Q")
+
+
+class PackFormatError(ValueError):
+    """Raised when a packed event log is not in the expected format."""
+
+
+def list_loose_event_files(events_dir: Path) -> list[str]:
+    """Return the sorted names of the loose event files in a directory."""
+    try:
+        return sorted(
+            entry.name
+            for entry in os.scandir(events_dir)
+            if entry.name.startswith("event-") and entry.name.endswith(".json")
+        )
+    except OSError:
+        return []
+
+
+class EventPack:
+    """Read access to a conversation's packed event log."""
+
+    def __init__(self, conversation_dir: Path):
+        self.path = conversation_dir / PACK_FILENAME
+        self.index_path = conversation_dir / PACK_INDEX_FILENAME
+        self.size = 0
+        # End of the last complete record; appends continue from here.
+        self.data_end = len(_MAGIC)
+        self._mmap: mmap.mmap | None = None
+        self._offsets: list[int] = []
+        self._names: list[str] | None = None
+
+    @classmethod
+    def open(cls, conversation_dir: Path) -> EventPack | None:
+        """Open the packed log of a conversation, or return None if it has none.
+
+        Raises:
+            PackFormatError: If the pack file is corrupted.
+        """
+        if not (conversation_dir / PACK_FILENAME).is_file():
+            return None
+        pack = cls(conversation_dir)
+        pack._load()
+        return pack
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __enter__(self) -> EventPack:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def names(self) -> list[str]:
+        """Return the original event file names, in log order."""
+        if self._names is None:
+            self._names = [self._read_record(offset)[0] for offset in self._offsets]
+        return self._names
+
+    def read(self, position: int, limit: int | None = None) -> bytes:
+        """Return the raw JSON payload (or its first `limit` bytes) of an event."""
+        return self._read_record(self._offsets[position], limit)[1]
+
+    def _read_record(self, offset: int, limit: int | None = None) -> tuple[str, bytes]:
+        assert self._mmap is not None
+        name_len, payload_len = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        start = offset + _RECORD_HEADER.size
+        name = self._mmap[start : start + name_len].decode("utf-8")
+        start += name_len
+        if limit is not None:
+            payload_len = min(payload_len, limit)
+        return name, self._mmap[start : start + payload_len]
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            self.size = os.fstat(f.fileno()).st_size
+            if self.size < len(_MAGIC):
+                raise PackFormatError(f"Truncated event pack: {self.path}")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise PackFormatError(f"Not an event pack: {self.path}")
+
+        self._offsets = self._load_offsets()
+        if self._offsets:
+            self.data_end = self._record_end(self._offsets[-1]) or self.data_end
+
+    def offsets(self) -> list[int]:
+        """Return the start offset of every record, in log order."""
+        return list(self._offsets)
+
+    def _load_offsets(self) -> list[int]:
+        """Read the sidecar index, falling back to scanning the pack.
+
+        Records past the end of the index (e.g. after an interrupted append)
+        are recovered by scanning; a trailing partial record is ignored.
+        """
+        try:
+            raw = self.index_path.read_bytes()
+        except OSError:
+            raw = b""
+
+        offsets = [offset for (offset,) in _OFFSET.iter_unpack(raw)]
+        if raw and (len(raw) % _OFFSET.size or not self._valid_offsets(offsets)):
+            offsets = []
+
+        scan_from = self._record_end(offsets[-1]) if offsets else len(_MAGIC)
+        return offsets + self._scan(scan_from)
+
+    def _valid_offsets(self, offsets: list[int]) -> bool:
+        previous_end = len(_MAGIC)
+        for offset in offsets:
+            if offset != previous_end:
+                return False
+            end = self._record_end(offset)
+            if end is None:
+                return False
+            previous_end = end
+        return True
+
+    def _record_end(self, offset: int) -> int | None:
+        """Return the end offset of a complete record, or None if truncated."""
+        if offset + _RECORD_HEADER.size > self.size:
+            return None
+        assert self._mmap is not None
+        name_len, payload_len = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        end = offset + _RECORD_HEADER.size + name_len + payload_len
+        return end if end <= self.size else None
+
+    def _scan(self, offset: int | None) -> list[int]:
+        offsets: list[int] = []
+        while offset is not None and offset < self.size:
+            end = self._record_end(offset)
+            if end is None:
+                break
+            offsets.append(offset)
+            offset = end
+        return offsets
+
+
+def append_to_pack(conversation_dir: Path, records: Iterable[tuple[str, bytes]]) -> int:
+    """Append (name, payload) records to a conversation's packed event log.
+
+    The pack and its index are created if needed and flushed to disk before
+    returning.
+
+    Returns:
+        The number of records appended.
+    """
+    pack_path = conversation_dir / PACK_FILENAME
+    index_path = conversation_dir / PACK_INDEX_FILENAME
+
+    existing = EventPack.open(conversation_dir)
+    if existing is None:
+        end, offsets = 0, []
+    else:
+        with existing:
+            end, offsets = existing.data_end, existing.offsets()
+
+    count = 0
+    with open(pack_path, "wb" if existing is None else "r+b") as pack_file:
+        if existing is None:
+            pack_file.write(_MAGIC)
+            end = len(_MAGIC)
+        # Drop any trailing partial record left by an interrupted append.
+        pack_file.truncate(end)
+        pack_file.seek(end)
+        for name, payload in records:
+            encoded_name = name.encode("utf-8")
+            pack_file.write(_RECORD_HEADER.pack(len(encoded_name), len(payload)))
+            pack_file.write(encoded_name)
+            pack_file.write(payload)
+            offsets.append(end)
+            end += _RECORD_HEADER.size + len(encoded_name) + len(payload)
+            count += 1
+        pack_file.flush()
+        os.fsync(pack_file.fileno())
+
+    with open(index_path, "wb") as index_file:
+        index_file.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+        index_file.flush()
+        os.fsync(index_file.fileno())
+
+    return count
+
+
+def compact_conversation(conversation_dir: Path) -> int:
+    """Move a conversation's loose event files into its packed event log.
+
+    Loose files are only removed after the pack has been written and read back
+    successfully. This must not be run on a conversation that is currently
+    open, since the SDK reads events from the loose files.
+
+    Returns:
+        The number of events moved into the pack.
+
+    Raises:
+        PackFormatError: If an existing pack is corrupted, or if loose files
+            would have to be inserted before already packed events.
+    """
+    events_dir = conversation_dir / "events"
+    loose = list_loose_event_files(events_dir)
+
+    existing = EventPack.open(conversation_dir)
+    packed: list[str] = []
+    if existing is not None:
+        with existing:
+            packed = list(existing.names())
+
+    packed_set = set(packed)
+    to_add = [name for name in loose if name not in packed_set]
+    if packed and to_add and to_add[0] < packed[-1]:
+        raise PackFormatError(
+            f"Event file {to_add[0]} is older than the packed events of "
+            f"{conversation_dir.name}"
+        )
+
+    if not to_add and existing is None:
+        return 0
+
+    if to_add:
+        append_to_pack(
+            conversation_dir,
+            ((name, (events_dir / name).read_bytes()) for name in to_add),
+        )
+
+    pack = EventPack.open(conversation_dir)
+    assert pack is not None
+    with pack:
+        if pack.names() != packed + to_add:
+            raise PackFormatError(
+                f"Event pack verification failed for {conversation_dir.name}"
+            )
+
+    for name in loose:
+        (events_dir / name).unlink(missing_ok=True)
+
+    return len(to_add)
+
+
+def unpack_conversation(conversation_dir: Path) -> int:
+    """Expand a packed event log back into loose event files.
+
+    The SDK only reads loose event files, so this must run before a packed
+    conversation is resumed. Does nothing if the conversation has no pack.
+
+    Returns:
+        The number of event files written.
+    """
+    pack = EventPack.open(conversation_dir)
+    if pack is None:
+        return 0
+
+    events_dir = conversation_dir / "events"
+    events_dir.mkdir(parents=True, exist_ok=True)
+
+    written = 0
+    with pack:
+        for position, name in enumerate(pack.names()):
+            target = events_dir / name
+            if target.exists():
+                continue
+            tmp = target.with_suffix(".json.tmp")
+            tmp.write_bytes(pack.read(position))
+            os.replace(tmp, target)
+            written += 1
+
+    pack.index_path.unlink(missing_ok=True)
+    pack.path.unlink()
+    return written
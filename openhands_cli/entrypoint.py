@@ -13,16 +13,17 @@ from pathlib import Path
 from dotenv import load_dotenv
 from rich.console import Console
 
+from openhands_cli import theme
 from openhands_cli.argparsers.main_parser import create_main_parser
-from openhands_cli.stores import (
+from openhands_cli.stores.env_vars import (
     MissingEnvironmentVariablesError,
     check_and_warn_env_vars,
 )
-from openhands_cli.terminal_compat import check_terminal_compatibility
-from openhands_cli.theme import OPENHANDS_THEME
-from openhands_cli.utils import create_seeded_instructions_from_args
 
 
+# Everything else (the agent SDK, textual, fastmcp, ...) is imported by the
+# subcommand that needs it, so `--help` and light subcommands start fast.
+
 console = Console()
 
 
@@ -50,7 +51,8 @@ def handle_resume_logic(args) -> str | None:
     if args.last:
         if args.resume is None:
             console.print(
-                "Error: --last flag requires --resume", style=OPENHANDS_THEME.warning
+                "Error: --last flag requires --resume",
+                style=theme.OPENHANDS_THEME.warning,
             )
             return None
 
@@ -58,19 +60,18 @@ def handle_resume_logic(args) -> str | None:
         from openhands_cli.conversations.store.local import LocalFileStore
 
         store = LocalFileStore()
-        conversations = store.list_conversations(limit=1)
+        latest_id = store.get_latest_conversation_id()
 
-        if not conversations:
+        if latest_id is None:
             console.print(
-                "No conversations found to resume.", style=OPENHANDS_THEME.warning
+                "No conversations found to resume.",
+                style=theme.OPENHANDS_THEME.warning,
             )
             return None
 
-        latest_id = conversations[0].id
-
         console.print(
             f"Resuming latest conversation: {latest_id}",
-            style=OPENHANDS_THEME.success,
+            style=theme.OPENHANDS_THEME.success,
         )
         return latest_id
 
@@ -151,6 +152,10 @@ def main() -> None:
                 run_acp_server(
                     initial_confirmation_mode=confirmation_mode,
                     resume_conversation_id=resume_id,
+                    streaming_enabled=args.streaming,
+                    replay_turns=args.replay_turns,
+                    max_concurrent_sessions=args.max_sessions,
+                    prewarm_sessions=args.prewarm,
                     cloud=args.cloud,
                     cloud_api_url=args.cloud_url,
                 )
@@ -191,7 +196,16 @@ def main() -> None:
             if not success:
                 sys.exit(1)
 
+        elif args.command == "conversations":
+            from openhands_cli.conversations.commands import (
+                handle_conversations_command,
+            )
+
+            handle_conversations_command(args)
+
         else:
+            from openhands_cli.terminal_compat import check_terminal_compatibility
+
             compat_result = check_terminal_compatibility(console=console)
             if not compat_result.is_tty:
                 print(
@@ -210,6 +224,7 @@ def main() -> None:
 
             # Use textual-based UI as default
             from openhands_cli.tui.textual_app import main as textual_main
+            from openhands_cli.utils import create_seeded_instructions_from_args
 
             queued_inputs = create_seeded_instructions_from_args(args)
             conversation_id = textual_main(
@@ -223,28 +238,31 @@ def main() -> None:
                 env_overrides_enabled=env_overrides_enabled,
                 critic_disabled=critic_disabled,
             )
-            console.print("Goodbye! 👋", style=OPENHANDS_THEME.success)
+            console.print("Goodbye! 👋", style=theme.OPENHANDS_THEME.success)
             # Show conversation ID if available (may be None if app exited early)
             if conversation_id is not None:
                 console.print(
                     f"Conversation ID: {conversation_id.hex}",
-                    style=OPENHANDS_THEME.accent,
+                    style=theme.OPENHANDS_THEME.accent,
                 )
                 console.print(
                     f"Hint: run openhands --resume {conversation_id} "
                     "to resume this conversation.",
-                    style=OPENHANDS_THEME.secondary,
+                    style=theme.OPENHANDS_THEME.secondary,
                 )
     except KeyboardInterrupt:
-        console.print("\nGoodbye! 👋", style=OPENHANDS_THEME.warning)
+        console.print("\nGoodbye! 👋", style=theme.OPENHANDS_THEME.warning)
     except EOFError:
-        console.print("\nGoodbye! 👋", style=OPENHANDS_THEME.warning)
+        console.print("\nGoodbye! 👋", style=theme.OPENHANDS_THEME.warning)
     except MissingEnvironmentVariablesError as e:
         # Display clean error message for missing env vars
-        console.print(f"[{OPENHANDS_THEME.error}]Error:[/{OPENHANDS_THEME.error}] {e}")
+        error_style = theme.OPENHANDS_THEME.error
+        console.print(f"[{error_style}]Error:[/{error_style}] {e}")
         sys.exit(1)
     except Exception as e:
-        console.print(f"Error: {str(e)}", style=OPENHANDS_THEME.error, markup=False)
+        console.print(
+            f"Error: {str(e)}", style=theme.OPENHANDS_THEME.error, markup=False
+        )
         import traceback
 
         traceback.print_exc()
@@ -0,0 +1,313 @@
+"""Process-wide pool of MCP server connections shared across conversations.
+
+The SDK connects to every configured MCP server when a conversation's agent is
+initialized: stdio servers are spawned as new processes and remote servers get
+a new client, and each one is asked for its tools. With several ACP sessions
+(or a TUI that switches conversations) that means duplicate server processes
+and the same handshake and tool listing for every conversation.
+
+`MCPConnectionPool` connects to each distinct server spec once and hands out
+the listed tools to every conversation using that spec. Connections are
+reference counted: closing a conversation releases its lease, and a server
+nobody uses is shut down after `idle_timeout` seconds.
+
+`install_shared_mcp_pool()` routes the SDK's MCP tool creation through the
+process-wide pool, unless the `share_mcp_connections` CLI setting is off. The
+agent spec and persisted conversations are unchanged.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from fastmcp.mcp_config import MCPConfig
+
+from openhands.sdk.tool import ToolDefinition, ToolExecutor
+
+
+if TYPE_CHECKING:
+    from openhands.sdk.mcp import MCPClient
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds an unused server connection is kept open for the next conversation.
+MCP_IDLE_TIMEOUT = 300.0
+
+ConnectFn = Callable[[dict[str, Any], float], "MCPClient"]
+
+
+def server_key(name: str, spec: Mapping[str, Any]) -> str:
+    """Return a stable key identifying an MCP server spec."""
+    canonical = json.dumps([name, spec], sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+@dataclass
+class _PooledServer:
+    key: str
+    name: str
+    # Owns the server process or remote session; closing it disconnects.
+    client: MCPClient | None = None
+    tools: list[ToolDefinition] = field(default_factory=list)
+    connected: bool = False
+    refs: int = 0
+    idle_since: float | None = None
+    # Serializes connecting so concurrent conversations spawn one server.
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class _Lease:
+    """One conversation's use of a pooled server."""
+
+    def __init__(self, pool: MCPConnectionPool, key: str):
+        self._pool = pool
+        self._key = key
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._pool._release(self._key)
+
+
+class _LeasedExecutor(ToolExecutor):
+    """Runs a shared MCP tool; closing it releases the lease, not the server."""
+
+    def __init__(self, inner: ToolExecutor, lease: _Lease):
+        self._inner = inner
+        self._lease = lease
+
+    def __call__(self, action: Any, conversation: Any = None) -> Any:
+        return self._inner(action, conversation)
+
+    def close(self) -> None:
+        self._lease.release()
+
+
+class MCPConnectionPool:
+    """Reference-counted MCP server connections keyed by server spec."""
+
+    def __init__(
+        self,
+        connect: ConnectFn,
+        idle_timeout: float = MCP_IDLE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the pool.
+
+        Args:
+            connect: Connects to the servers of an MCP config and returns the
+                connected client, e.g. the SDK's `create_mcp_tools`
+            idle_timeout: Seconds before an unused server is shut down
+            clock: Time source, for tests
+        """
+        self._connect = connect
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._servers: dict[str, _PooledServer] = {}
+        self._lock = threading.Lock()
+        self._reaper: threading.Timer | None = None
+
+    def create_tools(
+        self, config: Mapping[str, Any] | MCPConfig, timeout: float = 30.0
+    ) -> list[ToolDefinition]:
+        """Return the tools of every server in an MCP config.
+
+        Drop-in replacement for `create_mcp_tools`: servers already connected
+        are reused, and each returned tool releases its server when closed.
+        """
+        if isinstance(config, MCPConfig):
+            config = config.model_dump(exclude_none=True)
+        servers: Mapping[str, Any] = config.get("mcpServers", {})
+
+        tools: list[ToolDefinition] = []
+        for name, spec in servers.items():
+            tools.extend(self.acquire(name, spec, timeout))
+        return tools
+
+    def acquire(
+        self, name: str, spec: Mapping[str, Any], timeout: float = 30.0
+    ) -> list[ToolDefinition]:
+        """Lease a server's tools, connecting to it if needed."""
+        key = server_key(name, spec)
+        with self._lock:
+            server = self._servers.setdefault(key, _PooledServer(key=key, name=name))
+            server.refs += 1
+            server.idle_since = None
+
+        try:
+            with server.lock:
+                if not server.connected:
+                    started = time.perf_counter()
+                    client = self._connect({"mcpServers": {name: dict(spec)}}, timeout)
+                    server.client = client
+                    server.tools = list(client.tools)
+                    server.connected = True
+                    logger.info(
+                        f"Connected MCP server '{name}' with {len(server.tools)} "
+                        f"tool(s) in {time.perf_counter() - started:.2f}s"
+                    )
+                else:
+                    logger.debug(f"Reusing MCP server '{name}'")
+        except BaseException:
+            self._release(key)
+            raise
+
+        lease = _Lease(self, key)
+        return [
+            tool.set_executor(_LeasedExecutor(tool.executor, lease))
+            if tool.executor is not None
+            else tool
+            for tool in server.tools
+        ]
+
+    def active_count(self) -> int:
+        """Number of connected servers (in use or idle)."""
+        with self._lock:
+            return sum(server.connected for server in self._servers.values())
+
+    def close_idle(self) -> None:
+        """Shut down servers unused for longer than the idle timeout."""
+        now = self._clock()
+        with self._lock:
+            expired = [
+                server
+                for server in self._servers.values()
+                if server.refs == 0
+                and server.idle_since is not None
+                and now - server.idle_since >= self.idle_timeout
+            ]
+            for server in expired:
+                del self._servers[server.key]
+        for server in expired:
+            logger.info(f"Closing idle MCP server '{server.name}'")
+            self._disconnect(server)
+        self._schedule_reaper()
+
+    def close_all(self) -> None:
+        """Shut down every server, in use or not."""
+        with self._lock:
+            servers = list(self._servers.values())
+            self._servers.clear()
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+        for server in servers:
+            self._disconnect(server)
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            server = self._servers.get(key)
+            if server is None:
+                return
+            server.refs -= 1
+            if server.refs > 0:
+                return
+            if not server.connected:
+                # Nothing to keep around (e.g. the connection failed)
+                del self._servers[key]
+                return
+            server.idle_since = self._clock()
+        self._schedule_reaper()
+
+    def _schedule_reaper(self) -> None:
+        with self._lock:
+            if self._reaper is not None:
+                return
+            idle = [
+                server.idle_since
+                for server in self._servers.values()
+                if server.refs == 0 and server.idle_since is not None
+            ]
+            if not idle:
+                return
+            delay = max(0.0, min(idle) + self.idle_timeout - self._clock())
+            self._reaper = threading.Timer(delay, self._on_reaper)
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _on_reaper(self) -> None:
+        with self._lock:
+            self._reaper = None
+        self.close_idle()
+
+    @staticmethod
+    def _disconnect(server: _PooledServer) -> None:
+        client, server.client = server.client, None
+        server.tools = []
+        server.connected = False
+        if client is None:
+            return
+        try:
+            client.sync_close()
+        except Exception as e:
+            logger.warning(f"Error closing MCP server '{server.name}': {e}")
+
+
+_pool: MCPConnectionPool | None = None
+_pool_lock = threading.Lock()
+# The SDK's own create_mcp_tools, saved when the pool is installed
+_sdk_create_mcp_tools: Callable[..., Any] | None = None
+
+
+def get_mcp_pool() -> MCPConnectionPool:
+    """Return the process-wide MCP connection pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from openhands.sdk.mcp import create_mcp_tools
+
+            _pool = MCPConnectionPool(connect=create_mcp_tools)
+            atexit.register(_pool.close_all)
+        return _pool
+
+
+def install_shared_mcp_pool() -> bool:
+    """Make agents created from now on share MCP connections via the pool.
+
+    The SDK creates an agent's MCP tools through the module-level
+    `create_mcp_tools` of `openhands.sdk.agent.base` and has no way to inject
+    them. Passing them as tools in the agent spec instead would keep resumed
+    conversations from matching their persisted tools. So that function is
+    replaced, which affects every agent in the process; the tests pin this to
+    the SDK's behaviour. Turning off the `share_mcp_connections` CLI setting
+    restores the SDK's function.
+
+    Returns:
+        Whether the pool is installed. It isn't if the setting is off or the
+        SDK doesn't create MCP tools through a module-level `create_mcp_tools`.
+    """
+    global _sdk_create_mcp_tools
+
+    import openhands.sdk.agent.base as agent_base
+    from openhands_cli.stores import CliSettings
+
+    current = getattr(agent_base, "create_mcp_tools", None)
+    if current is None:
+        logger.debug("SDK does not expose create_mcp_tools; MCP pool not installed")
+        return False
+
+    if not CliSettings.load().share_mcp_connections:
+        if _sdk_create_mcp_tools is not None:
+            setattr(agent_base, "create_mcp_tools", _sdk_create_mcp_tools)
+            _sdk_create_mcp_tools = None
+        return False
+
+    pool = get_mcp_pool()
+    if current != pool.create_tools:
+        _sdk_create_mcp_tools = current
+        setattr(agent_base, "create_mcp_tools", pool.create_tools)
+        logger.debug("MCP connections are shared across conversations")
+    return True
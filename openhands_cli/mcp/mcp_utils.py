@@ -4,6 +4,9 @@ This module provides functionality to manage MCP server configurations
 similar to Claude's MCP command line interface.
 """
 
+import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -39,9 +42,40 @@ def _ensure_config_dir(config_path: Path) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
 
+# Parsed configs keyed by path, valid while the file's signature is unchanged.
+# Callers get deep copies, so mutating a loaded config never touches the cache.
+_config_cache: dict[Path, tuple[tuple[int, int, int], MCPConfig]] = {}
+_config_cache_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> tuple[int, int, int] | None:
+    """Return (mtime, size, inode) of a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _cache_config(
+    config_path: Path, signature: tuple[int, int, int], config: MCPConfig
+) -> None:
+    with _config_cache_lock:
+        _config_cache[config_path] = (signature, config)
+
+
+def clear_mcp_config_cache() -> None:
+    """Forget all cached MCP configurations."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
 def load_mcp_config() -> MCPConfig:
     """Load the MCP configuration from file.
 
+    The parsed configuration is cached until the file changes, so repeated
+    loads only cost a `stat`.
+
     Returns:
         The MCPConfig object, or empty config if file doesn't exist.
 
@@ -50,22 +84,35 @@ def load_mcp_config() -> MCPConfig:
         ValidationError: If the configuration format is invalid.
     """
     config_path = _get_mcp_config_path()
-    if not config_path.exists():
+    signature = _file_signature(config_path)
+    if signature is None:
         # Return empty config with mcpServers structure
         return MCPConfig.from_dict({"mcpServers": {}})
 
+    with _config_cache_lock:
+        cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1].model_copy(deep=True)
+
     try:
-        return MCPConfig.from_file(config_path)
+        config = MCPConfig.from_file(config_path)
     except (ValueError, PydanticValidationError) as e:
         # Re-raise as MCPConfigurationError for consistency
         raise MCPConfigurationError(f"Invalid MCP configuration file: {e}") from e
     except Exception as e:
         raise MCPConfigurationError(f"Error reading config file: {e}") from e
 
+    _cache_config(config_path, signature, config)
+    return config.model_copy(deep=True)
+
 
 def save_mcp_config(config: MCPConfig) -> None:
     """Save the MCP configuration to file.
 
+    The serialized configuration is validated before it replaces the file,
+    and the file is replaced atomically, so readers never see a partial or
+    invalid configuration.
+
     Args:
         config: The MCPConfig object to save
 
@@ -75,10 +122,25 @@ def save_mcp_config(config: MCPConfig) -> None:
     try:
         config_path = _get_mcp_config_path()
         _ensure_config_dir(config_path)
-        config.write_to_file(config_path)
+        content = config.model_dump_json(indent=2)
+        # Ensures the saved file can be loaded back
+        saved = MCPConfig.model_validate_json(content)
+
+        fd, tmp_path = tempfile.mkstemp(dir=config_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
     except Exception as e:
         raise MCPConfigurationError(f"Error saving config file: {e}") from e
 
+    signature = _file_signature(config_path)
+    if signature is not None:
+        _cache_config(config_path, signature, saved)
+
 
 def _parse_headers(headers: list[str] | None) -> dict[str, str]:
     """Parse header strings into a dictionary.
@@ -189,9 +251,6 @@ def add_server(
     config.add_server(name, server)
     save_mcp_config(config)
 
-    # Validate the saved configuration by loading it (ensures compatibility)
-    load_mcp_config()
-
 
 def remove_server(name: str) -> None:
     """Remove an MCP server configuration.
@@ -213,9 +272,6 @@ def remove_server(name: str) -> None:
     new_config = MCPConfig.from_dict({"mcpServers": new_servers})
     save_mcp_config(new_config)
 
-    # Validate the saved configuration by loading it (ensures it remains compatible)
-    load_mcp_config()
-
 
 def list_servers() -> dict[str, StdioMCPServer | RemoteMCPServer]:
     """List all configured MCP servers.
@@ -280,9 +336,6 @@ def enable_server(name: str) -> None:
     config.mcpServers[name] = updated_server
     save_mcp_config(config)
 
-    # Validate the saved configuration by loading it
-    load_mcp_config()
-
 
 def disable_server(name: str) -> None:
     """Disable an MCP server configuration.
@@ -316,9 +369,6 @@ def disable_server(name: str) -> None:
     config.mcpServers[name] = updated_server
     save_mcp_config(config)
 
-    # Validate the saved configuration by loading it
-    load_mcp_config()
-
 
 def server_exists(name: str) -> bool:
     """Check if an MCP server configuration exists.
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
@@ -8,13 +9,16 @@ from openhands.sdk import Agent, AgentContext, BaseConversation, Conversation, W
 from openhands.sdk.context import Skill
 from openhands.sdk.event.base import Event
 from openhands.sdk.hooks import HookConfig
+from openhands.sdk.llm.streaming import LLMStreamChunk
 from openhands.sdk.security.confirmation_policy import (
     ConfirmationPolicyBase,
 )
 from openhands.sdk.security.llm_analyzer import LLMSecurityAnalyzer
 
 # Register tools on import
+from openhands_cli.conversations.store.packed import unpack_conversation
 from openhands_cli.locations import get_conversations_dir, get_work_dir
+from openhands_cli.mcp.mcp_pool import install_shared_mcp_pool
 from openhands_cli.stores import AgentStore
 from openhands_cli.tui.widgets.richlog_visualizer import ConversationVisualizer
 
@@ -73,8 +77,7 @@ def load_agent_specs(
 
     if skills:
         if agent.agent_context is not None:
-            existing_skills = agent.agent_context.skills
-            existing_skills.extend(skills)
+            existing_skills = [*agent.agent_context.skills, *skills]
             agent = agent.model_copy(
                 update={
                     "agent_context": agent.agent_context.model_copy(
@@ -96,6 +99,7 @@ def setup_conversation(
     visualizer: ConversationVisualizer | None = None,
     event_callback: Callable[[Event], None] | None = None,
     *,
+    token_callbacks: list[Callable[[LLMStreamChunk], None]] | None = None,
     env_overrides_enabled: bool = False,
     critic_disabled: bool = False,
 ) -> BaseConversation:
@@ -107,6 +111,9 @@ def setup_conversation(
             will be generated.
         visualizer: Optional visualizer to use. If None, a default will be used
         event_callback: Optional callback function to handle events (e.g., JSON output)
+        token_callbacks: Optional callbacks receiving streamed LLM chunks. When
+            provided, the LLM is switched to streaming mode (unless it uses the
+            Responses API, which doesn't support token streaming).
         env_overrides_enabled: If True, environment variables will override
             stored LLM settings, and agent can be created from env vars if no
             disk config exists.
@@ -127,11 +134,24 @@ def setup_conversation(
     # Prepare callbacks list
     callbacks = [event_callback] if event_callback else None
 
+    if token_callbacks and agent.llm.uses_responses_api():
+        token_callbacks = None
+    if token_callbacks:
+        agent = agent.model_copy(
+            update={"llm": agent.llm.model_copy(update={"stream": True})}
+        )
+
     # Load hooks from ~/.openhands/hooks.json or {working_dir}/.openhands/hooks.json
     hook_config = HookConfig.load(working_dir=get_work_dir())
     if not hook_config.is_empty():
         console.print("✓ Hooks loaded", style="green")
 
+    # The SDK only reads loose event files, so expand compacted conversations
+    unpack_conversation(Path(get_conversations_dir()) / conversation_id.hex)
+
+    # Conversations switched to in the same process reuse MCP connections
+    install_shared_mcp_pool()
+
     # Create conversation - agent context is now set in AgentStore.load()
     conversation: BaseConversation = Conversation(
         agent=agent,
@@ -141,6 +161,7 @@ def setup_conversation(
         conversation_id=conversation_id,
         visualizer=visualizer,
         callbacks=callbacks,
+        token_callbacks=token_callbacks,
         hook_config=hook_config,
     )
 
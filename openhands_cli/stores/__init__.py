@@ -1,9 +1,34 @@
-from openhands_cli.stores.agent_store import (
-    AgentStore,
+from typing import TYPE_CHECKING, Any
+
+from openhands_cli.stores.env_vars import (
     MissingEnvironmentVariablesError,
     check_and_warn_env_vars,
 )
-from openhands_cli.stores.cli_settings import CliSettings
+
+
+if TYPE_CHECKING:
+    from openhands_cli.stores.agent_store import AgentStore
+    from openhands_cli.stores.cli_settings import CliSettings
+
+
+# Imported on first access: AgentStore pulls in the agent SDK, which commands
+# that only need the env var checks (e.g. `openhands --help`) shouldn't pay for.
+_LAZY_EXPORTS = {
+    "AgentStore": "openhands_cli.stores.agent_store",
+    "CliSettings": "openhands_cli.stores.cli_settings",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
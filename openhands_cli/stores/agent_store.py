@@ -8,7 +8,6 @@ from typing import Any
 
 from prompt_toolkit import HTML, print_formatted_text
 from pydantic import BaseModel, SecretStr
-from rich.console import Console
 
 from openhands.sdk import (
     LLM,
@@ -30,6 +29,13 @@ from openhands_cli.locations import (
 )
 from openhands_cli.mcp.mcp_utils import list_enabled_servers
 from openhands_cli.stores.cli_settings import CliSettings
+from openhands_cli.stores.env_vars import (
+    ENV_LLM_API_KEY,
+    ENV_LLM_BASE_URL,
+    ENV_LLM_MODEL,
+    MissingEnvironmentVariablesError,
+)
+from openhands_cli.stores.spec_cache import MemoizedLoad, skills_fingerprint
 from openhands_cli.utils import (
     get_default_cli_agent,
     get_default_cli_tools,
@@ -121,54 +127,6 @@ def get_default_critic(llm: LLM, *, enable_critic: bool = True) -> CriticBase |
 
 DEFAULT_LLM_BASE_URL = "https://llm-proxy.app.all-hands.dev/"
 
-# Environment variable names for LLM configuration
-ENV_LLM_API_KEY = "LLM_API_KEY"
-ENV_LLM_BASE_URL = "LLM_BASE_URL"
-ENV_LLM_MODEL = "LLM_MODEL"
-
-
-class MissingEnvironmentVariablesError(Exception):
-    """Raised when required environment variables are missing for headless mode.
-
-    This exception is raised when --override-with-envs is enabled but required
-    environment variables (LLM_API_KEY and LLM_MODEL) are not set.
-    """
-
-    def __init__(self, missing_vars: list[str]) -> None:
-        self.missing_vars = missing_vars
-        vars_str = ", ".join(missing_vars)
-        super().__init__(
-            f"Missing required environment variable(s): {vars_str}\n"
-            f"When using --override-with-envs, you must set:\n"
-            f"  - {ENV_LLM_API_KEY}: Your LLM API key\n"
-            f"  - {ENV_LLM_MODEL}: The model to use (e.g., claude-sonnet-4-5-20250929)"
-        )
-
-
-def check_and_warn_env_vars() -> None:
-    """Check for LLM environment variables and warn if they are set but not used.
-
-    This function should be called when env overrides are disabled to inform
-    users that their environment variables are being ignored.
-    """
-    env_vars_set = []
-    if os.environ.get(ENV_LLM_API_KEY):
-        env_vars_set.append(ENV_LLM_API_KEY)
-    if os.environ.get(ENV_LLM_BASE_URL):
-        env_vars_set.append(ENV_LLM_BASE_URL)
-    if os.environ.get(ENV_LLM_MODEL):
-        env_vars_set.append(ENV_LLM_MODEL)
-
-    if env_vars_set:
-        console = Console(stderr=True)
-        vars_str = ", ".join(env_vars_set)
-        console.print(
-            f"[yellow]Warning:[/yellow] Environment variable(s) {vars_str} detected "
-            "but will be ignored.\n"
-            "Use [bold]--override-with-envs[/bold] flag to apply them.",
-            highlight=False,
-        )
-
 
 class LLMEnvOverrides(BaseModel):
     """LLM configuration overrides from environment variables.
@@ -246,6 +204,18 @@ def apply_llm_overrides(llm: LLM, overrides: LLMEnvOverrides) -> LLM:
     return llm.model_copy(update=overrides.model_dump(exclude_none=True))
 
 
+# Shared by every AgentStore in the process (splash resources, runner
+# factory, settings screen), so skills are loaded once. The persisted agent
+# is not shared: each conversation needs its own LLM and usage metrics, and
+# validating agent_settings.json is cheaper than a deep copy.
+_agent_context_cache: MemoizedLoad[AgentContext] = MemoizedLoad()
+
+
+def clear_agent_spec_cache() -> None:
+    """Forget the memoized agent context."""
+    _agent_context_cache.clear()
+
+
 class AgentStore:
     """Single source of truth for persisting/retrieving AgentSpec."""
 
@@ -379,19 +349,27 @@ class AgentStore:
         )
 
     def _build_agent_context(self) -> AgentContext:
-        skills = load_project_skills(get_work_dir())
+        work_dir = get_work_dir()
         system_suffix = "\n".join(
             [
-                f"Your current working directory is: {get_work_dir()}",
+                f"Your current working directory is: {work_dir}",
                 f"User operating system: {get_os_description()}",
             ]
         )
-        return AgentContext(
-            skills=skills,
-            system_message_suffix=system_suffix,
-            load_user_skills=True,
-            load_public_skills=True,
+
+        def load() -> AgentContext:
+            return AgentContext(
+                skills=load_project_skills(work_dir),
+                system_message_suffix=system_suffix,
+                load_user_skills=True,
+                load_public_skills=True,
+            )
+
+        context = _agent_context_cache.get(
+            (system_suffix, skills_fingerprint(work_dir)), load
         )
+        # Callers may extend the skills list; keep the cached one intact.
+        return context.model_copy(update={"skills": list(context.skills)})
 
     def _maybe_build_condenser(
         self, agent: Agent, *, session_id: str | None
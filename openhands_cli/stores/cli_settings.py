@@ -4,7 +4,7 @@ import json
 import os
 from pathlib import Path
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class CliSettings(BaseModel):
@@ -13,6 +13,11 @@ class CliSettings(BaseModel):
     default_cells_expanded: bool = False
     auto_open_plan_panel: bool = True
     enable_critic: bool = True
+    stream_responses: bool = False
+    # Conversations kept loaded in the TUI; idle ones beyond this are closed.
+    max_cached_conversations: int = Field(default=8, ge=1)
+    # Conversations in the same process reuse MCP server connections.
+    share_mcp_connections: bool = True
 
     @classmethod
     def get_config_path(cls) -> Path:
@@ -0,0 +1,58 @@
+"""LLM environment variable names and checks.
+
+Kept free of SDK imports: the entrypoint runs these checks before any
+subcommand is dispatched.
+"""
+
+import os
+
+from rich.console import Console
+
+
+# Environment variable names for LLM configuration
+ENV_LLM_API_KEY = "LLM_API_KEY"
+ENV_LLM_BASE_URL = "LLM_BASE_URL"
+ENV_LLM_MODEL = "LLM_MODEL"
+
+
+class MissingEnvironmentVariablesError(Exception):
+    """Raised when required environment variables are missing for headless mode.
+
+    This exception is raised when --override-with-envs is enabled but required
+    environment variables (LLM_API_KEY and LLM_MODEL) are not set.
+    """
+
+    def __init__(self, missing_vars: list[str]) -> None:
+        self.missing_vars = missing_vars
+        vars_str = ", ".join(missing_vars)
+        super().__init__(
+            f"Missing required environment variable(s): {vars_str}\n"
+            f"When using --override-with-envs, you must set:\n"
+            f"  - {ENV_LLM_API_KEY}: Your LLM API key\n"
+            f"  - {ENV_LLM_MODEL}: The model to use (e.g., claude-sonnet-4-5-20250929)"
+        )
+
+
+def check_and_warn_env_vars() -> None:
+    """Check for LLM environment variables and warn if they are set but not used.
+
+    This function should be called when env overrides are disabled to inform
+    users that their environment variables are being ignored.
+    """
+    env_vars_set = []
+    if os.environ.get(ENV_LLM_API_KEY):
+        env_vars_set.append(ENV_LLM_API_KEY)
+    if os.environ.get(ENV_LLM_BASE_URL):
+        env_vars_set.append(ENV_LLM_BASE_URL)
+    if os.environ.get(ENV_LLM_MODEL):
+        env_vars_set.append(ENV_LLM_MODEL)
+
+    if env_vars_set:
+        console = Console(stderr=True)
+        vars_str = ", ".join(env_vars_set)
+        console.print(
+            f"[yellow]Warning:[/yellow] Environment variable(s) {vars_str} detected "
+            "but will be ignored.\n"
+            "Use [bold]--override-with-envs[/bold] flag to apply them.",
+            highlight=False,
+        )
@@ -0,0 +1,95 @@
+"""Per-process memoization of the agent spec's on-disk inputs.
+
+A TUI startup builds the agent spec several times: for the splash screen's
+resources, for the runner's conversation, and in the settings checks. Each
+build used to reload every project, user and public skill.
+
+`MemoizedLoad` keeps the last loaded value together with a key describing its
+inputs and only loads again when the key changes. Skills are keyed on
+`skills_fingerprint()`, the mtimes and sizes of the files they are loaded
+from, so adding or editing a skill is picked up by the next spec build.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Hashable
+from pathlib import Path
+
+
+# Where the SDK looks for skills, relative to the work dir and home dir.
+PROJECT_SKILL_DIRS = (
+    (".agents", "skills"),
+    (".openhands", "skills"),
+    (".openhands", "microagents"),
+)
+USER_SKILL_DIRS = (
+    (".openhands", "skills"),
+    (".openhands", "microagents"),
+)
+
+
+class MemoizedLoad[T]:
+    """Caches the most recently loaded value until its key changes."""
+
+    def __init__(self) -> None:
+        self._key: Hashable | None = None
+        self._value: T | None = None
+        self._loaded = False
+        # Held while loading, so concurrent callers load only once.
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, load: Callable[[], T]) -> T:
+        with self._lock:
+            if not self._loaded or self._key != key:
+                self._value = load()
+                self._key = key
+                self._loaded = True
+            return self._value  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._key = None
+            self._value = None
+            self._loaded = False
+
+
+def _files_fingerprint(root: Path, recursive: bool) -> tuple:
+    entries = []
+    try:
+        if recursive:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    path = os.path.join(dirpath, name)
+                    stat = os.stat(path)
+                    entries.append((path, stat.st_mtime_ns, stat.st_size))
+        else:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+            entries.sort()
+    except OSError:
+        # A directory or file vanished mid-scan; the next build rescans.
+        entries.append(("<error>", 0, 0))
+    return tuple(entries)
+
+
+def skills_fingerprint(work_dir: str | Path) -> tuple:
+    """Describe the state of every file project and user skills load from.
+
+    Covers the files directly in the work dir (third-party skill files such
+    as AGENTS.md) and everything under the project and user skill dirs.
+    """
+    work_dir = Path(work_dir)
+    home = Path.home()
+    roots = [work_dir.joinpath(*parts) for parts in PROJECT_SKILL_DIRS]
+    roots += [home.joinpath(*parts) for parts in USER_SKILL_DIRS]
+    return (
+        str(work_dir),
+        _files_fingerprint(work_dir, recursive=False),
+        *(_files_fingerprint(root, recursive=True) for root in roots),
+    )
@@ -1,10 +1,18 @@
 """OpenHands custom theme for textual UI."""
 
-from textual.theme import Theme
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from textual.theme import Theme
 
 
 def create_openhands_theme() -> Theme:
     """Create and return the custom OpenHands theme."""
+    from textual.theme import Theme
+
     return Theme(
         name="openhands",
         primary="#ffe165",  # Logo, cursor color
@@ -27,5 +35,14 @@ def create_openhands_theme() -> Theme:
     )
 
 
-# Create the theme instance
-OPENHANDS_THEME = create_openhands_theme()
+OPENHANDS_THEME: Theme
+
+
+def __getattr__(name: str) -> Any:
+    # The theme instance is created on first access: importing textual is
+    # slow, and the entrypoint only needs the theme once it prints something.
+    if name == "OPENHANDS_THEME":
+        theme = create_openhands_theme()
+        globals()[name] = theme
+        return theme
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
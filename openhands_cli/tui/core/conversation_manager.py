@@ -143,6 +143,11 @@ class ConversationManager(Container):
             state=self._state,
             message_pump=self,
             notification_callback=notification_callback,
+            run_worker=self.run_worker,
+            # Only conversations that are still loaded keep their transcript.
+            on_evict=lambda conversation_id: (
+                self._state.scroll_view.discard_transcript(conversation_id)
+            ),
         )
 
         self._policy_service = ConfirmationPolicyService(
@@ -75,6 +75,11 @@ class ConversationRunner:
             confirmation_policy=state.confirmation_policy,
             visualizer=visualizer,
             event_callback=event_callback,
+            token_callbacks=(
+                [visualizer.on_token]
+                if visualizer.cli_settings.stream_responses
+                else None
+            ),
             env_overrides_enabled=env_overrides_enabled,
             critic_disabled=critic_disabled,
         )
@@ -195,7 +200,11 @@ class ConversationRunner:
             self.conversation.state.events
         )
         if pending_actions:
-            self._message_pump.post_message(ShowConfirmationPanel(pending_actions))
+            # Go through the visualizer's queue so the panel is mounted after
+            # the pending actions it asks about.
+            self.visualizer.after_pending_updates(
+                self._message_pump.post_message, ShowConfirmationPanel(pending_actions)
+            )
 
     async def resume_after_confirmation(self, decision: UserConfirmation) -> None:
         """Resume conversation after user makes a confirmation decision."""
@@ -208,6 +217,15 @@ class ConversationRunner:
         """Check if conversation is currently running."""
         return self._running
 
+    def close(self) -> None:
+        """Close the conversation and release the visualizer.
+
+        The conversation's state and events are persisted as they change, so
+        it can be resumed later by building a new runner for it.
+        """
+        self.conversation.close()
+        self.visualizer.release()
+
     async def pause(self) -> None:
         """Pause the running conversation."""
         if self._running:
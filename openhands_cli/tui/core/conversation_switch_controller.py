@@ -92,7 +92,9 @@ class ConversationSwitchController:
     def _handle_switch_error(
         self, error: Exception, previous_id: uuid.UUID | None
     ) -> None:
-        if previous_id is not None:
+        # A previous conversation without a ready runner gets one on its next
+        # message, like any conversation that hasn't been used yet.
+        if previous_id is not None and self._runners.get(previous_id) is not None:
             self._runners.get_or_create(previous_id)
 
         self._state.set_conversation_id(previous_id)
@@ -109,11 +111,14 @@ class ConversationSwitchController:
         self._state.reset_conversation_state()
 
         self._runners.clear_current()
-        self._runners.get_or_create(target_id)
 
         self._state.finish_switching(target_id)
         self._state.set_switch_confirmation_target(None)
 
+        # Set the conversation up in the background so input is re-enabled
+        # right away; messages sent meanwhile wait for the runner.
+        self._runners.start(target_id)
+
         self._notify(
             f"Resumed conversation {target_id.hex[:8]}",
             title="Switched",
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from openhands_cli.tui.core.state import ConversationContainer
     from openhands_cli.tui.textual_app import OpenHandsApp
     from openhands_cli.tui.widgets.main_display import ScrollableContent
+    from openhands_cli.tui.widgets.richlog_visualizer import ConversationVisualizer
 
 
 NotificationCallback = Callable[[str, str, SeverityLevel], None]
@@ -55,22 +56,52 @@ class RunnerFactory:
         message_pump: MessagePump,
         notification_callback: NotificationCallback,
     ) -> ConversationRunner:
-        from openhands_cli.tui.core.conversation_runner import ConversationRunner
+        runner = self.build(
+            conversation_id,
+            self.create_visualizer(),
+            message_pump=message_pump,
+            notification_callback=notification_callback,
+        )
+
+        # Attach conversation to state for metrics reading
+        self._state.attach_conversation_state(runner.conversation.state)
+        return runner
+
+    def create_visualizer(self) -> ConversationVisualizer:
+        """Create the visualizer for a new runner.
+
+        Must be called from the main thread: the visualizer binds its update
+        queue to the thread it is created on.
+        """
         from openhands_cli.tui.widgets.richlog_visualizer import ConversationVisualizer
-        from openhands_cli.utils import json_callback
 
-        app = self._app_provider()
-        visualizer = ConversationVisualizer(
+        return ConversationVisualizer(
             self._scroll_view_provider(),
-            app,
+            self._app_provider(),
             name=DEFAULT_AGENT_NAME,
         )
 
+    def build(
+        self,
+        conversation_id: uuid.UUID,
+        visualizer: ConversationVisualizer,
+        *,
+        message_pump: MessagePump,
+        notification_callback: NotificationCallback,
+    ) -> ConversationRunner:
+        """Build a runner around an existing visualizer.
+
+        This is where the agent and conversation are set up, so it is slow;
+        it is safe to call from a worker thread.
+        """
+        from openhands_cli.tui.core.conversation_runner import ConversationRunner
+        from openhands_cli.utils import json_callback
+
         event_callback: Callable[[Event], None] | None = (
             json_callback if self._json_mode else None
         )
 
-        runner = ConversationRunner(
+        return ConversationRunner(
             conversation_id,
             state=self._state,
             message_pump=message_pump,
@@ -80,7 +111,3 @@ class RunnerFactory:
             env_overrides_enabled=self._env_overrides_enabled,
             critic_disabled=self._critic_disabled,
         )
-
-        # Attach conversation to state for metrics reading
-        self._state.attach_conversation_state(runner.conversation.state)
-        return runner
@@ -1,8 +1,17 @@
-"""RunnerRegistry - owns ConversationRunner instances and current runner."""
+"""RunnerRegistry - owns ConversationRunner instances and current runner.
+
+Runners are kept in least-recently-used order. Once there are more than the
+configured number, the least recently used idle ones are closed; their
+conversations are rebuilt from disk the next time they are used.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from textual.message_pump import MessagePump
@@ -15,6 +24,15 @@ if TYPE_CHECKING:
         RunnerFactory,
     )
     from openhands_cli.tui.core.state import ConversationContainer
+    from openhands_cli.tui.widgets.richlog_visualizer import ConversationVisualizer
+
+
+@dataclass
+class _PendingRunner:
+    """A runner whose conversation is being set up in a worker thread."""
+
+    visualizer: ConversationVisualizer
+    ready: asyncio.Future[ConversationRunner]
 
 
 class RunnerRegistry:
@@ -25,12 +43,28 @@ class RunnerRegistry:
         state: ConversationContainer,
         message_pump: MessagePump,
         notification_callback: NotificationCallback,
+        run_worker: Callable[..., object],
+        max_runners: int | None = None,
+        on_evict: Callable[[uuid.UUID], None] | None = None,
     ) -> None:
+        """Initialize the registry.
+
+        Args:
+            max_runners: How many runners to keep. None reads the cap from the
+                CLI settings each time a runner is added, so changes apply
+                without a restart.
+            on_evict: Called with the conversation ID of each evicted runner,
+                to drop whatever else is kept for that conversation.
+        """
         self._factory = factory
         self._state = state
         self._message_pump = message_pump
         self._notification_callback = notification_callback
-        self._runners: dict[uuid.UUID, ConversationRunner] = {}
+        self._run_worker = run_worker
+        self._max_runners = max_runners
+        self._on_evict = on_evict
+        self._runners: OrderedDict[uuid.UUID, ConversationRunner] = OrderedDict()
+        self._pending: dict[uuid.UUID, _PendingRunner] = {}
         self._current_runner: ConversationRunner | None = None
 
     @property
@@ -40,6 +74,10 @@ class RunnerRegistry:
     def clear_current(self) -> None:
         self._current_runner = None
 
+    def get(self, conversation_id: uuid.UUID) -> ConversationRunner | None:
+        """Return the runner for a conversation if it is ready."""
+        return self._runners.get(conversation_id)
+
     def get_or_create(self, conversation_id: uuid.UUID) -> ConversationRunner:
         runner = self._runners.get(conversation_id)
         if runner is None:
@@ -50,8 +88,129 @@ class RunnerRegistry:
             )
             self._runners[conversation_id] = runner
 
+        self._activate(conversation_id, runner)
+        self._evict_idle()
+        return runner
+
+    def start(self, conversation_id: uuid.UUID) -> ConversationVisualizer:
+        """Start setting up a conversation's runner without blocking the UI.
+
+        The runner is built in a worker thread and becomes current once ready
+        if its conversation is still the active one. Calling this again while
+        the runner is being built, or once it is ready, does nothing.
+
+        Returns:
+            The visualizer the runner renders to, usable right away.
+        """
+        runner = self._runners.get(conversation_id)
+        if runner is not None:
+            return runner.visualizer
+
+        pending = self._pending.get(conversation_id)
+        if pending is None:
+            pending = _PendingRunner(
+                visualizer=self._factory.create_visualizer(),
+                ready=asyncio.get_running_loop().create_future(),
+            )
+            # Nobody may be waiting when the build fails; the error is
+            # reported through a notification instead.
+            pending.ready.add_done_callback(
+                lambda future: future.cancelled() or future.exception()
+            )
+            self._pending[conversation_id] = pending
+            if conversation_id == self._state.conversation_id:
+                self._state.set_initializing(True)
+            self._run_worker(
+                self._build(conversation_id, pending),
+                name="initialize_conversation",
+                exit_on_error=False,
+            )
+        return pending.visualizer
+
+    async def wait_for(self, conversation_id: uuid.UUID) -> ConversationRunner:
+        """Return the conversation's runner, waiting for it to be built.
+
+        Raises:
+            Exception: Whatever setting up the conversation raised.
+            asyncio.CancelledError: If setting up the conversation was cancelled.
+        """
+        runner = self._runners.get(conversation_id)
+        if runner is not None:
+            return runner
+
+        self.start(conversation_id)
+        return await asyncio.shield(self._pending[conversation_id].ready)
+
+    async def _build(self, conversation_id: uuid.UUID, pending: _PendingRunner) -> None:
+        try:
+            runner = await asyncio.to_thread(
+                self._factory.build,
+                conversation_id,
+                pending.visualizer,
+                message_pump=self._message_pump,
+                notification_callback=self._notification_callback,
+            )
+        except Exception as e:
+            self._notification_callback(
+                "Initialization Error",
+                f"Failed to initialize conversation: {type(e).__name__}: {e}",
+                "error",
+            )
+            pending.ready.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled, e.g. on shutdown: waiters must not hang.
+            pending.ready.cancel()
+            raise
+        finally:
+            del self._pending[conversation_id]
+            if conversation_id == self._state.conversation_id:
+                self._state.set_initializing(False)
+
+        self._runners[conversation_id] = runner
+        if conversation_id == self._state.conversation_id:
+            self._activate(conversation_id, runner)
+            # The policy may have changed while the conversation was set up.
+            policy = self._state.confirmation_policy
+            if runner.conversation.state.confirmation_policy != policy:
+                runner.conversation.set_confirmation_policy(policy)
+        self._evict_idle()
+        pending.ready.set_result(runner)
+
+    def _activate(self, conversation_id: uuid.UUID, runner: ConversationRunner) -> None:
         if runner.conversation is not None:
             self._state.attach_conversation_state(runner.conversation.state)
 
         self._current_runner = runner
-        return runner
+        self._runners.move_to_end(conversation_id)
+
+    def _evict_idle(self) -> None:
+        """Close the least recently used runners beyond the cap.
+
+        The current runner and running ones are never evicted, so the
+        registry may stay over the cap until they go idle.
+        """
+        max_runners = self._max_runners
+        if max_runners is None:
+            from openhands_cli.stores import CliSettings
+
+            max_runners = CliSettings.load().max_cached_conversations
+
+        excess = len(self._runners) - max_runners
+        for conversation_id, runner in list(self._runners.items()):
+            if excess <= 0:
+                break
+            if runner is self._current_runner or runner.is_running:
+                continue
+
+            del self._runners[conversation_id]
+            excess -= 1
+            if self._on_evict is not None:
+                self._on_evict(conversation_id)
+            # Closing shuts down the conversation's tools, which may block.
+            self._run_worker(
+                runner.close,
+                name="close_conversation",
+                thread=True,
+                exit_on_error=False,
+            )
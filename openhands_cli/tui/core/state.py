@@ -96,6 +96,9 @@ class ConversationContainer(Container):
     running: var[bool] = var(False)
     """Whether the conversation is currently running/processing."""
 
+    initializing: var[bool] = var(False)
+    """Whether the current conversation's runner is being set up in the background."""
+
     # ---- Conversation Identity ----
     conversation_id: var[uuid.UUID | None] = var(None)
     """The currently active conversation ID. None during switching."""
@@ -183,6 +186,7 @@ class ConversationContainer(Container):
         ):
             yield WorkingStatusLine().data_bind(
                 running=ConversationContainer.running,
+                initializing=ConversationContainer.initializing,
                 elapsed_seconds=ConversationContainer.elapsed_seconds,
             )
             yield InputField(
@@ -322,6 +326,10 @@ class ConversationContainer(Container):
         """Set the running state. Thread-safe."""
         self._schedule_update("running", value)
 
+    def set_initializing(self, value: bool) -> None:
+        """Set whether the conversation is initializing. Thread-safe."""
+        self._schedule_update("initializing", value)
+
     def set_metrics(self, metrics: Metrics) -> None:
         """Set the metrics object. Thread-safe."""
         self._schedule_update("metrics", metrics)
@@ -395,14 +403,15 @@ class ConversationContainer(Container):
     def reset_conversation_state(self) -> None:
         """Reset state for a new conversation.
 
-        Resets: running, elapsed_seconds, metrics, conversation_title,
-                pending_action_count, internal state.
+        Resets: running, initializing, elapsed_seconds, metrics,
+                conversation_title, pending_action_count, internal state.
         Preserves: confirmation_policy (persists across conversations),
                    conversation_id (set explicitly when switching).
 
         After this call, is_conversation_created will return False.
         """
         self.running = False
+        self.initializing = False
         self.elapsed_seconds = 0
         self.metrics = None
         self.conversation_title = None
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import uuid
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from openhands_cli.tui.core.conversation_runner import ConversationRunner
     from openhands_cli.tui.core.runner_registry import RunnerRegistry
     from openhands_cli.tui.core.state import ConversationContainer
 
@@ -25,13 +27,22 @@ class UserMessageController:
         self._runners = runners
         self._run_worker = run_worker
         self._headless_mode = headless_mode
+        # Messages submitted while a conversation's runner is being set up.
+        self._waiting: dict[uuid.UUID, list[str]] = {}
+        # Conversations with a _send_when_ready worker waiting on their runner.
+        self._senders: set[uuid.UUID] = set()
 
     async def handle_user_message(self, content: str) -> None:
         # Guard: no conversation_id means switching in progress
-        if self._state.conversation_id is None:
+        conversation_id = self._state.conversation_id
+        if conversation_id is None:
             return
 
-        runner = self._runners.get_or_create(self._state.conversation_id)
+        if self._runners.get(conversation_id) is None:
+            self._queue_until_ready(conversation_id, content)
+            return
+
+        runner = self._runners.get_or_create(conversation_id)
 
         # Render user message (also dismisses pending feedback widgets)
         runner.visualizer.render_user_message(content)
@@ -39,6 +50,15 @@ class UserMessageController:
         # Update conversation title (for history panel)
         self._state.set_conversation_title(content)
 
+        if conversation_id not in self._senders and conversation_id in self._waiting:
+            # Messages left over from a failed setup go out first.
+            messages = [*self._waiting.pop(conversation_id), content]
+            self._run_worker(
+                self._send_messages(runner, messages),
+                name="process_message",
+            )
+            return
+
         if runner.is_running:
             await runner.queue_message(content)
             return
@@ -47,3 +67,48 @@ class UserMessageController:
             runner.process_message_async(content, self._headless_mode),
             name="process_message",
         )
+
+    def _queue_until_ready(self, conversation_id: uuid.UUID, content: str) -> None:
+        """Accept a message while the conversation's runner is being set up.
+
+        The message is shown right away and sent once the runner is ready, so
+        the UI never waits on agent and conversation setup.
+        """
+        visualizer = self._runners.start(conversation_id)
+        visualizer.render_user_message(content)
+        self._state.set_conversation_title(content)
+
+        self._waiting.setdefault(conversation_id, []).append(content)
+        if conversation_id not in self._senders:
+            self._senders.add(conversation_id)
+            self._run_worker(
+                self._send_when_ready(conversation_id),
+                name="process_message",
+            )
+
+    async def _send_when_ready(self, conversation_id: uuid.UUID) -> None:
+        try:
+            runner = await self._runners.wait_for(conversation_id)
+        except Exception:
+            # Already reported by the registry. The messages are already in
+            # the transcript, so they stay queued and go out with the next
+            # one, which retries the setup.
+            return
+        finally:
+            self._senders.discard(conversation_id)
+
+        await self._send_messages(runner, self._waiting.pop(conversation_id))
+
+    async def _send_messages(
+        self, runner: ConversationRunner, messages: list[str]
+    ) -> None:
+        *earlier, last = messages
+        # Everything typed during setup goes into a single run, in order.
+        for content in earlier:
+            await runner.queue_message(content)
+
+        if runner.is_running:
+            await runner.queue_message(last)
+            return
+
+        await runner.process_message_async(last, self._headless_mode)
@@ -2,7 +2,7 @@
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
-from textual.widgets import Label, Static, Switch
+from textual.widgets import Input, Label, Static, Switch
 
 from openhands_cli.stores import CliSettings
 
@@ -87,6 +87,32 @@ class CliSettingsTab(Container):
                 value=self.cli_settings.enable_critic,
             )
 
+            yield SettingsSwitch(
+                label="Stream Responses",
+                description=(
+                    "When enabled, the agent's reasoning, messages and tool calls "
+                    "are shown live as the model generates them. Takes effect for "
+                    "new conversations."
+                ),
+                switch_id="stream_responses_switch",
+                value=self.cli_settings.stream_responses,
+            )
+
+            with Container(classes="form_group"):
+                yield Label("Cached Conversations:", classes="form_label")
+                yield Input(
+                    value=str(self.cli_settings.max_cached_conversations),
+                    type="integer",
+                    id="max_cached_conversations_input",
+                    classes="form_input",
+                )
+                yield Static(
+                    "How many conversations stay loaded for quick switching. "
+                    "Idle conversations beyond this are closed and reloaded "
+                    "from disk when you return to them.",
+                    classes="form_help",
+                )
+
     def get_cli_settings(self) -> CliSettings:
         """Get the current CLI settings from the form."""
         default_cells_expanded_switch = self.query_one(
@@ -96,9 +122,21 @@ class CliSettingsTab(Container):
             "#auto_open_plan_panel_switch", Switch
         )
         enable_critic_switch = self.query_one("#enable_critic_switch", Switch)
+        stream_responses_switch = self.query_one("#stream_responses_switch", Switch)
+        max_cached_input = self.query_one("#max_cached_conversations_input", Input)
+
+        # An empty or incomplete entry (e.g. "-") keeps the saved value.
+        try:
+            max_cached_conversations = max(1, int(max_cached_input.value))
+        except ValueError:
+            max_cached_conversations = self.cli_settings.max_cached_conversations
 
         return CliSettings(
             default_cells_expanded=default_cells_expanded_switch.value,
             auto_open_plan_panel=auto_open_plan_panel_switch.value,
             enable_critic=enable_critic_switch.value,
+            stream_responses=stream_responses_switch.value,
+            max_cached_conversations=max_cached_conversations,
+            # Not editable in the form, keep the saved value.
+            share_mcp_connections=self.cli_settings.share_mcp_connections,
         )
@@ -21,6 +21,7 @@ from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.css.query import NoMatches
 from textual.widgets import Button, Static
+from textual.worker import get_current_worker
 
 from openhands_cli.conversations.models import ConversationMetadata
 from openhands_cli.conversations.store.local import LocalFileStore
@@ -32,6 +33,11 @@ if TYPE_CHECKING:
     from openhands_cli.tui.textual_app import OpenHandsApp
 
 
+# Number of unindexed conversations above which the list is loaded in the
+# background and rendered progressively instead of blocking the UI.
+STREAMING_SCAN_THRESHOLD = 64
+
+
 def _escape_rich_markup(text: str) -> str:
     """Escape Rich markup characters in text to prevent markup errors."""
     return text.replace("[", r"\[").replace("]", r"\]")
@@ -264,10 +270,52 @@ class HistorySidePanel(Container):
         self.remove()
 
     def refresh_content(self) -> None:
-        """Reload conversations and render the list."""
+        """Reload conversations and render the list.
+
+        If many conversations are missing from the store's index (e.g. on the
+        first run), they are scanned in a background thread and the list is
+        re-rendered as partial results arrive.
+        """
+        if self._store.pending_scan_count() >= STREAMING_SCAN_THRESHOLD:
+            list_container = self.query_one("#history-list", VerticalScroll)
+            list_container.remove_children()
+            list_container.mount(
+                Static("[dim]Loading conversations...[/dim]", classes="history-empty")
+            )
+            self.run_worker(
+                self._stream_conversations,
+                name="history-scan",
+                group="history-scan",
+                exclusive=True,
+                thread=True,
+            )
+            return
+
         self._local_rows = self._store.list_conversations()
         self._render_list()
 
+    def _stream_conversations(self) -> None:
+        """Scan conversations in a worker thread, rendering each partial list."""
+        worker = get_current_worker()
+        # LocalFileStore is not thread-safe, so the scan gets its own instance
+        # rather than sharing the one used on the main thread. The index it
+        # saves is picked up by the main store on its next load.
+        store = LocalFileStore(str(self._store.base_dir))
+        for rows in store.iter_conversations():
+            if worker.is_cancelled:
+                return
+            self.app.call_from_thread(self._apply_streamed_rows, rows)
+
+    def _apply_streamed_rows(self, rows: list[ConversationMetadata]) -> None:
+        """Render a (possibly partial) list of conversations from the scan."""
+        if not self.is_mounted:
+            return
+        self._local_rows = rows
+        self._render_list()
+        # Keep the current conversation visible even if it isn't persisted yet
+        if self.current_conversation_id is not None:
+            self.ensure_conversation_visible(self.current_conversation_id)
+
     def _render_list(self) -> None:
         """Render the conversation list."""
         list_container = self.query_one("#history-list", VerticalScroll)
@@ -490,6 +490,9 @@ class OpenHandsApp(CollapsibleNavigationMixin, App):
 
         for collapsible in collapsibles:
             collapsible.collapsed = any_expanded
+        # Cells outside the mounted transcript window pick the state up when
+        # they are scrolled back into view.
+        self.scroll_view.set_unmounted_rows_collapsed(any_expanded)
 
     def on_key(self, event: events.Key) -> None:
         """Handle keyboard navigation.
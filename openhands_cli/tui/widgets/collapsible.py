@@ -3,8 +3,14 @@
 This module provides a Collapsible widget that can be toggled by clicking on the
 title or pressing Enter when focused. It also supports programmatic control via
 Ctrl+O to toggle all cells at once.
+
+Cell bodies can be given as a LazyBody, which is only rendered when the cell is
+expanded. Very long text bodies are shown one page at a time, with a "show
+more" link to load the next page.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
 from rich.text import Text
@@ -23,6 +29,41 @@ if TYPE_CHECKING:
     from textual.dom import DOMNode
 
 
+# Maximum number of rendered lazy bodies kept in memory
+RENDERED_BODY_CACHE_SIZE = 32
+# Number of characters of a text body shown per page
+BODY_PAGE_CHARS = 20_000
+
+
+class LazyBody:
+    """Collapsible content that is rendered the first time it is displayed.
+
+    Rendered text is kept in a bounded LRU cache shared by all lazy bodies, and
+    collapsed cells drop their rendered text, so large observation dumps are
+    only held in memory while they are (or were recently) on display.
+    """
+
+    __slots__ = ("_render",)
+
+    def __init__(self, render: Callable[[], str]) -> None:
+        """Initialize a LazyBody.
+
+        Args:
+            render: Function producing the body text. Called on first display
+                and again whenever the rendered text was evicted from the cache.
+        """
+        self._render = render
+
+    def text(self) -> str:
+        """Return the rendered body text."""
+        return _render_lazy_body(self)
+
+
+@lru_cache(maxsize=RENDERED_BODY_CACHE_SIZE)
+def _render_lazy_body(body: LazyBody) -> str:
+    return body._render()
+
+
 class CollapsibleTitle(Container, can_focus=True):
     """Title and symbol for the Collapsible widget.
 
@@ -181,6 +222,33 @@ class CollapsibleContents(Container):
     """
 
 
+class CollapsibleShowMore(Static):
+    """Link shown below a truncated body to display its next page."""
+
+    ALLOW_SELECT = False
+    DEFAULT_CSS = """
+    CollapsibleShowMore {
+        width: auto;
+        height: auto;
+        margin-top: 1;
+        color: $text-muted;
+        text-style: italic;
+
+        &:hover {
+            color: $foreground;
+            text-style: italic underline;
+        }
+    }
+    """
+
+    class Pressed(Message):
+        """Request to show the next page of the body."""
+
+    async def _on_click(self, event: events.Click) -> None:
+        event.stop()
+        self.post_message(self.Pressed())
+
+
 class Collapsible(Widget):
     """A collapsible container with click and keyboard toggle support.
 
@@ -253,9 +321,15 @@ class Collapsible(Widget):
         # Pass the original content to Static with markup=False to prevent
         # MarkupError when content contains special characters like quotes,
         # brackets, etc. This follows the same approach as toad's tool_call.py.
-        self._content_widget = Static(content, markup=False)
+        self._content_widget = Static("", markup=False)
+        self._show_more = CollapsibleShowMore(markup=False)
+        self._show_more.display = False
+        self._content: Any = content
+        self._shown_chars = BODY_PAGE_CHARS
         self.collapsed = collapsed
         self._watch_collapsed(collapsed)
+        if not isinstance(content, LazyBody):
+            self._refresh_body()
 
     def update_title(self, new_title: str | Text) -> None:
         """Update the title of the collapsible.
@@ -271,10 +345,89 @@ class Collapsible(Widget):
         """Update the content of the collapsible.
 
         Args:
-            new_content: The new content to display (can be string or Rich renderable).
+            new_content: The new content to display (string, Rich renderable or
+                LazyBody).
         """
-        self._content_string = str(new_content)
-        self._content_widget.update(new_content)
+        self._content = new_content
+        self._shown_chars = BODY_PAGE_CHARS
+        if isinstance(new_content, LazyBody) and self.collapsed:
+            self._clear_body()
+        else:
+            self._refresh_body()
+
+    def _body_text(self) -> str | None:
+        """Return the body as text, or None if it is a Rich renderable."""
+        if isinstance(self._content, LazyBody):
+            return self._content.text()
+        if isinstance(self._content, str):
+            return self._content
+        return None
+
+    def _refresh_body(self) -> None:
+        """Display the body, up to the number of characters paged in so far."""
+        text = self._body_text()
+        if text is None:
+            self._content_widget.update(self._content)
+            self._show_more.display = False
+            return
+
+        shown = text[: self._shown_chars]
+        self._content_widget.update(shown)
+        remaining = len(text) - len(shown)
+        self._show_more.display = remaining > 0
+        if remaining:
+            self._show_more.update(f"… show more ({remaining:,} characters left)")
+
+    def _clear_body(self) -> None:
+        """Drop the displayed text of a lazy body so it can be freed."""
+        self._content_widget.update("")
+        self._show_more.display = False
+        self._shown_chars = BODY_PAGE_CHARS
+
+    def _on_collapsible_show_more_pressed(
+        self, event: CollapsibleShowMore.Pressed
+    ) -> None:
+        """Show the next page of a truncated body."""
+        event.stop()
+        self._shown_chars += BODY_PAGE_CHARS
+        self._refresh_body()
+
+    def update_from(self, other: "Collapsible") -> None:
+        """Update the title and content to match another collapsible.
+
+        Args:
+            other: The collapsible to copy the title and content from.
+        """
+        self.update_title(other.title)
+        self.update_content(other._content)
+
+    def snapshot(self) -> Callable[..., "Collapsible"]:
+        """Return a factory that recreates this collapsible in its current state.
+
+        Used to rebuild the widget after it has been unmounted, without keeping
+        the widget itself (and its children) alive. Keyword arguments passed to
+        the factory override the captured ones (e.g. ``collapsed``).
+        """
+        content = self._content
+        kwargs: dict[str, Any] = {
+            "title": self.title,
+            "collapsed": self.collapsed,
+            "collapsed_symbol": self._title.collapsed_symbol,
+            "expanded_symbol": self._title.expanded_symbol,
+            "symbol_color": self._title.symbol_color,
+            "classes": " ".join(sorted(set(self.classes) - {"-collapsed"})) or None,
+        }
+        padding = (
+            self.styles.padding if self.styles.inline.has_rule("padding") else None
+        )
+
+        def build(**overrides: Any) -> Collapsible:
+            collapsible = Collapsible(content, **{**kwargs, **overrides})
+            if padding is not None:
+                collapsible.styles.padding = padding
+            return collapsible
+
+        return build
 
     def _on_collapsible_title_toggle(self, event: CollapsibleTitle.Toggle) -> None:
         """Handle toggle request from title click or keyboard."""
@@ -285,6 +438,11 @@ class Collapsible(Widget):
         """Update collapsed state when reactive is changed."""
         self._title.collapsed = collapsed
         self.set_class(collapsed, "-collapsed")
+        if isinstance(self._content, LazyBody):
+            if collapsed:
+                self._clear_body()
+            else:
+                self._refresh_body()
         if self.is_mounted:
             self.call_after_refresh(self.scroll_visible)
 
@@ -292,6 +450,7 @@ class Collapsible(Widget):
         yield self._title
         with CollapsibleContents():
             yield self._content_widget
+            yield self._show_more
 
 
 class _HasQueryOne(Protocol):
@@ -15,16 +15,164 @@ Widget Hierarchy (within ConversationContainer):
         └── InfoStatusLine
 
 ScrollableContent handles:
-- Clearing dynamic content when conversation_id changes
+- Clearing dynamic content when conversation_id changes, keeping the transcript
+  of the conversation being left so that switching back restores it
 - Mounting InlineConfirmationPanel when pending_action_count becomes > 0
+- Virtualizing the transcript: only a window of conversation rows is mounted
 
 Message handling (UserInputSubmitted) is done by ConversationManager.
+
+Transcript virtualization:
+    Every conversation widget appended through `append_row()` becomes a
+    TranscriptRow. Only a contiguous window of at most MAX_MOUNTED_ROWS rows
+    is mounted; rows outside the window keep a factory that rebuilds their
+    widget when it is scrolled back into view. The window follows the end of
+    the transcript while new rows arrive, and slides by ROW_PAGE_SIZE rows
+    when the user scrolls near its top or bottom edge.
+
+Transcript snapshots:
+    When the conversation changes, the rows of the one being left are kept in
+    a TranscriptCache (widgets unmounted, factories kept) and restored when
+    the user switches back to it, instead of starting from an empty view. The
+    cache holds at most MAX_CACHED_TRANSCRIPTS conversations and
+    MAX_CACHED_ROWS rows in total; rows are what take memory here, as each
+    keeps the content of one conversation widget.
 """
 
 import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
+from textual.await_remove import AwaitRemove
 from textual.containers import VerticalScroll
 from textual.reactive import var
+from textual.widget import Widget
+
+from openhands_cli.tui.widgets.collapsible import Collapsible
+
+
+# Maximum number of transcript rows mounted at the same time
+MAX_MOUNTED_ROWS = 150
+# Number of rows mounted or unmounted at once when the window slides
+ROW_PAGE_SIZE = 30
+# Distance (in lines) from the edge of the mounted content that slides the window
+WINDOW_EDGE_MARGIN = 3
+# Maximum number of conversations whose transcript is kept after leaving them
+MAX_CACHED_TRANSCRIPTS = 4
+# Maximum number of rows kept across all cached transcripts
+MAX_CACHED_ROWS = 3000
+
+
+@dataclass(eq=False)
+class TranscriptRow:
+    """A conversation widget in the transcript, whether mounted or not.
+
+    Attributes:
+        build: Factory that recreates the widget once it has been unmounted,
+            or None if the widget can't be recreated (the row is then dropped).
+        widget: The mounted widget, or None while the row is outside the window.
+        origin: The collapsible originally appended. Producers may keep updating
+            it (e.g. when an observation arrives for an action) after the row
+            has been unmounted or rebuilt, so it is preferred while alive.
+        collapsed: Collapsed state to restore when a collapsible is rebuilt.
+    """
+
+    build: Callable[..., Widget] | None
+    widget: Widget | None = None
+    origin: weakref.ref[Collapsible] | None = None
+    collapsed: bool | None = None
+
+    def rebuild(self) -> Widget | None:
+        """Recreate the row's widget, or return None if it can't be rebuilt."""
+        origin = self.origin() if self.origin is not None else None
+        factory = origin.snapshot() if origin is not None else self.build
+        if factory is None:
+            return None
+        if self.collapsed is not None:
+            return factory(collapsed=self.collapsed)
+        return factory()
+
+    @property
+    def rebuildable(self) -> bool:
+        """Whether the row's widget can be recreated once it is unmounted."""
+        return self.build is not None or (
+            self.origin is not None and self.origin() is not None
+        )
+
+    def detach(self) -> Widget | None:
+        """Forget the row's widget, remembering how to rebuild it.
+
+        Returns:
+            The widget, which the caller is responsible for removing.
+        """
+        widget = self.widget
+        if widget is None:
+            return None
+        if isinstance(widget, Collapsible):
+            self.build = widget.snapshot()
+            self.collapsed = widget.collapsed
+        self.widget = None
+        return widget
+
+    def release(self) -> AwaitRemove | None:
+        """Unmount the row's widget, remembering how to rebuild it."""
+        widget = self.detach()
+        return widget.remove() if widget is not None else None
+
+
+class TranscriptCache:
+    """Unmounted transcripts of recently left conversations, least recent first.
+
+    Bounded both by conversation count and by total row count; when over the
+    row budget, the least recently left transcripts are dropped first, then
+    the oldest rows of the remaining one.
+    """
+
+    def __init__(self) -> None:
+        self._transcripts: OrderedDict[uuid.UUID, list[TranscriptRow]] = OrderedDict()
+        self._row_count = 0
+
+    def __contains__(self, conversation_id: uuid.UUID) -> bool:
+        return conversation_id in self._transcripts
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows kept across all transcripts."""
+        return self._row_count
+
+    def put(self, conversation_id: uuid.UUID, rows: list[TranscriptRow]) -> None:
+        """Keep a conversation's transcript, replacing any previous one.
+
+        Args:
+            conversation_id: The conversation the rows belong to.
+            rows: The transcript rows, all of them unmounted.
+        """
+        self.discard(conversation_id)
+        if not rows:
+            return
+
+        rows = rows[-MAX_CACHED_ROWS:]
+        self._transcripts[conversation_id] = rows
+        self._row_count += len(rows)
+        while len(self._transcripts) > MAX_CACHED_TRANSCRIPTS or (
+            self._row_count > MAX_CACHED_ROWS and len(self._transcripts) > 1
+        ):
+            _, dropped = self._transcripts.popitem(last=False)
+            self._row_count -= len(dropped)
+
+    def pop(self, conversation_id: uuid.UUID) -> list[TranscriptRow] | None:
+        """Take a conversation's transcript out of the cache, if it is kept."""
+        rows = self._transcripts.pop(conversation_id, None)
+        if rows is not None:
+            self._row_count -= len(rows)
+        return rows
+
+    def discard(self, conversation_id: uuid.UUID) -> None:
+        """Drop a conversation's transcript, if it is kept."""
+        self.pop(conversation_id)
 
 
 class ScrollableContent(VerticalScroll):
@@ -46,14 +194,240 @@ class ScrollableContent(VerticalScroll):
     conversation_id: var[uuid.UUID | None] = var(None)
     pending_action_count: var[int] = var(0)
 
+    def __init__(self, *children: Widget, **kwargs: Any) -> None:
+        super().__init__(*children, **kwargs)
+        self._rows: list[TranscriptRow] = []
+        # Mounted rows are self._rows[self._window_start:self._window_end]
+        self._window_start = 0
+        self._window_end = 0
+        self._rows_by_origin: weakref.WeakKeyDictionary[Collapsible, TranscriptRow] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._slide_scheduled = False
+        self._transcripts = TranscriptCache()
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the transcript, mounted or not."""
+        return len(self._rows)
+
+    @property
+    def mounted_row_count(self) -> int:
+        """Number of transcript rows currently mounted."""
+        return sum(1 for row in self._window if row.widget is not None)
+
+    @property
+    def _window(self) -> list[TranscriptRow]:
+        return self._rows[self._window_start : self._window_end]
+
+    def append_row(
+        self, widget: Widget, build: Callable[..., Widget] | None = None
+    ) -> None:
+        """Append a conversation widget to the end of the transcript.
+
+        Args:
+            widget: The widget to mount.
+            build: Factory that recreates the widget if it is unmounted and later
+                scrolled back into view. Collapsibles are recreated from their
+                current state, so they don't need one. Rows that can't be
+                recreated are dropped once they leave the mounted window.
+        """
+        if self._window_end < len(self._rows):
+            # New content always shows up at the end, so jump back to the tail.
+            self._reset_window_to_tail()
+
+        row = TranscriptRow(build=build, widget=widget)
+        if isinstance(widget, Collapsible):
+            row.origin = weakref.ref(widget)
+            self._rows_by_origin[widget] = row
+        self._rows.append(row)
+        self._window_end = len(self._rows)
+        self.mount(widget)
+
+        # Release a whole page at once so that appends stay cheap.
+        if self._window_end - self._window_start > MAX_MOUNTED_ROWS + ROW_PAGE_SIZE:
+            self._release_rows(self._window_start, self._window_start + ROW_PAGE_SIZE)
+            self._window_start += ROW_PAGE_SIZE
+
+    def sync_row(self, origin: Collapsible) -> None:
+        """Propagate updates of an appended collapsible to its rebuilt copy.
+
+        Args:
+            origin: The collapsible that was passed to `append_row()`.
+        """
+        row = self._rows_by_origin.get(origin)
+        if row is None:
+            return
+        if isinstance(row.widget, Collapsible) and row.widget is not origin:
+            row.widget.update_from(origin)
+
+    def set_unmounted_rows_collapsed(self, collapsed: bool) -> None:
+        """Set the collapsed state that unmounted collapsible rows are rebuilt with.
+
+        Args:
+            collapsed: Whether the rows should be collapsed.
+        """
+        for row in self._rows:
+            if row.widget is None and row.collapsed is not None:
+                row.collapsed = collapsed
+
+    def _release_rows(self, start: int, end: int) -> list[AwaitRemove]:
+        removals: list[AwaitRemove] = []
+        for row in self._rows[start:end]:
+            removal = row.release()
+            if removal is not None:
+                removals.append(removal)
+        return removals
+
+    def _rebuild_rows(self, start: int, end: int) -> list[Widget]:
+        widgets: list[Widget] = []
+        for row in self._rows[start:end]:
+            if row.widget is None:
+                row.widget = row.rebuild()
+            if row.widget is not None:
+                widgets.append(row.widget)
+        return widgets
+
+    def _reset_window_to_tail(self) -> None:
+        self._release_rows(self._window_start, self._window_end)
+        self._window_end = len(self._rows)
+        self._window_start = max(0, self._window_end - MAX_MOUNTED_ROWS)
+        widgets = self._rebuild_rows(self._window_start, self._window_end)
+        if widgets:
+            self.mount_all(widgets)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self._slide_scheduled or not self._rows:
+            return
+        near_top = new_value <= WINDOW_EDGE_MARGIN and self._window_start > 0
+        near_bottom = (
+            new_value >= self.max_scroll_y - WINDOW_EDGE_MARGIN
+            and self._window_end < len(self._rows)
+        )
+        if near_top or near_bottom:
+            self._slide_scheduled = True
+            self.call_after_refresh(self._slide_window)
+
+    async def _slide_window(self) -> None:
+        """Slide the mounted window by a page towards the edge being scrolled to.
+
+        The scroll offset is adjusted so that the content under the viewport
+        doesn't move when rows are mounted above it or released above it.
+        """
+        try:
+            if self.scroll_y <= WINDOW_EDGE_MARGIN and self._window_start > 0:
+                await self._slide_up()
+            elif (
+                self.scroll_y >= self.max_scroll_y - WINDOW_EDGE_MARGIN
+                and self._window_end < len(self._rows)
+            ):
+                await self._slide_down()
+        finally:
+            self._slide_scheduled = False
+
+    async def _slide_up(self) -> None:
+        anchor = next((row.widget for row in self._window if row.widget), None)
+        anchor_y = anchor.virtual_region.y if anchor is not None else 0
+        start = max(0, self._window_start - ROW_PAGE_SIZE)
+        widgets = self._rebuild_rows(start, self._window_start)
+        self._window_start = start
+        if widgets:
+            if anchor is not None:
+                await self.mount_all(widgets, before=anchor)
+            else:
+                await self.mount_all(widgets)
+
+        overflow = self._window_end - self._window_start - MAX_MOUNTED_ROWS
+        if overflow > 0:
+            for removal in self._release_rows(
+                self._window_end - overflow, self._window_end
+            ):
+                await removal
+            self._window_end -= overflow
+
+        if anchor is not None:
+            self._keep_in_place(anchor, anchor_y)
+
+    async def _slide_down(self) -> None:
+        last = next((row.widget for row in reversed(self._window) if row.widget), None)
+        end = min(len(self._rows), self._window_end + ROW_PAGE_SIZE)
+        widgets = self._rebuild_rows(self._window_end, end)
+        self._window_end = end
+        if widgets:
+            if last is not None:
+                await self.mount_all(widgets, after=last)
+            else:
+                await self.mount_all(widgets)
+
+        overflow = self._window_end - self._window_start - MAX_MOUNTED_ROWS
+        if overflow <= 0:
+            return
+        anchor = next(
+            (
+                row.widget
+                for row in self._rows[self._window_start + overflow : end]
+                if row.widget
+            ),
+            None,
+        )
+        anchor_y = anchor.virtual_region.y if anchor is not None else 0
+        for removal in self._release_rows(
+            self._window_start, self._window_start + overflow
+        ):
+            await removal
+        self._window_start += overflow
+        if anchor is not None:
+            self._keep_in_place(anchor, anchor_y)
+
+    def _keep_in_place(self, anchor: Widget, old_y: int) -> None:
+        """Scroll so that `anchor` stays where it was before the layout changed."""
+
+        def restore() -> None:
+            delta = anchor.virtual_region.y - old_y
+            if delta:
+                self.scroll_to(y=self.scroll_y + delta, animate=False)
+
+        self.call_after_refresh(restore)
+
+    def discard_transcript(self, conversation_id: uuid.UUID) -> None:
+        """Forget the kept transcript of a conversation that was left.
+
+        Called when the conversation's runner is evicted, so that switching
+        back to it starts from a fresh view like any unloaded conversation.
+        """
+        self._transcripts.discard(conversation_id)
+
+    def _detach_rows(self) -> list[TranscriptRow]:
+        """Take the transcript out of the view, leaving its widgets mounted."""
+        for row in self._window:
+            row.detach()
+        rows = [row for row in self._rows if row.rebuildable]
+        self._rows = []
+        self._rows_by_origin.clear()
+        self._window_start = self._window_end = 0
+        return rows
+
+    def _restore_rows(self, rows: list[TranscriptRow]) -> None:
+        self._rows = rows
+        for row in rows:
+            origin = row.origin() if row.origin is not None else None
+            if origin is not None:
+                self._rows_by_origin[origin] = row
+        self._reset_window_to_tail()
+        self.call_after_refresh(self.scroll_end, animate=False)
+
     def watch_conversation_id(
         self, old_id: uuid.UUID | None, new_id: uuid.UUID | None
     ) -> None:
-        """Clear dynamic content when conversation changes.
+        """Swap transcripts when the conversation changes.
 
         Clears dynamically added widgets (preserving SplashContent) when:
         - Switch starts: old_id=UUID -> new_id=None
         - New conversation: old_id=UUID -> new_id=different UUID
+
+        The transcript being cleared is kept, and restored when its
+        conversation becomes current again.
         """
         if old_id == new_id:
             return
@@ -63,11 +437,17 @@ class ScrollableContent(VerticalScroll):
 
         # Clear widgets when leaving a conversation (old_id was a valid UUID)
         if old_id is not None:
+            self._transcripts.put(old_id, self._detach_rows())
             for widget in list(self.children):
                 if widget.id != "splash_content":
                     widget.remove()
             self.scroll_home(animate=False)
 
+        if new_id is not None:
+            rows = self._transcripts.pop(new_id)
+            if rows:
+                self._restore_rows(rows)
+
     def watch_pending_action_count(self, old_count: int, new_count: int) -> None:
         """Mount InlineConfirmationPanel when pending_action_count becomes > 0.
 
@@ -3,13 +3,19 @@ Textual-compatible visualizer for OpenHands conversation events.
 This replaces the Rich-based CLIVisualizer with a Textual-compatible version.
 """
 
+import asyncio
+import contextvars
 import re
 import threading
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from rich.text import Text
-from textual.widgets import Markdown
+from textual.widgets import Markdown, Static
 
+from openhands.sdk import get_logger
 from openhands.sdk.conversation.visualizer.base import ConversationVisualizerBase
 from openhands.sdk.event import (
     ActionEvent,
@@ -23,6 +29,7 @@ from openhands.sdk.event import (
 from openhands.sdk.event.base import Event
 from openhands.sdk.event.condenser import Condensation, CondensationRequest
 from openhands.sdk.event.conversation_error import ConversationErrorEvent
+from openhands.sdk.llm.streaming import LLMStreamChunk
 from openhands.sdk.tool.builtins.finish import FinishAction
 from openhands.sdk.tool.builtins.think import ThinkAction
 from openhands.tools.delegate.definition import DelegateAction
@@ -34,7 +41,9 @@ from openhands_cli.stores import CliSettings
 from openhands_cli.theme import OPENHANDS_THEME
 from openhands_cli.tui.widgets.collapsible import (
     Collapsible,
+    LazyBody,
 )
+from openhands_cli.tui.widgets.main_display import ScrollableContent
 
 
 # Icons for different event types
@@ -49,6 +58,16 @@ ELLIPSIS = "..."
 # Default agent name - don't show prefix for this agent
 DEFAULT_AGENT_NAME = "OpenHands Agent"
 
+# Maximum number of trailing characters shown per section of the live cell
+LIVE_CELL_MAX_CHARS = 2_000
+
+# Delay (in seconds) before UI updates queued from other threads are applied,
+# so that updates arriving within the same frame are applied together
+UI_FLUSH_INTERVAL = 1 / 60
+
+
+logger = get_logger(__name__)
+
 
 if TYPE_CHECKING:
     from textual.containers import VerticalScroll
@@ -84,6 +103,117 @@ def _get_event_symbol_color(event: Event) -> str:
         return DEFAULT_COLOR
 
 
+@dataclass
+class _LiveStream:
+    """Trailing text of the LLM response currently being streamed."""
+
+    reasoning: str = ""
+    content: str = ""
+    # tool call index -> [tool name, trailing arguments]
+    tool_calls: dict[int, list[str]] = field(default_factory=dict)
+
+    def render(self) -> Text:
+        text = Text()
+        if self.reasoning:
+            text.append(self.reasoning, style="dim italic")
+        if self.content:
+            if text:
+                text.append("\n\n")
+            text.append(self.content)
+        for name, args in self.tool_calls.values():
+            if text:
+                text.append("\n\n")
+            text.append(name or "tool", style="bold")
+            if args:
+                text.append(f" {args}", style="dim")
+        return text
+
+
+class UIUpdateQueue:
+    """Thread-safe queue of UI updates, applied in batches on the main thread.
+
+    Updates submitted from the conversation thread are buffered and applied
+    together at most once per frame, instead of each paying for a blocking
+    `call_from_thread` round-trip and its own layout. Work that only needs to
+    happen once per batch (e.g. scrolling to the end) is registered with
+    `after_batch()`.
+
+    The queue must be created on the main thread. Updates can only be
+    submitted from other threads if it was created while the app's event loop
+    is running.
+    """
+
+    def __init__(self, app: "OpenHandsApp"):
+        self._app = app
+        # Store the main thread ID for thread safety checks
+        self._main_thread_id = threading.get_ident()
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        # Textual looks up the active app through context variables
+        self._context = contextvars.copy_context()
+        self._lock = threading.Lock()
+        self._pending: list[tuple[Callable[..., object], tuple[Any, ...]]] = []
+        self._flush_scheduled = False
+        self._in_batch = False
+        self._after_batch: dict[Callable[[], None], None] = {}
+
+    def submit(self, func: Callable[..., object], *args: Any) -> None:
+        """Run `func(*args)` on the main thread, batched with other updates."""
+        if threading.get_ident() == self._main_thread_id:
+            # Apply anything still queued first so updates stay in order.
+            self.flush()
+            self._apply([(func, args)])
+            return
+
+        with self._lock:
+            self._pending.append((func, args))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        if self._loop is None:
+            raise RuntimeError("UIUpdateQueue was created outside an event loop")
+        # Don't wait for the main thread, the conversation thread keeps going.
+        self._loop.call_soon_threadsafe(
+            self._schedule_flush, context=self._context.copy()
+        )
+
+    def after_batch(self, callback: Callable[[], None]) -> None:
+        """Run `callback` once after the batch being applied (main thread only).
+
+        Outside of a batch the callback runs immediately.
+        """
+        if self._in_batch:
+            self._after_batch[callback] = None
+        else:
+            callback()
+
+    def flush(self) -> None:
+        """Apply all queued updates (must be called from the main thread)."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._flush_scheduled = False
+        if batch:
+            self._apply(batch)
+
+    def _schedule_flush(self) -> None:
+        self._app.set_timer(UI_FLUSH_INTERVAL, self.flush)
+
+    def _apply(
+        self, batch: list[tuple[Callable[..., object], tuple[Any, ...]]]
+    ) -> None:
+        self._in_batch = True
+        try:
+            for func, args in batch:
+                func(*args)
+        finally:
+            self._in_batch = False
+            callbacks, self._after_batch = self._after_batch, {}
+            for callback in callbacks:
+                callback()
+
+
 class ConversationVisualizer(ConversationVisualizerBase):
     """Handles visualization of conversation events for Textual apps.
 
@@ -96,6 +226,7 @@ class ConversationVisualizer(ConversationVisualizerBase):
         container: "VerticalScroll",
         app: "OpenHandsApp",
         name: str | None = None,
+        update_queue: UIUpdateQueue | None = None,
     ):
         """Initialize the visualizer.
 
@@ -105,13 +236,19 @@ class ConversationVisualizer(ConversationVisualizerBase):
             skip_user_messages: If True, skip displaying user messages
             name: Agent name to display in panel titles for delegation context.
                   When set, titles will be prefixed with the agent name.
+            update_queue: Queue used to apply UI updates on the main thread.
+                  Sub-visualizers share their parent's queue to keep ordering.
         """
         super().__init__()
         self._container = container
         self._app = app
         self._name = name
-        # Store the main thread ID for thread safety checks
-        self._main_thread_id = threading.get_ident()
+        self._updates = update_queue or UIUpdateQueue(app)
+        # Token streaming state (see on_token)
+        self._stream_lock = threading.Lock()
+        self._stream: _LiveStream | None = None
+        self._stream_render_pending = False
+        self._live_cell: Static | None = None
         # Cache CLI settings to avoid repeated file system reads
         self._cli_settings: CliSettings | None = None
         # Track pending actions by tool_call_id for action-observation pairing
@@ -126,6 +263,13 @@ class ConversationVisualizer(ConversationVisualizerBase):
     def reload_configuration(self) -> None:
         self._cli_settings = CliSettings.load()
 
+    def release(self) -> None:
+        """Drop references to rendered widgets so they can be freed."""
+        with self._stream_lock:
+            self._stream = None
+            self._live_cell = None
+        self._pending_actions.clear()
+
     def create_sub_visualizer(self, agent_id: str) -> "ConversationVisualizer":
         """Create a visualizer for a sub-agent during delegation.
 
@@ -143,6 +287,7 @@ class ConversationVisualizer(ConversationVisualizerBase):
             container=self._container,
             app=self._app,
             name=agent_id,
+            update_queue=self._updates,
         )
 
     @staticmethod
@@ -230,11 +375,109 @@ class ConversationVisualizer(ConversationVisualizerBase):
         return ""
 
     def _run_on_main_thread(self, func, *args) -> None:
-        """Run a function on the main thread via call_from_thread if needed."""
-        if threading.get_ident() == self._main_thread_id:
-            func(*args)
+        """Run a function on the main thread, batched with other UI updates."""
+        self._updates.submit(func, *args)
+
+    def after_pending_updates(self, func: Callable[..., object], *args: Any) -> None:
+        """Run `func(*args)` on the main thread once queued UI updates are applied.
+
+        Use this for UI changes made outside the visualizer that must appear
+        after the events already rendered (e.g. the confirmation panel).
+        """
+        self._run_on_main_thread(func, *args)
+
+    def _scroll_to_end(self) -> None:
+        self._container.scroll_end(animate=False)
+
+    def on_token(self, chunk: LLMStreamChunk) -> None:
+        """Collect streamed LLM deltas and show them in a live cell.
+
+        Called from the conversation thread for every streamed chunk. Deltas
+        are accumulated and the live cell is re-rendered at most once per UI
+        batch; it is replaced by the final widgets when the resulting event
+        arrives (see on_event).
+        """
+        try:
+            with self._stream_lock:
+                if not self._append_stream_deltas(chunk):
+                    return
+                if self._stream_render_pending:
+                    return
+                self._stream_render_pending = True
+            self._run_on_main_thread(self._render_live_cell)
+        except Exception as e:
+            logger.warning("Error during token streaming: %s", e, exc_info=True)
+
+    def _append_stream_deltas(self, chunk: LLMStreamChunk) -> bool:
+        """Append the deltas of a chunk to the live stream (lock must be held).
+
+        Returns:
+            True if anything was appended.
+        """
+        changed = False
+        for choice in chunk.choices:
+            delta = getattr(choice, "delta", None)
+            # Only the first choice is displayed (standard streaming uses n=1)
+            if not delta or (getattr(choice, "index", 0) or 0) != 0:
+                continue
+            stream = self._stream = self._stream or _LiveStream()
+
+            reasoning = getattr(delta, "reasoning_content", None)
+            if isinstance(reasoning, str) and reasoning:
+                stream.reasoning = self._keep_tail(stream.reasoning + reasoning)
+                changed = True
+
+            content = getattr(delta, "content", None)
+            if isinstance(content, str) and content:
+                stream.content = self._keep_tail(stream.content + content)
+                changed = True
+
+            for tool_call in getattr(delta, "tool_calls", None) or []:
+                function = getattr(tool_call, "function", None)
+                if not function:
+                    continue
+                index = getattr(tool_call, "index", 0) or 0
+                entry = stream.tool_calls.setdefault(index, ["", ""])
+                name = getattr(function, "name", None)
+                if name:
+                    entry[0] = name
+                arguments = getattr(function, "arguments", None)
+                if arguments:
+                    entry[1] = self._keep_tail(entry[1] + arguments)
+                changed = changed or bool(name or arguments)
+        return changed
+
+    def _keep_tail(self, text: str) -> str:
+        return self._truncate_for_display(text, LIVE_CELL_MAX_CHARS, from_start=False)
+
+    def _render_live_cell(self) -> None:
+        """Show the streamed text in the live cell (must be called from main thread)."""
+        with self._stream_lock:
+            self._stream_render_pending = False
+            if self._stream is None:
+                return
+            renderable = self._stream.render()
+
+        if self._live_cell is None:
+            self._live_cell = Static(renderable, classes="live-stream")
+            self._container.mount(self._live_cell)
         else:
-            self._app.call_from_thread(func, *args)
+            self._live_cell.update(renderable)
+        self._updates.after_batch(self._scroll_to_end)
+
+    def _end_live_stream(self) -> None:
+        """Discard the streamed response once its final event has arrived."""
+        with self._stream_lock:
+            if self._stream is None:
+                return
+            self._stream = None
+        self._run_on_main_thread(self._remove_live_cell)
+
+    def _remove_live_cell(self) -> None:
+        """Remove the live cell (must be called from main thread)."""
+        if self._live_cell is not None:
+            self._live_cell.remove()
+            self._live_cell = None
 
     def _do_refresh_plan_panel(self) -> None:
         """Refresh the plan panel (must be called from main thread)."""
@@ -264,6 +507,17 @@ class ConversationVisualizer(ConversationVisualizerBase):
 
     def on_event(self, event: Event) -> None:
         """Main event handler that creates widgets for events."""
+        # The final event of a streamed response replaces its live cell
+        if isinstance(
+            event,
+            ActionEvent
+            | MessageEvent
+            | AgentErrorEvent
+            | ConversationErrorEvent
+            | PauseEvent,
+        ):
+            self._end_live_stream()
+
         # Check for TaskTrackerObservation to update/open the plan panel
         if isinstance(event, ObservationEvent) and isinstance(
             event.observation, TaskTrackerObservation
@@ -279,7 +533,14 @@ class ConversationVisualizer(ConversationVisualizerBase):
 
         widget = self._create_event_widget(event)
         if widget:
-            self._run_on_main_thread(self._add_widget_to_ui, widget)
+            # Collapsibles are rebuilt from their own state; other widgets
+            # are recreated from the event when scrolled back into view.
+            build = (
+                None
+                if isinstance(widget, Collapsible)
+                else partial(self._create_event_widget, event)
+            )
+            self._run_on_main_thread(self._add_widget_to_ui, widget, build)
 
             # Add critic collapsible if present (for MessageEvent and ActionEvent)
             critic_result = getattr(event, "critic_result", None)
@@ -314,11 +575,22 @@ class ConversationVisualizer(ConversationVisualizerBase):
                 )
                 self._run_on_main_thread(self._add_widget_to_ui, feedback_widget)
 
-    def _add_widget_to_ui(self, widget: "Widget") -> None:
-        """Add a widget to the UI (must be called from main thread)."""
-        self._container.mount(widget)
+    def _add_widget_to_ui(
+        self, widget: "Widget", build: "Callable[[], Widget] | None" = None
+    ) -> None:
+        """Add a widget to the UI (must be called from main thread).
+
+        Args:
+            widget: The widget to add.
+            build: Factory that recreates the widget when the transcript is
+                virtualized (see ScrollableContent.append_row).
+        """
+        if isinstance(self._container, ScrollableContent):
+            self._container.append_row(widget, build)
+        else:
+            self._container.mount(widget)
         # Automatically scroll to the bottom to show the newly added widget
-        self._container.scroll_end(animate=False)
+        self._updates.after_batch(self._scroll_to_end)
 
     def render_user_message(self, content: str) -> None:
         """Render a user message to the UI.
@@ -336,18 +608,18 @@ class ConversationVisualizer(ConversationVisualizerBase):
         for widget in self._container.query(CriticFeedbackWidget):
             widget.remove()
 
-        user_message_widget = Static(
-            f"> {content}", classes="user-message", markup=False
-        )
-        self._run_on_main_thread(self._add_widget_to_ui, user_message_widget)
+        build = partial(Static, f"> {content}", classes="user-message", markup=False)
+        self._run_on_main_thread(self._add_widget_to_ui, build(), build)
 
     def _update_widget_in_ui(
-        self, collapsible: Collapsible, new_title: str, new_content: str
+        self, collapsible: Collapsible, new_title: str, new_content: LazyBody
     ) -> None:
         """Update an existing widget in the UI (must be called from main thread)."""
         collapsible.update_title(new_title)
         collapsible.update_content(new_content)
-        self._container.scroll_end(animate=False)
+        if isinstance(self._container, ScrollableContent):
+            self._container.sync_row(collapsible)
+        self._updates.after_batch(self._scroll_to_end)
 
     def _handle_observation_event(
         self, event: ObservationEvent | UserRejectObservation | AgentErrorEvent
@@ -370,8 +642,8 @@ class ConversationVisualizer(ConversationVisualizerBase):
         new_title = self._build_action_title(action_event)
         new_title = f"{new_title} {status_icon}"
 
-        # Build the new content (observation result only)
-        new_content = self._build_observation_content(event)
+        # Build the new content (observation result only) once it is displayed
+        new_content = LazyBody(partial(self._build_observation_content, event))
 
         self._run_on_main_thread(
             self._update_widget_in_ui, collapsible, new_title, new_content
@@ -585,7 +857,7 @@ class ConversationVisualizer(ConversationVisualizerBase):
 
     def _make_collapsible(
         self,
-        content: str | Text,
+        content: str | Text | LazyBody,
         title: str,
         event: Event | None = None,
         collapsed: bool | None = None,
@@ -593,7 +865,7 @@ class ConversationVisualizer(ConversationVisualizerBase):
         """Create a Collapsible widget with standard settings.
 
         Args:
-            content: The content to display (string or Rich Text object).
+            content: The content to display (string, Rich Text or LazyBody).
             title: The title for the collapsible header.
             event: The event used to determine symbol color (None for default).
             collapsed: Override the default collapsed state. If None, uses default.
@@ -626,7 +898,7 @@ class ConversationVisualizer(ConversationVisualizerBase):
             A Collapsible widget showing the system prompt
         """
         # Build the collapsible content - show system prompt like ACP does
-        content = str(event.visualize.plain)
+        content = LazyBody(lambda: str(event.visualize.plain))
 
         # Get tool count for title
         tool_count = len(event.tools) if event.tools else 0
@@ -638,8 +910,6 @@ class ConversationVisualizer(ConversationVisualizerBase):
 
     def _create_event_widget(self, event: Event) -> "Widget | None":
         """Create a widget for the event - either plain text or collapsible."""
-        content = event.visualize
-
         # Handle SystemPromptEvent - create a collapsible showing the system prompt
         # Note: Loaded resources (skills, hooks, tools, MCPs) are displayed at startup
         # in _initialize_main_ui(). This collapsible shows the full system prompt.
@@ -684,7 +954,7 @@ class ConversationVisualizer(ConversationVisualizerBase):
             # Format with arrow notation showing sender → receiver
             # Only show prefix if this is NOT the default main agent
             if event.sender and self._is_non_default_agent():
-                message_content = str(content)
+                message_content = str(event.visualize)
                 agent_name = self._get_formatted_agent_name()
                 event_sender = self._format_agent_name_with_suffix(event.sender)
 
@@ -704,7 +974,7 @@ class ConversationVisualizer(ConversationVisualizerBase):
             # This is the normal case for agent responses in the main conversation
             # Fixes GitHub issue #399: Agent MessageEvents were being silently dropped
             if self._name and event.llm_message.role == "assistant":
-                widget = Markdown(str(content))
+                widget = Markdown(str(event.visualize))
                 widget.styles.padding = AGENT_MESSAGE_PADDING
                 return widget
 
@@ -722,10 +992,13 @@ class ConversationVisualizer(ConversationVisualizerBase):
         When in delegation context (self._name is set), titles are prefixed
         with the agent name (e.g., "Lodging Expert Agent Observation").
         """
-        # Use the event's visualize property for content
-        content = event.visualize
-
-        if not content.plain.strip():
+        # Skip observations with nothing to show (e.g. finish and think results).
+        # Every other event type always renders a header, so its visualization
+        # is only built once the cell is expanded (see _lazy_event_body).
+        if (
+            isinstance(event, ObservationEvent)
+            and not event.observation.visualize.plain.strip()
+        ):
             return None
 
         agent_prefix = self._get_agent_prefix()
@@ -736,10 +1009,10 @@ class ConversationVisualizer(ConversationVisualizerBase):
         elif isinstance(event, ActionEvent):
             # Build title using new format with agent prefix
             title = self._build_action_title(event)
-            content_string = self._escape_rich_markup(str(content))
-
             # Action events default to collapsed since we have summary in title
-            collapsible = self._make_collapsible(content_string, title, event)
+            collapsible = self._make_collapsible(
+                self._lazy_event_body(event), title, event
+            )
 
             # Store for pairing with observation
             self._pending_actions[event.tool_call_id] = (event, collapsible)
@@ -750,44 +1023,53 @@ class ConversationVisualizer(ConversationVisualizerBase):
             # (shouldn't happen normally, but handle gracefully)
             title = self._extract_meaningful_title(event, "Observation")
             return self._make_collapsible(
-                self._escape_rich_markup(str(content)), f"{agent_prefix}{title}", event
+                self._lazy_event_body(event), f"{agent_prefix}{title}", event
             )
         elif isinstance(event, UserRejectObservation):
             title = self._extract_meaningful_title(event, "User Rejected Action")
             return self._make_collapsible(
-                self._escape_rich_markup(str(content)), f"{agent_prefix}{title}", event
+                self._lazy_event_body(event), f"{agent_prefix}{title}", event
             )
         elif isinstance(event, AgentErrorEvent):
             title = self._extract_meaningful_title(event, "Agent Error")
-            content_string = self._escape_rich_markup(str(content))
             return self._make_collapsible(
-                content_string, f"{agent_prefix}{title}", event
+                self._lazy_event_body(event), f"{agent_prefix}{title}", event
             )
         elif isinstance(event, ConversationErrorEvent):
             title = self._extract_meaningful_title(event, "Conversation Error")
-            content_string = self._escape_rich_markup(str(content))
             return self._make_collapsible(
-                content_string, f"{agent_prefix}{title}", event
+                self._lazy_event_body(event), f"{agent_prefix}{title}", event
             )
         elif isinstance(event, PauseEvent):
             title = self._extract_meaningful_title(event, "User Paused")
             return self._make_collapsible(
-                self._escape_rich_markup(str(content)), f"{agent_prefix}{title}", event
+                self._lazy_event_body(event), f"{agent_prefix}{title}", event
             )
         elif isinstance(event, Condensation):
             title = self._extract_meaningful_title(event, "Condensation")
-            content_string = self._escape_rich_markup(str(content))
             return self._make_collapsible(
-                content_string, f"{agent_prefix}{title}", event
+                self._lazy_event_body(event), f"{agent_prefix}{title}", event
             )
         else:
             # Fallback for unknown event types
             title = self._extract_meaningful_title(
                 event, f"UNKNOWN Event: {event.__class__.__name__}"
             )
-            content_string = (
-                f"{self._escape_rich_markup(str(content))}\n\nSource: {event.source}"
-            )
             return self._make_collapsible(
-                content_string, f"{agent_prefix}{title}", event
+                self._lazy_event_body(event, footer=f"\n\nSource: {event.source}"),
+                f"{agent_prefix}{title}",
+                event,
             )
+
+    def _lazy_event_body(self, event: Event, footer: str = "") -> LazyBody:
+        """Defer rendering an event's content until its cell is expanded.
+
+        Args:
+            event: The event whose visualization is the body.
+            footer: Text appended after the escaped content.
+        """
+
+        def render() -> str:
+            return self._escape_rich_markup(str(event.visualize)) + footer
+
+        return LazyBody(render)
@@ -29,6 +29,7 @@ class WorkingStatusLine(Static):
     """
 
     running: var[bool] = var(False)
+    initializing: var[bool] = var(False)
     elapsed_seconds: var[int] = var(0)
 
     def __init__(self, **kwargs) -> None:
@@ -54,22 +55,28 @@ class WorkingStatusLine(Static):
         """React to running state changes from ConversationContainer."""
         self._update_text()
 
+    def watch_initializing(self, _initializing: bool) -> None:
+        """React to the conversation runner starting or finishing setup."""
+        self._update_text()
+
     # ----- Internal helpers -----
 
     def _on_tick(self) -> None:
         """Periodic update for animation."""
-        if self.running:
+        if self.running or self.initializing:
             self._working_frame = (self._working_frame + 1) % 8
             self._update_text()
 
     def _get_working_text(self) -> str:
-        """Return working status text if conversation is running."""
-        if not self.running:
-            return ""
-
+        """Return working status text if conversation is running or initializing."""
         # Add working indicator with Braille spinner animation
         frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧"]
-        working_indicator = f"{frames[self._working_frame % len(frames)]} Working"
+        frame = frames[self._working_frame % len(frames)]
+
+        if not self.running:
+            return f"{frame} Initializing agent..." if self.initializing else ""
+
+        working_indicator = f"{frame} Working"
 
         return f"{working_indicator} ({self.elapsed_seconds}s • ESC: pause)"
 
@@ -1,25 +1,22 @@
 """Utility functions for LLM configuration in OpenHands CLI."""
 
+from __future__ import annotations
+
 import json
 import os
 import platform
 import re
 from argparse import Namespace
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from prompt_toolkit import print_formatted_text
-from prompt_toolkit.formatted_text import HTML
 
-from openhands.sdk import LLM, Agent, ImageContent, TextContent
-from openhands.sdk.event import SystemPromptEvent
-from openhands.sdk.event.base import Event
-from openhands.sdk.tool import Tool
-from openhands.tools.delegate import DelegateTool
-from openhands.tools.file_editor import FileEditorTool
-from openhands.tools.preset.default import get_default_condenser
-from openhands.tools.task_tracker import TaskTrackerTool
-from openhands.tools.terminal import TerminalTool
+# The SDK and tool packages are imported where they are used, so importing
+# this module (e.g. for the number formatting helpers) stays cheap.
+if TYPE_CHECKING:
+    from openhands.sdk import LLM, Agent, ImageContent, TextContent
+    from openhands.sdk.event.base import Event
+    from openhands.sdk.tool import Tool
 
 
 def abbreviate_number(n: int | float) -> str:
@@ -162,6 +159,12 @@ def get_llm_metadata(
 
 def get_default_cli_tools() -> list[Tool]:
     """Get the default tool specifications for CLI mode (browser disabled)."""
+    from openhands.sdk.tool import Tool
+    from openhands.tools.delegate import DelegateTool
+    from openhands.tools.file_editor import FileEditorTool
+    from openhands.tools.task_tracker import TaskTrackerTool
+    from openhands.tools.terminal import TerminalTool
+
     return [
         Tool(name=TerminalTool.name),
         Tool(name=FileEditorTool.name),
@@ -172,6 +175,9 @@ def get_default_cli_tools() -> list[Tool]:
 
 def get_default_cli_agent(llm: LLM) -> Agent:
     """Create the default CLI agent with all tools (browser disabled)."""
+    from openhands.sdk import Agent
+    from openhands.tools.preset.default import get_default_condenser
+
     return Agent(
         llm=llm,
         tools=get_default_cli_tools(),
@@ -195,6 +201,9 @@ def create_seeded_instructions_from_args(args: Namespace) -> list[str] | None:
         try:
             content = path.read_text(encoding="utf-8")
         except OSError as exc:
+            from prompt_toolkit import print_formatted_text
+            from prompt_toolkit.formatted_text import HTML
+
             print_formatted_text(HTML(f"<red>Failed to read file {path}: {exc}</red>"))
             raise SystemExit(1)
 
@@ -225,6 +234,7 @@ def extract_text_from_message_content(
     Returns:
         The text content of first TextContent block, None otherwise
     """
+    from openhands.sdk import TextContent
 
     if len(message_content) == 0:
         return None
@@ -241,6 +251,8 @@ def extract_text_from_message_content(
 
 
 def json_callback(event: Event) -> None:
+    from openhands.sdk.event import SystemPromptEvent
+
     if isinstance(event, SystemPromptEvent):
         return
 
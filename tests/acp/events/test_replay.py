@@ -0,0 +1,89 @@
+"""Tests for bulk history replay (replay_history)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from acp.schema import AgentMessageChunk, AgentThoughtChunk
+
+from openhands.sdk import Message, TextContent
+from openhands.sdk.event.llm_convertible.message import MessageEvent
+from openhands_cli.acp_impl.events.replay import find_tail_start, replay_history
+
+
+def _user(text: str) -> MessageEvent:
+    return MessageEvent(
+        source="user",
+        llm_message=Message(role="user", content=[TextContent(text=text)]),
+    )
+
+
+def _agent(text: str) -> MessageEvent:
+    return MessageEvent(
+        source="agent",
+        llm_message=Message(role="assistant", content=[TextContent(text=text)]),
+    )
+
+
+def _sent(conn) -> list:
+    return [call.kwargs["update"] for call in conn.session_update.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_replay_sends_all_updates_in_order_with_metadata_once():
+    conn = AsyncMock()
+    events = [_user("hi")] + [_agent(f"answer {i}") for i in range(5)]
+    meta = {"openhands.dev/metrics": {"input_tokens": 1}}
+
+    with patch(
+        "openhands_cli.acp_impl.events.replay.get_metadata", return_value=meta
+    ) as mock_meta:
+        sent = await replay_history("session", conn, events, MagicMock(), batch_size=2)
+
+    mock_meta.assert_called_once()
+    updates = _sent(conn)
+    # User messages are not echoed back to the client
+    assert sent == len(updates) == 5
+    assert all(isinstance(u, AgentMessageChunk) for u in updates)
+    for i, update in enumerate(updates):
+        assert f"answer {i}" in update.content.text
+
+    metas = [call.kwargs["field_meta"] for call in conn.session_update.call_args_list]
+    assert metas == [None] * 4 + [meta]
+
+
+@pytest.mark.asyncio
+async def test_replay_last_turns_sends_summary_and_tail():
+    conn = AsyncMock()
+    events = [
+        _user("one"),
+        _agent("first"),
+        _user("two"),
+        _agent("second"),
+        _user("three"),
+        _agent("third"),
+    ]
+
+    await replay_history("session", conn, events, last_turns=2)
+
+    updates = _sent(conn)
+    assert isinstance(updates[0], AgentThoughtChunk)
+    assert "2 earlier event(s) not shown" in updates[0].content.text
+    assert len(updates) == 3
+    assert "second" in updates[1].content.text
+    assert "third" in updates[2].content.text
+
+
+@pytest.mark.asyncio
+async def test_replay_of_empty_history_sends_nothing():
+    conn = AsyncMock()
+    assert await replay_history("session", conn, []) == 0
+    conn.session_update.assert_not_called()
+
+
+def test_find_tail_start():
+    events = [_user("a"), _agent("b"), _user("c"), _agent("d")]
+    assert find_tail_start(events, 1) == 2
+    assert find_tail_start(events, 2) == 0
+    assert find_tail_start(events, 5) == 0
@@ -0,0 +1,92 @@
+"""Tests for StreamingArgsParser (incremental tool-call argument parsing)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from openhands_cli.acp_impl.events.streaming_args import StreamingArgsParser
+
+
+DOCUMENT = {
+    "command": "create",
+    "path": '/tmp/a "quoted" name.py',
+    "file_text": "line\n\ttab \\ é 😀 end\n" * 20,
+    "count": 42,
+    "flag": True,
+    "ids": ["agent1", "b],c"],
+    "tasks": {"agent1": {"nested": ["}", 1]}},
+}
+
+
+def _feed_in_chunks(text: str, size: int) -> StreamingArgsParser:
+    parser = StreamingArgsParser()
+    for start in range(0, len(text), size):
+        parser.feed(text[start : start + size])
+    return parser
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_chunked_parse_matches_json_loads(ensure_ascii: bool, size: int):
+    text = json.dumps(DOCUMENT, ensure_ascii=ensure_ascii)
+    parser = _feed_in_chunks(text, size)
+
+    for key, value in DOCUMENT.items():
+        assert parser.get(key) == value
+
+
+def test_partial_string_value_is_exposed():
+    parser = StreamingArgsParser()
+    parser.feed('{"command":"')
+    assert parser.get("command") == ""
+    assert parser.has_content() is False
+
+    parser.feed("ls -")
+    assert parser.get("command") == "ls -"
+    assert parser.has_content() is True
+
+
+def test_incomplete_key_is_not_exposed():
+    parser = StreamingArgsParser()
+    parser.feed('{"comm')
+    assert parser.is_empty
+    assert parser.get("comm") is None
+
+
+def test_partial_array_is_best_effort_completed():
+    parser = StreamingArgsParser()
+    parser.feed('{"ids":["agent1"')
+    assert parser.get("ids") == ["agent1"]
+
+    parser.feed(',"agent2"]}')
+    assert parser.get("ids") == ["agent1", "agent2"]
+
+
+def test_text_since_returns_only_new_text():
+    parser = StreamingArgsParser()
+    parser.feed('{"thought":"hel')
+    parser.feed("lo wor")
+    parser.feed('ld"}')
+
+    assert parser.text_length("thought") == 11
+    assert parser.text_since("thought", 0) == "hello world"
+    assert parser.text_since("thought", 3) == "lo world"
+    assert parser.text_since("thought", 11) == ""
+
+
+def test_surrogate_pair_split_across_chunks():
+    parser = StreamingArgsParser()
+    parser.feed('{"text":"\\ud83d')
+    assert parser.get("text") == ""
+
+    parser.feed('\\ude00"}')
+    assert parser.get("text") == "😀"
+
+
+def test_non_object_arguments_expose_nothing():
+    parser = StreamingArgsParser()
+    parser.feed('["command", "ls"]')
+    assert parser.is_empty
+    assert parser.has_content() is False
@@ -619,6 +619,43 @@ class TestToolCallStreaming:
         assert state.started is False
         assert mock_connection.session_update.call_count == 0
 
+    def test_argument_snapshots_are_throttled(self, mock_connection, event_loop):
+        """Progress snapshots are sent at most once per update interval."""
+        first = _tool_call(
+            index=0,
+            tool_call_id="call-big",
+            name="file_editor",
+            arguments='{"command":"create","path":"/a.py","file_text":"',
+        )
+        rest = [
+            _tool_call(index=0, tool_call_id=None, name=None, arguments="x" * 100)
+            for _ in range(50)
+        ]
+        times = iter([0.0] + [0.01] * 49 + [1.0])
+        token_subscriber = TokenBasedEventSubscriber(
+            session_id="test-session",
+            conn=mock_connection,
+            loop=event_loop,
+            clock=lambda: next(times),
+        )
+
+        with patch.object(event_loop, "is_running", return_value=False):
+            token_subscriber.on_token(_chunk(tool_calls=[first]))
+            assert mock_connection.session_update.call_count == 2  # start + progress
+
+            for tool_call in rest[:-1]:
+                token_subscriber.on_token(_chunk(tool_calls=[tool_call]))
+            assert mock_connection.session_update.call_count == 2
+
+            token_subscriber.on_token(_chunk(tool_calls=[rest[-1]]))
+
+        assert mock_connection.session_update.call_count == 3
+        last = mock_connection.session_update.call_args.kwargs["update"]
+        assert isinstance(last, ToolCallProgress)
+        assert last.title == "Editing /a.py"
+        state = token_subscriber._streaming_tool_calls[0]
+        assert state.parsed_args.text_length("file_text") == 5000
+
 
 class TestErrorHandling:
     def test_on_token_logs_and_continues_on_error(self, token_subscriber, caplog):
@@ -670,6 +707,31 @@ class TestScheduleUpdate:
 
         loop.close()
 
+    def test_token_deltas_are_batched_into_one_update(self, mock_connection):
+        loop = asyncio.new_event_loop()
+        subscriber = TokenBasedEventSubscriber(
+            session_id="test-session",
+            conn=mock_connection,
+            loop=loop,
+        )
+
+        with patch.object(loop, "is_running", return_value=True):
+            with patch("asyncio.run_coroutine_threadsafe") as mock_rcts:
+                for token in ["Hel", "lo", "!"]:
+                    subscriber.on_token(_chunk(content=token))
+                # A single delayed flush is scheduled for the whole batch
+                mock_rcts.assert_called_once()
+                mock_rcts.call_args.args[0].close()
+
+        assert mock_connection.session_update.call_count == 0
+        loop.run_until_complete(subscriber.flush_updates())
+        loop.close()
+
+        assert mock_connection.session_update.call_count == 1
+        update = mock_connection.session_update.call_args.kwargs["update"]
+        assert isinstance(update, AgentMessageChunk)
+        assert update.content.text == "Hello!"
+
 
 def test_terminal_tool_lifecycle_stream_then_action_then_observation(
     mock_connection, event_loop
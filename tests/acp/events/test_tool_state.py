@@ -36,38 +36,28 @@ class TestExtractThoughtPiece:
         state.append_args('{"thought":"hi"}')
         assert state.extract_thought_piece() is None
 
-    def test_parse_error_returns_none_and_does_not_update_prev(
-        self, monkeypatch: pytest.MonkeyPatch
-    ):
+    def test_invalid_args_return_none(self):
         state = ToolCallState("call-1", "think")
-        state.append_args('{"thought":"hi"}')
-
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: "{not json")
+        state.append_args('["thought","hi"]')
 
         assert state.extract_thought_piece() is None
-        assert state.prev_emitted_thought_chunk == ""
+        assert state.emitted_thought_length == 0
 
-    def test_missing_thought_key_returns_none(self, monkeypatch: pytest.MonkeyPatch):
+    def test_missing_thought_key_returns_none(self):
         state = ToolCallState("call-1", "think")
         state.append_args('{"other":"x"}')
 
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: '{"other":"x"}')
-
         assert state.extract_thought_piece() is None
-        assert state.prev_emitted_thought_chunk == ""
+        assert state.emitted_thought_length == 0
 
-    def test_empty_thought_returns_none(self, monkeypatch: pytest.MonkeyPatch):
+    def test_empty_thought_returns_none(self):
         state = ToolCallState("call-1", "think")
         state.append_args('{"thought":""}')
 
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: '{"thought":""}')
-
         assert state.extract_thought_piece() is None
-        assert state.prev_emitted_thought_chunk == ""
+        assert state.emitted_thought_length == 0
 
-    def test_incremental_diff_emits_only_new_suffix(
-        self, monkeypatch: pytest.MonkeyPatch
-    ):
+    def test_incremental_diff_emits_only_new_suffix(self):
         """Monotonic growth contract with header on first delta only.
 
         - thought grows: "" -> "hel" -> "hello" -> "hello world"
@@ -76,53 +66,44 @@ class TestExtractThoughtPiece:
         """
         state = ToolCallState("call-1", "think")
 
-        # Deterministic snapshots from best-effort parse after each append.
-        snapshots = iter(
-            [
-                '{"thought":"hel"}',
-                '{"thought":"hello"}',
-                '{"thought":"hello world"}',
-            ]
-        )
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: next(snapshots))
-
         state.append_args('{"thought":"hel')
         out1 = state.extract_thought_piece()
         assert out1 == THOUGHT_HEADER + "hel"
-        assert state.prev_emitted_thought_chunk == "hel"
+        assert state.emitted_thought_length == 3
         assert state.thought_header_emitted is True
 
-        state.append_args('lo"}')
+        state.append_args("lo")
         out2 = state.extract_thought_piece()
         assert out2 == "lo"
-        assert state.prev_emitted_thought_chunk == "hello"
+        assert state.emitted_thought_length == 5
 
         state.append_args(' world"}')
         out3 = state.extract_thought_piece()
         assert out3 == " world"
-        assert state.prev_emitted_thought_chunk == "hello world"
+        assert state.emitted_thought_length == 11
 
-    def test_no_delta_when_thought_unchanged(self, monkeypatch: pytest.MonkeyPatch):
+    def test_no_delta_when_thought_unchanged(self):
         state = ToolCallState("call-1", "think")
 
-        snapshots = iter(
-            [
-                '{"thought":"hello"}',
-                '{"thought":"hello"}',
-            ]
-        )
-        monkeypatch.setattr(state.lexer, "complete_json", lambda: next(snapshots))
-
         state.append_args('{"thought":"hello"}')
         out = state.extract_thought_piece()
         assert out == THOUGHT_HEADER + "hello"
-        assert state.prev_emitted_thought_chunk == "hello"
+        assert state.emitted_thought_length == 5
 
         # args can still "grow" by appending irrelevant tokens; thought
         # stays same => no delta
         state.append_args("   ")
         assert state.extract_thought_piece() is None
-        assert state.prev_emitted_thought_chunk == "hello"
+        assert state.emitted_thought_length == 5
+
+    def test_escape_split_across_chunks(self):
+        state = ToolCallState("call-1", "think")
+
+        state.append_args('{"thought":"a\\')
+        assert state.extract_thought_piece() == THOUGHT_HEADER + "a"
+
+        state.append_args('nb"}')
+        assert state.extract_thought_piece() == "\nb"
 
 
 class TestHasValidSkeleton:
@@ -142,7 +123,6 @@ class TestHasValidSkeleton:
     def test_key_with_null_value_not_valid(self):
         """Key with null value doesn't count as content."""
         state = ToolCallState("call-1", "terminal")
-        # Lexer completes '{"' to '{"":null}'
         state.append_args('{"')
         assert state.has_valid_skeleton is False
 
@@ -178,7 +158,7 @@ class TestHasValidSkeleton:
         state.append_args("{")
         assert state.has_valid_skeleton is False
 
-        # Start a key - lexer completes to null value
+        # Start a key - no value yet
         state = ToolCallState("call-2", "terminal")
         state.append_args('{"comm')
         assert state.has_valid_skeleton is False  # {"comm":null}
@@ -0,0 +1,170 @@
+"""Tests for SessionUpdateScheduler (batched, coalesced ACP session updates)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from acp import (
+    start_tool_call,
+    update_agent_message_text,
+    update_agent_thought_text,
+    update_tool_call,
+)
+from acp.schema import AgentMessageChunk, AgentThoughtChunk, ToolCallProgress
+
+from openhands_cli.acp_impl.events.update_scheduler import SessionUpdateScheduler
+
+
+def _scheduler(conn, loop=None, **kwargs) -> SessionUpdateScheduler:
+    return SessionUpdateScheduler(
+        session_id="test-session",
+        conn=conn,
+        loop=loop or asyncio.get_running_loop(),
+        **kwargs,
+    )
+
+
+def _sent_updates(conn) -> list:
+    return [call.kwargs["update"] for call in conn.session_update.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_consecutive_text_chunks_are_merged():
+    conn = AsyncMock()
+    scheduler = _scheduler(conn, flush_interval=10)
+
+    for token in ["Hel", "lo", " world"]:
+        scheduler.submit(update_agent_message_text(token))
+    scheduler.submit(update_agent_thought_text("hmm"))
+    scheduler.submit(update_agent_thought_text("..."))
+    scheduler.submit(update_agent_message_text("!"))
+    assert conn.session_update.call_count == 0
+
+    await scheduler.flush()
+
+    updates = _sent_updates(conn)
+    assert [type(u) for u in updates] == [
+        AgentMessageChunk,
+        AgentThoughtChunk,
+        AgentMessageChunk,
+    ]
+    assert [u.content.text for u in updates] == ["Hello world", "hmm...", "!"]
+
+
+@pytest.mark.asyncio
+async def test_tool_call_updates_for_same_id_collapse():
+    conn = AsyncMock()
+    scheduler = _scheduler(conn, flush_interval=10)
+
+    scheduler.submit(start_tool_call(tool_call_id="call-1", title="ls", kind="execute"))
+    scheduler.submit(update_tool_call(tool_call_id="call-1", title="ls -"))
+    scheduler.submit(update_tool_call(tool_call_id="call-2", title="cat"))
+    scheduler.submit(update_tool_call(tool_call_id="call-1", title="ls -la"))
+
+    await scheduler.flush()
+
+    updates = _sent_updates(conn)
+    assert len(updates) == 3
+    progress = [u for u in updates if isinstance(u, ToolCallProgress)]
+    assert [(u.tool_call_id, u.title) for u in progress] == [
+        ("call-1", "ls -la"),
+        ("call-2", "cat"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_metadata_is_computed_once_per_flush():
+    conn = AsyncMock()
+    get_metadata = MagicMock(return_value={"openhands.dev/metrics": {}})
+    scheduler = _scheduler(conn, flush_interval=10, get_metadata=get_metadata)
+
+    scheduler.submit(update_agent_message_text("a"))
+    scheduler.submit(update_agent_thought_text("b"))
+    await scheduler.flush()
+
+    get_metadata.assert_called_once()
+    metas = [call.kwargs["field_meta"] for call in conn.session_update.call_args_list]
+    assert metas == [None, {"openhands.dev/metrics": {}}]
+
+
+@pytest.mark.asyncio
+async def test_interval_flush_sends_batch():
+    conn = AsyncMock()
+    scheduler = _scheduler(conn, flush_interval=0.01)
+
+    scheduler.submit(update_agent_message_text("a"))
+    scheduler.submit(update_agent_message_text("b"))
+    await asyncio.sleep(0.05)
+
+    assert conn.session_update.call_count == 1
+    assert _sent_updates(conn)[0].content.text == "ab"
+
+
+@pytest.mark.asyncio
+async def test_size_threshold_flushes_early():
+    conn = AsyncMock()
+    scheduler = _scheduler(conn, flush_interval=10, flush_chars=8)
+
+    scheduler.submit(update_agent_message_text("1234"))
+    await asyncio.sleep(0.01)
+    assert conn.session_update.call_count == 0
+
+    scheduler.submit(update_agent_message_text("5678"))
+    await asyncio.sleep(0.01)
+    assert conn.session_update.call_count == 1
+    assert _sent_updates(conn)[0].content.text == "12345678"
+
+
+def test_updates_are_sent_immediately_when_loop_is_not_running():
+    conn = AsyncMock()
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = _scheduler(conn, loop=loop)
+        scheduler.submit(update_agent_message_text("a"))
+        scheduler.submit(update_agent_message_text("b"))
+    finally:
+        loop.close()
+
+    assert [u.content.text for u in _sent_updates(conn)] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_merges_thoughts_into_latest_thought():
+    conn = AsyncMock()
+    scheduler = _scheduler(conn, flush_interval=10, max_pending=2)
+
+    scheduler.submit(update_agent_thought_text("t1"))
+    scheduler.submit(update_agent_message_text("a"))
+    scheduler.submit(update_agent_thought_text("t2"))
+    await scheduler.flush()
+
+    assert [u.content.text for u in _sent_updates(conn)] == ["t1t2", "a"]
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_drops_thoughts_without_a_buffered_thought():
+    conn = AsyncMock()
+    scheduler = _scheduler(conn, flush_interval=10, max_pending=1)
+
+    scheduler.submit(update_agent_message_text("a"))
+    scheduler.submit(update_agent_thought_text("dropped"))
+    await scheduler.flush()
+
+    assert [u.content.text for u in _sent_updates(conn)] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_blocks_producer_thread_until_flushed():
+    conn = AsyncMock()
+    scheduler = _scheduler(conn, flush_interval=10, max_pending=1)
+
+    scheduler.submit(start_tool_call(tool_call_id="call-1", title="a", kind="read"))
+    second = start_tool_call(tool_call_id="call-2", title="b", kind="read")
+    # The producer thread blocks until the loop has sent the first update.
+    await asyncio.wait_for(asyncio.to_thread(scheduler.submit, second), timeout=5)
+
+    assert [u.tool_call_id for u in _sent_updates(conn)] == ["call-1"]
+    await scheduler.flush()
+    assert [u.tool_call_id for u in _sent_updates(conn)] == ["call-1", "call-2"]
@@ -667,8 +667,9 @@ async def test_new_session_replays_historic_events_on_resume(mock_connection, tm
         patch("openhands_cli.acp_impl.agent.local_agent.load_agent_specs") as mock_load,
         patch("openhands_cli.acp_impl.agent.local_agent.Conversation") as mock_conv,
         patch(
-            "openhands_cli.acp_impl.agent.base_agent.EventSubscriber"
-        ) as mock_subscriber_class,
+            "openhands_cli.acp_impl.agent.base_agent.replay_history",
+            new_callable=AsyncMock,
+        ) as mock_replay,
     ):
         mock_agent = MagicMock()
         mock_agent.llm.model = "test-model"
@@ -694,23 +695,20 @@ async def test_new_session_replays_historic_events_on_resume(mock_connection, tm
         mock_conversation.state.events = [mock_event1, mock_event2]
         mock_conv.return_value = mock_conversation
 
-        # Mock EventSubscriber
-        mock_subscriber = AsyncMock()
-        mock_subscriber_class.return_value = mock_subscriber
-
         # Call new_session with resume
         response = await agent.new_session(cwd=str(tmp_path), mcp_servers=[])
 
         # Verify the session ID is the resume_conversation_id
         assert response.session_id == resume_id
 
-        # Verify EventSubscriber was created for replaying events
-        mock_subscriber_class.assert_called_with(resume_id, mock_connection)
-
-        # Verify all historic events were replayed
-        assert mock_subscriber.call_count == 2
-        mock_subscriber.assert_any_call(mock_event1)
-        mock_subscriber.assert_any_call(mock_event2)
+        # Verify all historic events were replayed in one bulk replay
+        mock_replay.assert_awaited_once_with(
+            resume_id,
+            mock_connection,
+            [mock_event1, mock_event2],
+            mock_conversation,
+            last_turns=None,
+        )
 
 
 @pytest.mark.asyncio
@@ -723,8 +721,9 @@ async def test_new_session_no_replay_for_new_conversation(mock_connection, tmp_p
         patch("openhands_cli.acp_impl.agent.local_agent.load_agent_specs") as mock_load,
         patch("openhands_cli.acp_impl.agent.local_agent.Conversation") as mock_conv,
         patch(
-            "openhands_cli.acp_impl.agent.base_agent.EventSubscriber"
-        ) as mock_subscriber_class,
+            "openhands_cli.acp_impl.agent.base_agent.replay_history",
+            new_callable=AsyncMock,
+        ) as mock_replay,
     ):
         mock_agent = MagicMock()
         mock_agent.llm.model = "test-model"
@@ -735,16 +734,56 @@ async def test_new_session_no_replay_for_new_conversation(mock_connection, tmp_p
         mock_conversation.state.events = []
         mock_conv.return_value = mock_conversation
 
-        # Mock EventSubscriber
-        mock_subscriber = AsyncMock()
-        mock_subscriber_class.return_value = mock_subscriber
-
         # Call new_session without resume
         response = await agent.new_session(cwd=str(tmp_path), mcp_servers=[])
 
         # Verify a new UUID was generated (not the resume ID)
         UUID(response.session_id)  # Should be a valid UUID
 
-        # Verify EventSubscriber was NOT called for replaying events
-        # (it may be created for _send_available_commands, but not called with events)
-        mock_subscriber.assert_not_called()
+        # Verify no history was replayed
+        mock_replay.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_pages_persisted_conversations(acp_agent):
+    """list_sessions serves index entries as ACP sessions with a cursor."""
+    from datetime import UTC, datetime
+
+    from acp import RequestError
+
+    from openhands_cli.conversations.store.index import IndexEntry
+
+    session_id = "5b0d4f9c-3b1a-4c52-9d4e-8f1f2a3b4c5d"
+    entries = [
+        IndexEntry(
+            id=UUID(session_id).hex,
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),
+            title="Fix the tests",
+            working_dir="/work",
+        ),
+        # Directories that aren't session IDs are skipped
+        IndexEntry(id="not-a-session", created_at=datetime(2024, 1, 1, tzinfo=UTC)),
+    ]
+
+    with patch(
+        "openhands_cli.acp_impl.agent.local_agent.LocalFileStore"
+    ) as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.list_page.return_value = (entries, "next-page")
+
+        response = await acp_agent.list_sessions(cursor="page", cwd="/work")
+
+        mock_store.list_page.assert_called_once()
+        assert mock_store.list_page.call_args.kwargs["cursor"] == "page"
+        assert mock_store.list_page.call_args.kwargs["working_dir"] == "/work"
+        assert response.next_cursor == "next-page"
+        assert len(response.sessions) == 1
+        session = response.sessions[0]
+        assert session.session_id == session_id
+        assert session.cwd == "/work"
+        assert session.title == "Fix the tests"
+        assert session.updated_at == "2024-01-01T00:00:00+00:00"
+
+        mock_store.list_page.side_effect = ValueError("Invalid cursor")
+        with pytest.raises(RequestError):
+            await acp_agent.list_sessions(cursor="bad")
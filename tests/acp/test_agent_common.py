@@ -83,26 +83,24 @@ class TestLoadSession:
         if isinstance(agent, OpenHandsCloudACPAgent):
             agent._active_workspaces[session_id] = MagicMock()
 
-        # EventSubscriber is imported in base_agent for local agent's load_session
-        # and in remote_agent for cloud agent's load_session override
-        patch_path = (
-            "openhands_cli.acp_impl.agent.remote_agent.EventSubscriber"
-            if isinstance(agent, OpenHandsCloudACPAgent)
-            else "openhands_cli.acp_impl.agent.base_agent.EventSubscriber"
-        )
-
-        with patch(patch_path) as mock_subscriber_class:
-            mock_subscriber = AsyncMock()
-            mock_subscriber_class.return_value = mock_subscriber
-
+        # Both agents replay history through the base agent's bulk replay
+        with patch(
+            "openhands_cli.acp_impl.agent.base_agent.replay_history",
+            new_callable=AsyncMock,
+        ) as mock_replay:
             response = await agent.load_session(
                 cwd="/tmp", mcp_servers=[], session_id=session_id
             )
 
             assert response is not None
             assert response.modes is not None
-            mock_subscriber_class.assert_called_once_with(session_id, mock_connection)
-            assert mock_subscriber.call_count == 2
+            mock_replay.assert_awaited_once_with(
+                session_id,
+                mock_connection,
+                [mock_event1, mock_event2],
+                mock_conversation,
+                last_turns=None,
+            )
 
     @pytest.mark.asyncio
     async def test_load_session_includes_modes(self, agent):
@@ -11,6 +11,10 @@ from acp import RequestError
 from acp.schema import Implementation
 
 from openhands.sdk import BaseConversation
+from openhands_cli.acp_impl.agent import (
+    LocalOpenHandsACPAgent,
+    OpenHandsCloudACPAgent,
+)
 from openhands_cli.acp_impl.agent.base_agent import BaseOpenHandsACPAgent
 from openhands_cli.acp_impl.agent.util import AgentType
 from openhands_cli.acp_impl.confirmation import ConfirmationMode
@@ -68,6 +72,19 @@ def test_agent(mock_connection):
     return ConcreteTestAgent(mock_connection)
 
 
+class TestConcreteAgents:
+    """The shipped agents must implement every abstract method."""
+
+    @pytest.mark.parametrize(
+        "agent_class", [LocalOpenHandsACPAgent, OpenHandsCloudACPAgent]
+    )
+    def test_agent_can_be_instantiated(self, agent_class, mock_connection):
+        assert not agent_class.__abstractmethods__
+        with patch("openhands_cli.acp_impl.agent.base_agent.TokenStorage"):
+            agent = agent_class(mock_connection, "always-ask")
+        assert isinstance(agent, BaseOpenHandsACPAgent)
+
+
 class TestInitialize:
     """Tests for the initialize method."""
 
@@ -186,15 +203,14 @@ class TestNewSession:
         agent._mock_conversation = mock_conversation
 
         with patch(
-            "openhands_cli.acp_impl.agent.base_agent.EventSubscriber"
-        ) as mock_subscriber_class:
-            mock_subscriber = AsyncMock()
-            mock_subscriber_class.return_value = mock_subscriber
-
+            "openhands_cli.acp_impl.agent.base_agent.replay_history",
+            new_callable=AsyncMock,
+        ) as mock_replay:
             await agent.new_session(cwd="/tmp", mcp_servers=[])
 
             # Verify events were replayed
-            assert mock_subscriber.call_count == 2
+            mock_replay.assert_awaited_once()
+            assert mock_replay.call_args.args[2] == [mock_event1, mock_event2]
 
     @pytest.mark.asyncio
     async def test_new_session_handles_missing_agent_spec(self, mock_connection):
@@ -321,3 +337,68 @@ class TestExtMethods:
         """Test ext_notification completes without error."""
         # Should not raise
         await test_agent.ext_notification("test_notification", {"key": "value"})
+
+
+class TestSessionEviction:
+    """Tests for idle-session eviction and transparent reload."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_session_is_evicted_and_reloaded(
+        self, test_agent
+    ):
+        """Sessions over the limit are closed and reloaded on their next prompt."""
+        from openhands_cli.acp_impl.session_eviction import SessionEvictionPolicy
+
+        test_agent._eviction_policy = SessionEvictionPolicy(
+            max_resident=1, idle_ttl=None
+        )
+        first, second = str(uuid4()), str(uuid4())
+
+        test_agent._mock_conversation = MagicMock()
+        await test_agent.prompt(prompt=[], session_id=first)
+        test_agent._mock_conversation = MagicMock()
+        await test_agent.prompt(prompt=[], session_id=second)
+
+        assert list(test_agent.active_sessions) == [second]
+        assert first in test_agent._evicted_sessions
+
+        with patch.object(
+            test_agent,
+            "_get_or_create_conversation",
+            wraps=test_agent._get_or_create_conversation,
+        ) as mock_get:
+            await test_agent.prompt(prompt=[], session_id=first)
+
+        assert mock_get.call_args.kwargs["is_resuming"] is True
+        assert list(test_agent.active_sessions) == [first]
+        assert first not in test_agent._evicted_sessions
+        assert second in test_agent._evicted_sessions
+
+    @pytest.mark.asyncio
+    async def test_busy_sessions_are_not_evicted(self, test_agent):
+        """A session with a running prompt stays resident."""
+        from openhands_cli.acp_impl.session_eviction import SessionEvictionPolicy
+
+        test_agent._eviction_policy = SessionEvictionPolicy(
+            max_resident=1, idle_ttl=None
+        )
+        busy, other = str(uuid4()), str(uuid4())
+
+        test_agent._mock_conversation = MagicMock()
+        await test_agent.prompt(prompt=[], session_id=busy)
+        test_agent._running_tasks[busy] = MagicMock()
+        test_agent._mock_conversation = MagicMock()
+        await test_agent.prompt(prompt=[], session_id=other)
+
+        assert set(test_agent.active_sessions) == {busy, other}
+        assert not test_agent._evicted_sessions
+
+    @pytest.mark.asyncio
+    async def test_cancel_of_evicted_session_is_noop(self, test_agent):
+        """Cancelling an evicted (idle) session doesn't reload it."""
+        session_id = str(uuid4())
+        test_agent._evicted_sessions[session_id] = "always-ask"
+
+        await test_agent.cancel(session_id=session_id)
+
+        assert session_id not in test_agent.active_sessions
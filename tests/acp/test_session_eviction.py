@@ -0,0 +1,64 @@
+"""Tests for SessionEvictionPolicy (LRU / idle-TTL session eviction)."""
+
+import pytest
+
+from openhands_cli.acp_impl.session_eviction import SessionEvictionPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_evicts_least_recently_used_over_capacity():
+    clock = FakeClock()
+    policy = SessionEvictionPolicy(max_resident=2, idle_ttl=None, clock=clock)
+    for session_id in ["a", "b", "c"]:
+        policy.touch(session_id)
+        clock.now += 1
+    policy.touch("a")
+
+    victims = policy.select_victims(["a", "b", "c"], busy=set())
+
+    assert victims == [("b", "over capacity")]
+
+
+def test_evicts_sessions_idle_past_ttl():
+    clock = FakeClock()
+    policy = SessionEvictionPolicy(max_resident=None, idle_ttl=10, clock=clock)
+    policy.touch("a")
+    clock.now = 5
+    policy.touch("b")
+    clock.now = 12
+
+    assert policy.select_victims(["a", "b"], busy=set()) == [("a", "idle")]
+    assert policy.next_expiry() == 0.0
+    policy.discard("a")
+    assert policy.next_expiry() == pytest.approx(3)
+
+
+def test_busy_sessions_are_skipped():
+    clock = FakeClock()
+    policy = SessionEvictionPolicy(max_resident=1, idle_ttl=None, clock=clock)
+    policy.touch("a")
+    clock.now = 1
+    policy.touch("b")
+
+    assert policy.select_victims(["a", "b"], busy={"a"}) == [("b", "over capacity")]
+
+
+def test_untracked_resident_sessions_count_as_recent():
+    clock = FakeClock()
+    policy = SessionEvictionPolicy(max_resident=1, idle_ttl=None, clock=clock)
+    policy.touch("a")
+    clock.now = 1
+
+    assert policy.select_victims(["a", "b"], busy=set()) == [("a", "over capacity")]
+
+
+def test_rejects_non_positive_limit():
+    with pytest.raises(ValueError):
+        SessionEvictionPolicy(max_resident=0)
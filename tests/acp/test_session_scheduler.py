@@ -0,0 +1,125 @@
+"""Tests for SessionScheduler (bounded, fair conversation execution)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from openhands_cli.acp_impl.session_scheduler import SessionScheduler
+
+
+def _blocking(release: threading.Event, log: list[str], name: str):
+    def run() -> None:
+        log.append(name)
+        release.wait(timeout=5)
+
+    return run
+
+
+async def _until(predicate, timeout: float = 5.0) -> None:
+    async def poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_runs_and_admits_in_order():
+    scheduler = SessionScheduler(max_concurrent=2)
+    release = threading.Event()
+    started: list[str] = []
+
+    tasks = []
+    for name in ["a", "b", "c", "d"]:
+        tasks.append(
+            asyncio.create_task(scheduler.run(name, _blocking(release, started, name)))
+        )
+        # Let each task reach the queue before creating the next one.
+        await asyncio.sleep(0)
+
+    await _until(lambda: len(started) == 2)
+    await asyncio.sleep(0.02)
+    assert started == ["a", "b"]
+    assert scheduler.running_count == 2
+    assert scheduler.is_queued("c") and scheduler.is_queued("d")
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=5)
+
+    assert started == ["a", "b", "c", "d"]
+    assert scheduler.running_count == 0
+    scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancel_while_queued_leaves_the_queue():
+    scheduler = SessionScheduler(max_concurrent=1)
+    release = threading.Event()
+    started: list[str] = []
+
+    first = asyncio.create_task(scheduler.run("a", _blocking(release, started, "a")))
+    await _until(lambda: scheduler.is_running("a"))
+    queued = asyncio.create_task(scheduler.run("b", _blocking(release, started, "b")))
+    await _until(lambda: scheduler.is_queued("b"))
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert not scheduler.is_queued("b")
+
+    release.set()
+    await asyncio.wait_for(first, timeout=5)
+    assert started == ["a"]
+
+    # The slot is free again for other sessions.
+    await asyncio.wait_for(scheduler.run("c", lambda: None), timeout=5)
+    scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_keeps_its_slot_until_the_thread_returns():
+    scheduler = SessionScheduler(max_concurrent=1)
+    release = threading.Event()
+    started: list[str] = []
+
+    first = asyncio.create_task(scheduler.run("a", _blocking(release, started, "a")))
+    await _until(lambda: scheduler.is_running("a"))
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # The worker thread is still busy, so the next run has to wait.
+    second = asyncio.create_task(scheduler.run("b", _blocking(release, started, "b")))
+    await asyncio.sleep(0.05)
+    assert started == ["a"]
+    assert scheduler.is_running("a")
+
+    release.set()
+    await asyncio.wait_for(second, timeout=5)
+    assert started == ["a", "b"]
+    scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_state_bookkeeping_and_forget():
+    scheduler = SessionScheduler(max_concurrent=1)
+
+    await scheduler.run("a", lambda: None)
+    await scheduler.run("a", lambda: None)
+
+    state = scheduler.state("a")
+    assert state.runs == 2
+    assert not state.running
+    assert state.run_seconds >= 0
+
+    scheduler.forget("a")
+    assert scheduler.state("a").runs == 0
+    scheduler.shutdown()
+
+
+def test_rejects_non_positive_limit():
+    with pytest.raises(ValueError):
+        SessionScheduler(max_concurrent=0)
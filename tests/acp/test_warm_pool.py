@@ -0,0 +1,76 @@
+"""Tests for ConversationWarmPool (pre-built conversations for new_session)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openhands_cli.acp_impl.agent.warm_pool import ConversationWarmPool
+
+
+def _pool() -> tuple[ConversationWarmPool, MagicMock, MagicMock]:
+    build = MagicMock(return_value=MagicMock())
+    discard = MagicMock()
+    return ConversationWarmPool(build=build, discard=discard), build, discard
+
+
+async def _until(predicate, timeout: float = 5.0) -> None:
+    async def poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+@pytest.mark.asyncio
+async def test_matching_session_takes_the_prebuilt_conversation():
+    pool, build, discard = _pool()
+    servers = {"fetch": {"command": "uvx"}}
+
+    pool.prepare("/work", servers)
+    pool.prepare("/work", servers)
+    warm = await pool.take("/work", servers)
+
+    assert warm is not None
+    session_id, conversation = warm
+    build.assert_called_once()
+    assert build.call_args.args[:3] == (session_id, "/work", servers)
+    assert conversation is build.return_value
+    # Handed out only once
+    assert await pool.take("/work", servers) is None
+    discard.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_different_working_dir_discards_the_prebuilt_conversation():
+    pool, _, discard = _pool()
+
+    pool.prepare("/work")
+    assert await pool.take("/elsewhere") is None
+
+    await _until(lambda: discard.called)
+
+
+@pytest.mark.asyncio
+async def test_changed_configuration_discards_the_prebuilt_conversation():
+    pool, _, discard = _pool()
+    fingerprint = "openhands_cli.acp_impl.agent.warm_pool.setup_fingerprint"
+
+    with patch(fingerprint, return_value=(1,)):
+        pool.prepare("/work")
+    with patch(fingerprint, return_value=(2,)):
+        assert await pool.take("/work") is None
+
+    await _until(lambda: discard.called)
+
+
+@pytest.mark.asyncio
+async def test_failed_build_falls_back_to_regular_setup():
+    build = MagicMock(side_effect=RuntimeError("no agent spec"))
+    pool = ConversationWarmPool(build=build, discard=MagicMock())
+
+    pool.prepare("/work")
+
+    assert await pool.take("/work") is None
@@ -1,9 +1,16 @@
 import json
+import os
+import shutil
+import time
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import pytest
 
+from openhands_cli.conversations.store import local as local_module
+from openhands_cli.conversations.store.index import INDEX_DIRNAME, INDEX_FILENAME
 from openhands_cli.conversations.store.local import LocalFileStore
+from openhands_cli.conversations.store.packed import compact_conversation
 
 
 class TestLocalFileStore:
@@ -177,3 +184,416 @@ class TestLocalFileStore:
         assert len(events) == 2
         assert events[0].id == "3"
         assert events[1].id == "4"
+
+
+def _write_user_event(events_dir, name, text, timestamp="2024-01-01T12:00:00Z"):
+    events_dir.mkdir(parents=True, exist_ok=True)
+    event = {
+        "id": name,
+        "timestamp": timestamp,
+        "source": "user",
+        "kind": "MessageEvent",
+        "llm_message": {
+            "role": "user",
+            "content": [{"type": "text", "text": text}],
+        },
+    }
+    with open(events_dir / f"{name}.json", "w") as f:
+        json.dump(event, f)
+
+
+class TestConversationIndex:
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        # Trust freshly written mtimes so the index is actually reused in tests.
+        monkeypatch.setattr(local_module, "_RACY_MTIME_WINDOW_NS", 0)
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    def test_index_is_persisted(self, store, tmp_path):
+        _write_user_event(tmp_path / "conv-a" / "events", "event-00000", "Hello")
+
+        convs = store.list_conversations()
+
+        assert [c.id for c in convs] == ["conv-a"]
+        assert (tmp_path / INDEX_DIRNAME / INDEX_FILENAME).exists()
+        assert not any(c.id == INDEX_DIRNAME for c in convs)
+
+    def test_fresh_entries_are_not_reparsed(self, store, tmp_path):
+        _write_user_event(tmp_path / "conv-a" / "events", "event-00000", "Hello")
+        store.list_conversations()
+
+        # A new store instance must be served from the on-disk index.
+        other = LocalFileStore(base_dir=str(tmp_path))
+        with patch.object(
+            LocalFileStore, "_read_event_bytes", side_effect=AssertionError
+        ):
+            convs = other.list_conversations()
+
+        assert convs[0].title == "Hello"
+
+    def test_new_and_removed_conversations_are_picked_up(self, store, tmp_path):
+        _write_user_event(
+            tmp_path / "old" / "events", "event-00000", "Old", "2024-01-01T00:00:00Z"
+        )
+        assert [c.id for c in store.list_conversations()] == ["old"]
+
+        _write_user_event(
+            tmp_path / "new" / "events", "event-00000", "New", "2024-02-01T00:00:00Z"
+        )
+        os.utime(tmp_path, ns=(time.time_ns(), time.time_ns() + 1_000))
+        assert [c.id for c in store.list_conversations()] == ["new", "old"]
+
+        shutil.rmtree(tmp_path / "old")
+        os.utime(tmp_path, ns=(time.time_ns(), time.time_ns() + 2_000))
+        assert [c.id for c in store.list_conversations()] == ["new"]
+
+    def test_entry_refreshed_when_events_change(self, store, tmp_path):
+        events_dir = tmp_path / "conv" / "events"
+        events_dir.mkdir(parents=True)
+        (events_dir / "event-00000.json").write_text(
+            json.dumps({"timestamp": "2024-01-01T12:00:00Z", "source": "agent"})
+        )
+        assert store.list_conversations()[0].title is None
+
+        _write_user_event(events_dir, "event-00001", "Late title")
+        os.utime(events_dir, ns=(time.time_ns(), time.time_ns() + 1_000))
+
+        assert store.list_conversations()[0].title == "Late title"
+
+    def test_empty_conversation_becomes_listable(self, store, tmp_path):
+        conv_id = store.create()
+        assert store.list_conversations() == []
+
+        _write_user_event(tmp_path / conv_id / "events", "event-00000", "Hi")
+        events_dir = tmp_path / conv_id / "events"
+        os.utime(events_dir, ns=(time.time_ns(), time.time_ns() + 1_000))
+
+        assert [c.id for c in store.list_conversations()] == [conv_id]
+
+    def test_corrupted_index_is_rebuilt(self, store, tmp_path):
+        _write_user_event(tmp_path / "conv-a" / "events", "event-00000", "Hello")
+        store.list_conversations()
+
+        (tmp_path / INDEX_DIRNAME / INDEX_FILENAME).write_text("{ not json")
+
+        other = LocalFileStore(base_dir=str(tmp_path))
+        assert [c.id for c in other.list_conversations()] == ["conv-a"]
+
+    def test_limit_applies_to_newest(self, store, tmp_path):
+        for i in range(5):
+            _write_user_event(
+                tmp_path / f"conv-{i}" / "events",
+                "event-00000",
+                f"Msg {i}",
+                f"2024-01-0{i + 1}T00:00:00Z",
+            )
+
+        convs = store.list_conversations(limit=2)
+
+        assert [c.id for c in convs] == ["conv-4", "conv-3"]
+
+    def test_latest_conversation_id(self, store, tmp_path):
+        assert store.get_latest_conversation_id() is None
+
+        _write_user_event(
+            tmp_path / "old" / "events", "event-00000", "Old", "2024-01-01T00:00:00Z"
+        )
+        _write_user_event(
+            tmp_path / "new" / "events", "event-00000", "New", "2024-02-01T00:00:00Z"
+        )
+        assert store.get_latest_conversation_id() == "new"
+
+        # Once recorded, the pointer is served without touching the index.
+        with patch.object(
+            LocalFileStore, "list_conversations", side_effect=AssertionError
+        ):
+            assert store.get_latest_conversation_id() == "new"
+
+    def test_latest_pointer_invalidated_by_new_conversation(self, store, tmp_path):
+        _write_user_event(
+            tmp_path / "old" / "events", "event-00000", "Old", "2024-01-01T00:00:00Z"
+        )
+        assert store.get_latest_conversation_id() == "old"
+
+        _write_user_event(
+            tmp_path / "new" / "events", "event-00000", "New", "2024-02-01T00:00:00Z"
+        )
+        os.utime(tmp_path, ns=(time.time_ns(), time.time_ns() + 1_000))
+
+        assert store.get_latest_conversation_id() == "new"
+
+
+class TestWindowedLoading:
+    @pytest.fixture
+    def store(self, tmp_path):
+        events_dir = tmp_path / "conv" / "events"
+        for i in range(5):
+            _write_user_event(events_dir, f"event-{i:05d}", f"Msg {i}")
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({"offset": 1, "limit": 2}, ["event-00001", "event-00002"]),
+            (
+                {"offset": 1, "limit": 2, "start_from_newest": True},
+                ["event-00002", "event-00003"],
+            ),
+            (
+                {"limit": 3, "start_from_newest": True, "reverse": True},
+                ["event-00004", "event-00003", "event-00002"],
+            ),
+            ({"offset": 10}, []),
+            ({"limit": 0}, []),
+        ],
+    )
+    def test_load_events_window(self, store, kwargs, expected):
+        assert [e.id for e in store.load_events("conv", **kwargs)] == expected
+
+    def test_only_windowed_events_are_read(self, store):
+        with patch.object(
+            LocalFileStore,
+            "_read_event_bytes",
+            autospec=True,
+            side_effect=LocalFileStore._read_event_bytes,
+        ) as read:
+            list(store.load_events("conv", limit=2, start_from_newest=True))
+
+        assert [call.args[3] for call in read.call_args_list] == [3, 4]
+
+    def test_manifest_picks_up_appended_events(self, store, tmp_path):
+        assert store.get_event_count("conv") == 5
+
+        events_dir = tmp_path / "conv" / "events"
+        _write_user_event(events_dir, "event-00005", "Msg 5")
+        os.utime(events_dir, ns=(time.time_ns(), time.time_ns() + 1_000))
+
+        assert store.get_event_count("conv") == 6
+        last = list(store.load_events("conv", limit=1, start_from_newest=True))
+        assert last[0].id == "event-00005"
+
+
+class TestPackedConversations:
+    @pytest.fixture
+    def store(self, tmp_path):
+        events_dir = tmp_path / "conv" / "events"
+        for i in range(4):
+            _write_user_event(
+                events_dir, f"event-{i:05d}", f"Msg {i}", f"2024-01-01T12:00:0{i}Z"
+            )
+        compact_conversation(tmp_path / "conv")
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    def test_packed_events_are_read_transparently(self, store):
+        assert store.get_event_count("conv") == 4
+        events = list(store.load_events("conv", limit=2, start_from_newest=True))
+        assert [e.id for e in events] == ["event-00002", "event-00003"]
+
+    def test_packed_and_loose_events_are_merged(self, store, tmp_path):
+        _write_user_event(tmp_path / "conv" / "events", "event-00004", "Msg 4")
+
+        assert [e.id for e in store.load_events("conv", offset=3)] == [
+            "event-00003",
+            "event-00004",
+        ]
+
+    def test_packed_conversation_metadata(self, store):
+        convs = store.list_conversations()
+        assert convs[0].title == "Msg 0"
+        assert convs[0].created_at == datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+class TestParallelScan:
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(local_module, "_SCAN_BATCH_SIZE", 2)
+        for i in range(5):
+            _write_user_event(
+                tmp_path / f"conv-{i}" / "events",
+                "event-00000",
+                f"Msg {i}",
+                f"2024-01-0{i + 1}T00:00:00Z",
+            )
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    def test_iter_conversations_yields_partial_listings(self, store):
+        listings = list(store.iter_conversations(limit=3))
+
+        # Two partial listings (after batches of 2) and the final one
+        assert len(listings) == 3
+        assert len(listings[0]) == 2
+        assert [c.id for c in listings[-1]] == ["conv-4", "conv-3", "conv-2"]
+
+    def test_pending_scan_count(self, store):
+        assert store.pending_scan_count() == 5
+
+        store.list_conversations()
+
+        assert store.pending_scan_count() == 0
+
+    def test_scan_matches_serial_results(self, store, tmp_path):
+        parallel = store.list_conversations()
+        serial = [
+            store._parse_conversation_dir(tmp_path / conv.id) for conv in parallel
+        ]
+
+        assert [(c.id, c.created_at, c.title) for c in parallel] == [
+            (c.id, c.created_at, c.title) for c in serial if c is not None
+        ]
+
+
+class TestTitleExtraction:
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(local_module, "_RACY_MTIME_WINDOW_NS", 0)
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    @staticmethod
+    def _write_agent_event(events_dir, name, padding=0):
+        events_dir.mkdir(parents=True, exist_ok=True)
+        event = {
+            "id": name,
+            "timestamp": "2024-01-01T12:00:00Z",
+            "source": "agent",
+            "kind": "ObservationEvent",
+            "observation": {"content": "x" * padding},
+        }
+        (events_dir / f"{name}.json").write_text(json.dumps(event))
+
+    @pytest.mark.parametrize(
+        "event, expected",
+        [
+            (
+                {
+                    "source": "user",
+                    "llm_message": {"content": [{"type": "text", "text": "Hi"}]},
+                },
+                "Hi",
+            ),
+            ({"source": "agent", "llm_message": {"content": []}}, None),
+            ({"source": "user", "kind": "PauseEvent"}, None),
+            ({"source": "user", "llm_message": {"content": []}}, None),
+            (
+                {
+                    "source": "user",
+                    "llm_message": {"content": [{"type": "image", "urls": []}]},
+                },
+                None,
+            ),
+            (["not", "an", "event"], None),
+        ],
+    )
+    def test_extract_user_prompt(self, event, expected):
+        assert local_module._extract_user_prompt(event) == expected
+
+    def test_non_user_events_are_only_peeked(self, store, tmp_path):
+        events_dir = tmp_path / "conv" / "events"
+        self._write_agent_event(events_dir, "event-00000", padding=100_000)
+        _write_user_event(events_dir, "event-00001", "Title")
+
+        reads = []
+        original = LocalFileStore._read_event_bytes
+
+        def tracking_read(self, conversation_id, names, position, limit=None):
+            data = original(self, conversation_id, names, position, limit)
+            reads.append((position, len(data or b"")))
+            return data
+
+        with patch.object(LocalFileStore, "_read_event_bytes", tracking_read):
+            convs = store.list_conversations()
+
+        assert convs[0].title == "Title"
+        # The large agent event is only read in full for its timestamp.
+        peek = local_module._SOURCE_PEEK_BYTES
+        assert (0, peek) in reads
+        assert len([r for r in reads if r[0] == 0 and r[1] > peek]) == 1
+
+    def test_title_search_resumes_after_scanned_events(self, store, tmp_path):
+        events_dir = tmp_path / "conv" / "events"
+        self._write_agent_event(events_dir, "event-00000")
+        self._write_agent_event(events_dir, "event-00001")
+        assert store.list_conversations()[0].title is None
+
+        _write_user_event(events_dir, "event-00002", "Late title")
+        os.utime(events_dir, ns=(time.time_ns(), time.time_ns() + 1_000))
+
+        with patch.object(
+            LocalFileStore,
+            "_find_first_user_prompt",
+            wraps=store._find_first_user_prompt,
+        ) as find:
+            convs = store.list_conversations()
+
+        assert convs[0].title == "Late title"
+        assert find.call_args.kwargs["start"] == 2
+
+    def test_undecodable_events_are_skipped(self, store, tmp_path):
+        events_dir = tmp_path / "conv" / "events"
+        self._write_agent_event(events_dir, "event-00000")
+        (events_dir / "event-00001.json").write_text('{"source": "user", ')
+        _write_user_event(events_dir, "event-00002", "Title")
+
+        assert store.list_conversations()[0].title == "Title"
+
+    def test_title_is_not_recomputed(self, store, tmp_path):
+        events_dir = tmp_path / "conv" / "events"
+        _write_user_event(events_dir, "event-00000", "First")
+        assert store.list_conversations()[0].title == "First"
+
+        _write_user_event(events_dir, "event-00001", "Second")
+        os.utime(events_dir, ns=(time.time_ns(), time.time_ns() + 1_000))
+
+        with patch.object(
+            LocalFileStore, "_find_first_user_prompt", side_effect=AssertionError
+        ):
+            convs = store.list_conversations()
+
+        assert convs[0].title == "First"
+
+
+class TestPagedListing:
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(local_module, "_RACY_MTIME_WINDOW_NS", 0)
+        for i in range(5):
+            conv_dir = tmp_path / f"conv-{i}"
+            _write_user_event(
+                conv_dir / "events",
+                "event-00000",
+                f"Prompt {i}",
+                timestamp=f"2024-01-0{i + 1}T12:00:00Z",
+            )
+            working_dir = "/work/a" if i % 2 == 0 else "/work/b"
+            (conv_dir / "base_state.json").write_text(
+                json.dumps({"workspace": {"working_dir": working_dir}})
+            )
+        return LocalFileStore(base_dir=str(tmp_path))
+
+    def test_pages_cover_all_conversations_latest_first(self, store):
+        ids = []
+        cursor = None
+        while True:
+            entries, cursor = store.list_page(cursor=cursor, limit=2)
+            ids.extend(entry.id for entry in entries)
+            if cursor is None:
+                break
+
+        assert ids == [f"conv-{i}" for i in reversed(range(5))]
+
+    def test_working_dir_filter(self, store):
+        entries, cursor = store.list_page(working_dir="/work/b/")
+
+        assert [entry.id for entry in entries] == ["conv-3", "conv-1"]
+        assert all(entry.working_dir == "/work/b" for entry in entries)
+        assert cursor is None
+
+    def test_entries_carry_metadata(self, store):
+        entries, _ = store.list_page(limit=1)
+
+        assert entries[0].title == "Prompt 4"
+        assert entries[0].event_count == 1
+        assert entries[0].last_modified is not None
+
+    def test_invalid_cursor_raises(self, store):
+        with pytest.raises(ValueError):
+            store.list_page(cursor="not a cursor")
@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+from openhands_cli.conversations.store.packed import (
+    PACK_FILENAME,
+    PACK_INDEX_FILENAME,
+    EventPack,
+    PackFormatError,
+    append_to_pack,
+    compact_conversation,
+    list_loose_event_files,
+    unpack_conversation,
+)
+
+
+def _make_conversation(tmp_path, count):
+    conversation_dir = tmp_path / "conv"
+    events_dir = conversation_dir / "events"
+    events_dir.mkdir(parents=True)
+    for i in range(count):
+        (events_dir / f"event-{i:05d}-id{i}.json").write_text(
+            json.dumps({"id": f"id{i}", "payload": "x" * i})
+        )
+    return conversation_dir
+
+
+def _open_pack(conversation_dir) -> EventPack:
+    pack = EventPack.open(conversation_dir)
+    assert pack is not None
+    return pack
+
+
+def test_open_returns_none_without_pack(tmp_path):
+    assert EventPack.open(tmp_path) is None
+
+
+def test_compact_moves_events_into_pack(tmp_path):
+    conversation_dir = _make_conversation(tmp_path, 5)
+    original = {
+        name: (conversation_dir / "events" / name).read_bytes()
+        for name in list_loose_event_files(conversation_dir / "events")
+    }
+
+    assert compact_conversation(conversation_dir) == 5
+
+    assert list_loose_event_files(conversation_dir / "events") == []
+    with _open_pack(conversation_dir) as pack:
+        assert pack.names() == sorted(original)
+        assert pack.read(3) == original["event-00003-id3.json"]
+
+
+def test_compact_appends_new_events(tmp_path):
+    conversation_dir = _make_conversation(tmp_path, 2)
+    compact_conversation(conversation_dir)
+
+    (conversation_dir / "events" / "event-00002-id2.json").write_text("{}")
+
+    assert compact_conversation(conversation_dir) == 1
+    with _open_pack(conversation_dir) as pack:
+        assert len(pack) == 3
+        assert pack.read(2) == b"{}"
+
+
+def test_compact_rejects_out_of_order_events(tmp_path):
+    conversation_dir = _make_conversation(tmp_path, 0)
+    append_to_pack(conversation_dir, [("event-00005-a.json", b"{}")])
+    (conversation_dir / "events" / "event-00001-b.json").write_text("{}")
+
+    with pytest.raises(PackFormatError):
+        compact_conversation(conversation_dir)
+    assert (conversation_dir / "events" / "event-00001-b.json").exists()
+
+
+def test_missing_index_is_rebuilt_by_scanning(tmp_path):
+    conversation_dir = _make_conversation(tmp_path, 3)
+    compact_conversation(conversation_dir)
+    (conversation_dir / PACK_INDEX_FILENAME).unlink()
+
+    with _open_pack(conversation_dir) as pack:
+        assert len(pack) == 3
+
+
+def test_trailing_partial_record_is_ignored(tmp_path):
+    conversation_dir = _make_conversation(tmp_path, 3)
+    compact_conversation(conversation_dir)
+    with open(conversation_dir / PACK_FILENAME, "ab") as f:
+        f.write(b"\x05\x00garbage")
+
+    with _open_pack(conversation_dir) as pack:
+        assert len(pack) == 3
+
+    append_to_pack(conversation_dir, [("event-00003-x.json", b"[]")])
+    with _open_pack(conversation_dir) as pack:
+        assert pack.names()[-1] == "event-00003-x.json"
+        assert pack.read(3) == b"[]"
+
+
+def test_corrupted_pack_raises(tmp_path):
+    (tmp_path / PACK_FILENAME).write_bytes(b"not a pack at all")
+
+    with pytest.raises(PackFormatError):
+        EventPack.open(tmp_path)
+
+
+def test_unpack_restores_loose_files(tmp_path):
+    conversation_dir = _make_conversation(tmp_path, 4)
+    original = {
+        path.name: path.read_bytes() for path in (conversation_dir / "events").iterdir()
+    }
+    compact_conversation(conversation_dir)
+
+    assert unpack_conversation(conversation_dir) == 4
+
+    restored = {
+        path.name: path.read_bytes() for path in (conversation_dir / "events").iterdir()
+    }
+    assert restored == original
+    assert not (conversation_dir / PACK_FILENAME).exists()
+    assert not (conversation_dir / PACK_INDEX_FILENAME).exists()
+    assert unpack_conversation(conversation_dir) == 0
@@ -0,0 +1,36 @@
+import argparse
+import json
+
+import pytest
+
+from openhands_cli.conversations.commands import handle_conversations_command
+from openhands_cli.conversations.store.packed import EventPack
+
+
+def _args(conversation_id: str) -> argparse.Namespace:
+    return argparse.Namespace(
+        conversations_command="compact", conversation_id=conversation_id
+    )
+
+
+def test_compact_packs_conversation(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENHANDS_CONVERSATIONS_DIR", str(tmp_path))
+    events_dir = tmp_path / "conv" / "events"
+    events_dir.mkdir(parents=True)
+    for i in range(3):
+        (events_dir / f"event-{i:05d}-x.json").write_text(json.dumps({"i": i}))
+
+    handle_conversations_command(_args("conv"))
+
+    assert list(events_dir.iterdir()) == []
+    pack = EventPack.open(tmp_path / "conv")
+    assert pack is not None
+    with pack:
+        assert len(pack) == 3
+
+
+def test_compact_unknown_conversation_exits(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENHANDS_CONVERSATIONS_DIR", str(tmp_path))
+
+    with pytest.raises(SystemExit):
+        handle_conversations_command(_args("missing"))
@@ -0,0 +1,264 @@
+"""Tests for the shared MCP connection pool."""
+
+from __future__ import annotations
+
+import os
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from openhands_cli.mcp import mcp_pool
+from openhands_cli.mcp.mcp_pool import MCPConnectionPool, server_key
+from openhands_cli.stores import CliSettings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _tool(name: str) -> MagicMock:
+    tool = MagicMock(name=name)
+    tool.executor = MagicMock(name=f"{name}-executor")
+    tool.set_executor.side_effect = lambda executor: MagicMock(executor=executor)
+    return tool
+
+
+def _client(*tool_names: str) -> MagicMock:
+    """Stand-in for the MCPClient returned by the SDK's create_mcp_tools."""
+    client = MagicMock(name="client")
+    client.tools = [_tool(name) for name in tool_names]
+    return client
+
+
+@pytest.fixture
+def connect():
+    return MagicMock(side_effect=lambda config, timeout: _client("fetch"))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(connect, clock):
+    pool = MCPConnectionPool(connect=connect, idle_timeout=60, clock=clock)
+    yield pool
+    pool.close_all()
+
+
+SPEC = {"command": "uvx", "args": ["mcp-server-fetch"]}
+
+
+def test_server_is_connected_once_and_shared(pool, connect):
+    first = pool.create_tools({"mcpServers": {"fetch": SPEC}})
+    second = pool.create_tools({"mcpServers": {"fetch": dict(SPEC)}})
+
+    connect.assert_called_once_with({"mcpServers": {"fetch": SPEC}}, 30.0)
+    assert len(first) == len(second) == 1
+    assert pool.active_count() == 1
+
+
+def test_different_specs_get_different_connections(pool, connect):
+    pool.create_tools({"mcpServers": {"fetch": SPEC}})
+    pool.create_tools({"mcpServers": {"fetch": {**SPEC, "args": ["other"]}}})
+
+    assert connect.call_count == 2
+    assert server_key("fetch", SPEC) != server_key("fetch", {"args": ["other"]})
+
+
+def test_closing_a_conversation_releases_without_disconnecting(pool, connect):
+    (tool,) = pool.create_tools({"mcpServers": {"fetch": SPEC}})
+
+    tool.executor.close()
+    tool.executor.close()  # idempotent
+
+    assert pool.active_count() == 1
+    pool.create_tools({"mcpServers": {"fetch": SPEC}})
+    connect.assert_called_once()
+
+
+def test_idle_servers_are_closed_after_timeout(pool, connect, clock):
+    (tool,) = pool.create_tools({"mcpServers": {"fetch": SPEC}})
+    tool.executor.close()
+
+    clock.now = 30
+    pool.close_idle()
+    assert pool.active_count() == 1
+
+    clock.now = 61
+    pool.close_idle()
+    assert pool.active_count() == 0
+
+    pool.create_tools({"mcpServers": {"fetch": SPEC}})
+    assert connect.call_count == 2
+
+
+def test_servers_in_use_are_never_closed(pool, clock):
+    pool.create_tools({"mcpServers": {"fetch": SPEC}})
+
+    clock.now = 1000
+    pool.close_idle()
+
+    assert pool.active_count() == 1
+
+
+def test_failed_connection_is_not_cached(pool, connect):
+    connect.side_effect = RuntimeError("spawn failed")
+    with pytest.raises(RuntimeError):
+        pool.create_tools({"mcpServers": {"fetch": SPEC}})
+
+    connect.side_effect = lambda config, timeout: _client("fetch")
+    assert len(pool.create_tools({"mcpServers": {"fetch": SPEC}})) == 1
+    assert connect.call_count == 2
+
+
+def test_concurrent_conversations_spawn_one_server(pool, connect):
+    barrier = threading.Barrier(4)
+
+    def worker() -> None:
+        barrier.wait()
+        pool.create_tools({"mcpServers": {"fetch": SPEC}})
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    connect.assert_called_once()
+
+
+def test_idle_and_remaining_servers_close_their_clients(connect, clock):
+    clients = []
+
+    def connect_client(config, timeout):
+        clients.append(_client(*config["mcpServers"]))
+        return clients[-1]
+
+    connect.side_effect = connect_client
+    pool = MCPConnectionPool(connect=connect, idle_timeout=60, clock=clock)
+    (idle,) = pool.create_tools({"mcpServers": {"fetch": SPEC}})
+    pool.create_tools({"mcpServers": {"other": SPEC}})
+    assert idle.executor is not None
+    idle.executor.close()
+
+    clock.now = 61
+    pool.close_idle()
+    clients[0].sync_close.assert_called_once()
+    clients[1].sync_close.assert_not_called()
+
+    pool.close_all()
+    clients[1].sync_close.assert_called_once()
+    assert pool.active_count() == 0
+
+
+_PID_SERVER = textwrap.dedent(
+    """
+    import os
+    import sys
+
+    from fastmcp import FastMCP
+
+    server = FastMCP("pid")
+
+
+    @server.tool
+    def pid() -> int:
+        return os.getpid()
+
+
+    with open(sys.argv[1], "w") as f:
+        f.write(str(os.getpid()))
+    server.run(show_banner=False)
+    """
+)
+
+
+def _process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_closing_the_pool_stops_stdio_servers(tmp_path: Path, clock):
+    from openhands.sdk.mcp import create_mcp_tools
+
+    script = tmp_path / "server.py"
+    script.write_text(_PID_SERVER)
+    pid_file = tmp_path / "server.pid"
+    spec = {"command": sys.executable, "args": [str(script), str(pid_file)]}
+    pool = MCPConnectionPool(connect=create_mcp_tools, clock=clock)
+
+    try:
+        (tool,) = pool.create_tools({"mcpServers": {"pid": spec}})
+        assert tool.name == "pid"
+        pid = int(pid_file.read_text())
+        assert _process_exists(pid)
+
+        assert tool.executor is not None
+        tool.executor.close()
+        assert _process_exists(pid)
+    finally:
+        pool.close_all()
+
+    deadline = time.monotonic() + 10
+    while _process_exists(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _process_exists(pid)
+
+
+@pytest.fixture
+def sdk_create_mcp_tools(monkeypatch):
+    """Restore the SDK's create_mcp_tools after installing the pool."""
+    import openhands.sdk.agent.base as agent_base
+    from openhands.sdk.mcp import create_mcp_tools
+
+    monkeypatch.setattr(agent_base, "create_mcp_tools", create_mcp_tools)
+    monkeypatch.setattr(mcp_pool, "_sdk_create_mcp_tools", None)
+    return create_mcp_tools
+
+
+def test_sdk_creates_agent_mcp_tools_through_module_global():
+    """install_shared_mcp_pool relies on this; revisit it if the SDK changes."""
+    import inspect
+
+    import openhands.sdk.agent.base as agent_base
+
+    source = inspect.getsource(agent_base.AgentBase._initialize)
+    assert "create_mcp_tools" in source
+    assert hasattr(agent_base, "create_mcp_tools")
+
+
+def test_install_routes_agents_through_the_pool(sdk_create_mcp_tools, monkeypatch):
+    import openhands.sdk.agent.base as agent_base
+
+    monkeypatch.setattr(CliSettings, "load", classmethod(lambda cls: cls()))
+
+    assert mcp_pool.install_shared_mcp_pool()
+    installed = getattr(agent_base, "create_mcp_tools")
+    assert installed == mcp_pool.get_mcp_pool().create_tools
+
+
+def test_setting_keeps_the_sdk_function(sdk_create_mcp_tools, monkeypatch):
+    import openhands.sdk.agent.base as agent_base
+
+    monkeypatch.setattr(CliSettings, "load", classmethod(lambda cls: cls()))
+    mcp_pool.install_shared_mcp_pool()
+
+    disabled = CliSettings(share_mcp_connections=False)
+    monkeypatch.setattr(CliSettings, "load", classmethod(lambda cls: disabled))
+
+    assert not mcp_pool.install_shared_mcp_pool()
+    assert getattr(agent_base, "create_mcp_tools") is sdk_create_mcp_tools
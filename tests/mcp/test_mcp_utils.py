@@ -1,6 +1,7 @@
 """Unit tests for MCP configuration management."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 from fastmcp.mcp_config import RemoteMCPServer, StdioMCPServer
@@ -360,6 +361,45 @@ class TestMCPFunctions:
         assert is_server_enabled("test") is False
 
 
+class TestConfigCache:
+    """Test cases for the mtime-validated config cache."""
+
+    def test_repeated_loads_parse_once(self, temp_config_path):
+        add_server("test", "http", "https://example.com")
+
+        with patch("openhands_cli.mcp.mcp_utils.MCPConfig.from_file") as mock_from_file:
+            list_servers()
+            list_enabled_servers()
+            get_config_status()
+
+        mock_from_file.assert_not_called()
+
+    def test_external_edit_is_picked_up(self, temp_config_path):
+        add_server("test", "http", "https://example.com")
+        assert server_exists("test")
+
+        temp_config_path.write_text(
+            json.dumps({"mcpServers": {"other": {"command": "other"}}})
+        )
+
+        assert not server_exists("test")
+        assert server_exists("other")
+
+    def test_mutating_a_loaded_config_does_not_affect_the_cache(self, temp_config_path):
+        add_server("test", "http", "https://example.com")
+
+        load_mcp_config().mcpServers.clear()
+
+        assert server_exists("test")
+
+    def test_save_is_atomic_and_leaves_no_temp_files(self, temp_config_path):
+        add_server("test", "http", "https://example.com")
+        remove_server("test")
+
+        assert [p.name for p in temp_config_path.parent.iterdir()] == ["mcp.json"]
+        assert json.loads(temp_config_path.read_text()) == {"mcpServers": {}}
+
+
 class TestParseHelpers:
     """Test cases for parsing helper functions."""
 
@@ -105,6 +105,11 @@ async def _click_previous_conversation(pilot: "Pilot") -> None:
         history_items[1].on_click()
         await pilot.wait_for_scheduled_animations()
 
+    # Whether the /new toast from phase 3 is still shown depends on how long
+    # the earlier phases took, so dismiss it to keep the snapshots stable.
+    pilot.app.clear_notifications()
+    await pilot.wait_for_scheduled_animations()
+
 
 async def _wait_for_conversation_load(pilot: "Pilot") -> None:
     """Phase 6: Click previous conversation, then wait for it to load."""
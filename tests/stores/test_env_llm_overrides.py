@@ -8,12 +8,14 @@ from pydantic import SecretStr
 
 from openhands.sdk import LLM
 from openhands_cli.stores.agent_store import (
+    LLMEnvOverrides,
+    apply_llm_overrides,
+)
+from openhands_cli.stores.env_vars import (
     ENV_LLM_API_KEY,
     ENV_LLM_BASE_URL,
     ENV_LLM_MODEL,
-    LLMEnvOverrides,
     MissingEnvironmentVariablesError,
-    apply_llm_overrides,
     check_and_warn_env_vars,
 )
 
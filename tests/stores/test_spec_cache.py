@@ -0,0 +1,116 @@
+"""Tests for memoized agent spec loading."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openhands_cli.stores import AgentStore
+from openhands_cli.stores.agent_store import clear_agent_spec_cache
+from openhands_cli.stores.spec_cache import MemoizedLoad, skills_fingerprint
+from tests.conftest import save_test_agent
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_agent_spec_cache()
+    yield
+    clear_agent_spec_cache()
+
+
+class TestMemoizedLoad:
+    def test_loads_once_per_key(self):
+        cache: MemoizedLoad[str] = MemoizedLoad()
+        load = MagicMock(side_effect=["first", "second"])
+
+        assert cache.get("a", load) == "first"
+        assert cache.get("a", load) == "first"
+        assert cache.get("b", load) == "second"
+        assert load.call_count == 2
+
+    def test_failed_load_is_not_cached(self):
+        cache: MemoizedLoad[str] = MemoizedLoad()
+
+        with pytest.raises(ValueError):
+            cache.get("a", MagicMock(side_effect=ValueError))
+
+        assert cache.get("a", lambda: "ok") == "ok"
+
+    def test_clear(self):
+        cache: MemoizedLoad[str] = MemoizedLoad()
+        cache.get("a", lambda: "first")
+        cache.clear()
+
+        assert cache.get("a", lambda: "second") == "second"
+
+
+class TestSkillsFingerprint:
+    def test_changes_when_a_skill_is_added_or_edited(self, tmp_path):
+        before = skills_fingerprint(tmp_path)
+        assert skills_fingerprint(tmp_path) == before
+
+        skill = tmp_path / ".openhands" / "skills" / "repo.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text("# Repo")
+        added = skills_fingerprint(tmp_path)
+        assert added != before
+
+        skill.write_text("# Repo, edited")
+        assert skills_fingerprint(tmp_path) != added
+
+    def test_covers_third_party_files_in_work_dir(self, tmp_path):
+        before = skills_fingerprint(tmp_path)
+        (tmp_path / "AGENTS.md").write_text("Be nice")
+
+        assert skills_fingerprint(tmp_path) != before
+
+
+class TestAgentStoreMemoization:
+    def test_skills_are_loaded_once(self, mock_locations):
+        save_test_agent(mock_locations.persistence_dir)
+
+        from openhands_cli.stores import agent_store
+
+        with patch.object(
+            agent_store,
+            "load_project_skills",
+            wraps=agent_store.load_project_skills,
+        ) as load_skills:
+            first = AgentStore().load_or_create()
+            second = AgentStore().load_or_create(session_id="abc")
+
+        assert first is not None and second is not None
+        assert load_skills.call_count == 1
+
+    def test_agents_do_not_share_llm_metrics(self, mock_locations):
+        save_test_agent(mock_locations.persistence_dir)
+        first = AgentStore().load_or_create()
+        second = AgentStore().load_or_create()
+        assert first is not None and second is not None
+
+        first.llm.metrics.add_cost(1.0)
+
+        assert second.llm.metrics.accumulated_cost == 0
+
+    def test_new_project_skill_invalidates_context(self, mock_locations):
+        save_test_agent(mock_locations.persistence_dir)
+        first = AgentStore().load_or_create()
+        assert first is not None and first.agent_context is not None
+        assert "repo" not in {s.name for s in first.agent_context.skills}
+
+        skills_dir = mock_locations.work_dir / ".openhands" / "skills"
+        skills_dir.mkdir(parents=True)
+        (skills_dir / "repo.md").write_text("Always run the tests.")
+
+        second = AgentStore().load_or_create()
+        assert second is not None and second.agent_context is not None
+        assert "repo" in {s.name for s in second.agent_context.skills}
+
+    def test_extending_returned_skills_does_not_leak(self, mock_locations):
+        save_test_agent(mock_locations.persistence_dir)
+        first = AgentStore().load_or_create()
+        assert first is not None and first.agent_context is not None
+        first.agent_context.skills.append(MagicMock(name="extra"))
+
+        second = AgentStore().load_or_create()
+        assert second is not None and second.agent_context is not None
+        assert len(second.agent_context.skills) == len(first.agent_context.skills) - 1
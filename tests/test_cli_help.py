@@ -58,6 +58,29 @@ def test_acp_subcommand_supports_resume_flags() -> None:
     assert args.last is True
 
 
+def test_acp_subcommand_supports_streaming_flag() -> None:
+    """ACP subcommand should accept --streaming, defaulting to off."""
+    parser = create_main_parser()
+
+    args = parser.parse_args(["acp"])
+    assert args.streaming is False
+
+    args = parser.parse_args(["acp", "--streaming", "--always-approve"])
+    assert args.streaming is True
+    assert args.always_approve is True
+
+
+def test_acp_subcommand_supports_max_sessions() -> None:
+    """ACP subcommand should accept --max-sessions N."""
+    parser = create_main_parser()
+
+    args = parser.parse_args(["acp"])
+    assert args.max_sessions == 4
+
+    args = parser.parse_args(["acp", "--max-sessions", "8"])
+    assert args.max_sessions == 8
+
+
 def test_view_subcommand_parses_correctly() -> None:
     """View subcommand should parse conversation_id and --limit correctly.
 
@@ -82,3 +105,13 @@ def test_view_subcommand_parses_correctly() -> None:
     assert args.command == "view"
     assert args.conversation_id == "test-conversation-id"
     assert args.limit == 5
+
+
+def test_conversations_compact_subcommand_parses_correctly() -> None:
+    """'conversations compact' should require and capture a conversation ID."""
+    parser = create_main_parser()
+
+    args = parser.parse_args(["conversations", "compact", "test-conversation-id"])
+    assert args.command == "conversations"
+    assert args.conversations_command == "compact"
+    assert args.conversation_id == "test-conversation-id"
@@ -0,0 +1,100 @@
+"""Startup import checks for the CLI entrypoint.
+
+Each case runs a subcommand in a fresh interpreter with the import profiler
+from hooks/rthook_profile_imports.py enabled, then checks that it didn't
+import packages it doesn't need, such as the agent SDK or the TUI, and that
+importing the entrypoint stayed within a time budget. Set
+OPENHANDS_IMPORT_BUDGET_SCALE to relax the budget on slow machines.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PROFILE_HOOK = REPO_ROOT / "hooks" / "rthook_profile_imports.py"
+
+# Runs the profiling hook the same way the PyInstaller runtime hook would,
+# then the CLI with the given arguments.
+_RUNNER = """
+import runpy, sys
+runpy.run_path(sys.argv[1])
+sys.argv = ["openhands", *sys.argv[2:]]
+from openhands_cli.entrypoint import main
+main()
+"""
+
+ENTRYPOINT = "openhands_cli.entrypoint"
+
+# The entrypoint imports in about 200ms; the budget leaves room for slow CI
+# machines while still catching an eager SDK or TUI import (seconds).
+ENTRYPOINT_BUDGET_MS = 1000.0
+
+# Packages only the agent runtime and the TUI need.
+HEAVY = ("openhands.sdk", "openhands.tools", "openhands_cli.tui", "textual")
+
+
+def _profile_imports(tmp_path: Path, *args: str) -> dict[str, float]:
+    """Run the CLI and return first-load import times in ms, by module."""
+    (tmp_path / "dist").mkdir()
+    env = {
+        **os.environ,
+        "IMPORT_PROFILING": "1",
+        "OPENHANDS_PERSISTENCE_DIR": str(tmp_path),
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])
+        ),
+    }
+    subprocess.run(
+        [sys.executable, "-c", _RUNNER, str(PROFILE_HOOK), *args],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        timeout=120,
+    )
+
+    with open(tmp_path / "dist" / "import_profiler.csv", encoding="utf-8") as f:
+        return {row["module"]: float(row["total_ms"]) for row in csv.DictReader(f)}
+
+
+def _budget_ms() -> float:
+    scale = float(os.environ.get("OPENHANDS_IMPORT_BUDGET_SCALE", "1"))
+    return ENTRYPOINT_BUDGET_MS * scale
+
+
+def _imported(timings: dict[str, float], package: str) -> list[str]:
+    return [
+        name for name in timings if name == package or name.startswith(f"{package}.")
+    ]
+
+
+@pytest.mark.parametrize(
+    "args, not_imported",
+    [
+        (("--help",), (*HEAVY, "fastmcp", "prompt_toolkit")),
+        (("acp", "--help"), (*HEAVY, "fastmcp", "prompt_toolkit")),
+        (
+            ("mcp", "list"),
+            ("openhands.sdk", "openhands.tools", "openhands_cli.tui", "prompt_toolkit"),
+        ),
+        # The viewer renders events with the SDK's visualizer, but only needs
+        # the tools once it decodes events.
+        (("view", "does-not-exist"), ("openhands.tools", "openhands_cli.tui")),
+    ],
+)
+def test_subcommand_startup_imports(tmp_path, args, not_imported):
+    timings = _profile_imports(tmp_path, *args)
+
+    assert ENTRYPOINT in timings
+    assert timings[ENTRYPOINT] <= _budget_ms(), (
+        f"{args}: importing {ENTRYPOINT} took {timings[ENTRYPOINT]:.0f}ms"
+    )
+    for package in not_imported:
+        assert not _imported(timings, package), f"{args} imported {package}"
@@ -13,6 +13,18 @@ class TestCliSettings:
         cfg = CliSettings()
         assert cfg.default_cells_expanded is False
         assert cfg.auto_open_plan_panel is True
+        assert cfg.stream_responses is False
+        assert cfg.max_cached_conversations == 8
+        assert cfg.share_mcp_connections is True
+
+    def test_max_cached_conversations_must_be_positive(self, tmp_path: Path):
+        config_path = tmp_path / "cli_config.json"
+        config_path.write_text(json.dumps({"max_cached_conversations": 0}))
+
+        with patch.object(CliSettings, "get_config_path", return_value=config_path):
+            cfg = CliSettings.load()
+
+        assert cfg == CliSettings()
 
     @pytest.mark.parametrize("value", [True, False])
     def test_default_cells_expanded_accepts_bool(self, value: bool):
@@ -106,6 +118,8 @@ class TestCliSettings:
             default_cells_expanded=False,
             auto_open_plan_panel=False,
             enable_critic=False,
+            stream_responses=True,
+            max_cached_conversations=3,
         )
 
         with patch.object(CliSettings, "get_config_path", return_value=config_path):
@@ -116,6 +130,9 @@ class TestCliSettings:
                 "default_cells_expanded": False,
                 "auto_open_plan_panel": False,
                 "enable_critic": False,
+                "stream_responses": True,
+                "max_cached_conversations": 3,
+                "share_mcp_connections": True,
             },
             indent=2,
         )
@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 from textual.app import App, ComposeResult
-from textual.widgets import Switch
+from textual.widgets import Input, Switch
 
 from openhands_cli.stores import CliSettings
 from openhands_cli.tui.modals.settings.components.cli_settings_tab import (
@@ -114,3 +114,42 @@ class TestCliSettingsTab:
             result = tab.get_cli_settings()
             assert isinstance(result, CliSettings)
             assert result.auto_open_plan_panel is new_value
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("new_value", [True, False])
+    async def test_get_cli_settings_reflects_stream_responses(self, new_value: bool):
+        """Verify get_cli_settings() captures stream_responses switch state."""
+        cfg = CliSettings(stream_responses=not new_value)
+        app = _TestApp(cfg)
+
+        async with app.run_test():
+            tab = app.query_one(CliSettingsTab)
+            switch = tab.query_one("#stream_responses_switch", Switch)
+            assert switch.value is not new_value
+
+            switch.value = new_value
+
+            result = tab.get_cli_settings()
+            assert result.stream_responses is new_value
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "entered, expected",
+        [("3", 3), ("0", 1), ("", 5), ("-", 5)],
+    )
+    async def test_get_cli_settings_reads_max_cached_conversations(
+        self, entered: str, expected: int
+    ):
+        """Invalid or empty entries keep the saved cap; the cap is at least 1."""
+        cfg = CliSettings(max_cached_conversations=5)
+        app = _TestApp(cfg)
+
+        async with app.run_test():
+            tab = app.query_one(CliSettingsTab)
+            field = tab.query_one("#max_cached_conversations_input", Input)
+            assert field.value == "5"
+
+            field.value = entered
+
+            result = tab.get_cli_settings()
+            assert result.max_cached_conversations == expected
@@ -144,6 +144,40 @@ async def test_history_panel_posts_switch_request_on_selection(
         assert app.received_switch_requests[0] == uuid.UUID(conv_id)
 
 
+@pytest.mark.asyncio
+async def test_history_panel_scan_uses_its_own_store(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the background scan does not share the panel's store."""
+    conversations = [
+        ConversationMetadata(
+            id=uuid.uuid4().hex,
+            created_at=datetime(2025, 1, 1, tzinfo=UTC),
+            title="scanned",
+        ),
+    ]
+    scanning_stores: list[LocalFileStore] = []
+
+    def iter_conversations(self, limit=100):
+        scanning_stores.append(self)
+        yield conversations
+
+    monkeypatch.setattr(LocalFileStore, "pending_scan_count", lambda self: 10**6)
+    monkeypatch.setattr(LocalFileStore, "iter_conversations", iter_conversations)
+
+    app = HistoryMessagesTestApp()
+    async with app.run_test() as pilot:
+        panel = app.query_one(HistorySidePanel)
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert len(scanning_stores) == 1
+        assert scanning_stores[0] is not panel._store
+        assert scanning_stores[0].base_dir == panel._store.base_dir
+        list_container = panel.query_one("#history-list", VerticalScroll)
+        assert len(list_container.query(HistoryItem)) == 1
+
+
 class SwitchModalTestApp(App):
     """App for testing SwitchConversationModal."""
 
@@ -0,0 +1,143 @@
+"""Tests for setting conversations up in the background."""
+
+import asyncio
+import threading
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openhands_cli.tui.core.runner_registry import RunnerRegistry
+from openhands_cli.tui.core.user_message_controller import UserMessageController
+
+
+class _Harness:
+    def __init__(self, build) -> None:
+        self.conversation_id = uuid.uuid4()
+        self.state = MagicMock(conversation_id=self.conversation_id)
+        self.factory = MagicMock()
+        self.factory.build.side_effect = build
+        self.notify = MagicMock()
+        self.tasks: list[asyncio.Task] = []
+
+        def run_worker(coro, **_kwargs):
+            self.tasks.append(asyncio.ensure_future(coro))
+
+        self.runners = RunnerRegistry(
+            factory=self.factory,
+            state=self.state,
+            message_pump=MagicMock(),
+            notification_callback=self.notify,
+            run_worker=run_worker,
+        )
+        self.controller = UserMessageController(
+            state=self.state,
+            runners=self.runners,
+            run_worker=run_worker,
+            headless_mode=False,
+        )
+
+    async def settle(self) -> None:
+        while not all(task.done() for task in self.tasks):
+            await asyncio.gather(*self.tasks)
+
+
+def _make_runner() -> MagicMock:
+    runner = MagicMock(is_running=False)
+    runner.queue_message = AsyncMock()
+    runner.process_message_async = AsyncMock()
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_messages_are_accepted_while_the_runner_is_built():
+    release = threading.Event()
+    runner = _make_runner()
+
+    def build(*_args, **_kwargs):
+        release.wait(timeout=5)
+        return runner
+
+    harness = _Harness(build)
+    await harness.controller.handle_user_message("first")
+    await harness.controller.handle_user_message("second")
+
+    # Both messages are shown before the conversation exists.
+    visualizer = harness.factory.create_visualizer.return_value
+    assert [c.args[0] for c in visualizer.render_user_message.call_args_list] == [
+        "first",
+        "second",
+    ]
+    harness.state.set_initializing.assert_called_once_with(True)
+    runner.process_message_async.assert_not_called()
+
+    release.set()
+    await harness.settle()
+
+    harness.factory.build.assert_called_once()
+    runner.queue_message.assert_awaited_once_with("first")
+    runner.process_message_async.assert_awaited_once_with("second", False)
+    harness.state.set_initializing.assert_called_with(False)
+    assert harness.runners.current is runner
+    harness.state.attach_conversation_state.assert_called_once_with(
+        runner.conversation.state
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_setup_is_reported_and_retried_on_next_message():
+    runner = _make_runner()
+    harness = _Harness(MagicMock(side_effect=[RuntimeError("no agent"), runner]))
+
+    await harness.controller.handle_user_message("hello")
+    await harness.settle()
+
+    harness.notify.assert_called_once()
+    assert harness.notify.call_args.args[2] == "error"
+    assert harness.runners.current is None
+
+    await harness.controller.handle_user_message("hello again")
+    await harness.settle()
+
+    # The message typed during the failed setup is sent too, not dropped.
+    assert harness.factory.build.call_count == 2
+    runner.queue_message.assert_awaited_once_with("hello")
+    runner.process_message_async.assert_awaited_once_with("hello again", False)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_setup_does_not_leave_waiters_hanging():
+    started = threading.Event()
+    release = threading.Event()
+
+    def build(*_args, **_kwargs):
+        started.set()
+        release.wait(timeout=5)
+        return _make_runner()
+
+    harness = _Harness(build)
+    await harness.controller.handle_user_message("hello")
+    waiter = asyncio.ensure_future(harness.runners.wait_for(harness.conversation_id))
+    await asyncio.to_thread(started.wait, 5)
+
+    build_task = harness.tasks[0]
+    build_task.cancel()
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(waiter, timeout=5)
+    harness.state.set_initializing.assert_called_with(False)
+
+
+@pytest.mark.asyncio
+async def test_runner_built_for_another_conversation_is_not_made_current():
+    runner = _make_runner()
+    harness = _Harness(MagicMock(return_value=runner))
+    other_id = uuid.uuid4()
+
+    harness.runners.start(other_id)
+    await harness.settle()
+
+    assert harness.runners.get(other_id) is runner
+    assert harness.runners.current is None
+    harness.state.set_initializing.assert_not_called()
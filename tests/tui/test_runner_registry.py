@@ -0,0 +1,99 @@
+"""Tests for RunnerRegistry's bounded, least-recently-used runner cache."""
+
+import uuid
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+from openhands_cli.stores import CliSettings
+from openhands_cli.tui.core.runner_registry import RunnerRegistry
+
+
+class _StubRunner:
+    """Stands in for ConversationRunner; `is_running` can be set directly."""
+
+    def __init__(self) -> None:
+        self.is_running = False
+        self.close = MagicMock()
+        self.conversation = MagicMock()
+        self.visualizer = MagicMock()
+
+
+def _make_registry(max_runners: int | None = 2, on_evict=None):
+    state = MagicMock()
+    factory = MagicMock()
+    factory.create.side_effect = lambda *_args, **_kwargs: _StubRunner()
+    run_worker = MagicMock()
+    registry = RunnerRegistry(
+        factory=factory,
+        state=state,
+        message_pump=MagicMock(),
+        notification_callback=MagicMock(),
+        run_worker=run_worker,
+        max_runners=max_runners,
+        on_evict=on_evict,
+    )
+    return registry, run_worker
+
+
+def _closed(run_worker: MagicMock) -> list:
+    """Return the close callables handed to worker threads, in order."""
+    return [c.args[0] for c in run_worker.call_args_list]
+
+
+def test_least_recently_used_idle_runner_is_closed():
+    registry, run_worker = _make_registry()
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    runner_a = registry.get_or_create(a)
+    registry.get_or_create(b)
+    registry.get_or_create(a)  # a is now more recent than b
+    runner_b = registry.get(b)
+    assert runner_b is not None
+    registry.get_or_create(c)
+
+    assert registry.get(a) is runner_a
+    assert registry.get(b) is None
+    assert _closed(run_worker) == [runner_b.close]
+    assert run_worker.call_args.kwargs["thread"] is True
+
+
+def test_running_and_current_runners_are_never_evicted():
+    registry, run_worker = _make_registry(max_runners=1)
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    runner_a = cast(_StubRunner, registry.get_or_create(a))
+    runner_a.is_running = True
+    runner_b = registry.get_or_create(b)
+
+    # a is running and b is current, so both stay over the cap.
+    assert registry.get(a) is runner_a
+    assert registry.get(b) is runner_b
+    run_worker.assert_not_called()
+
+    runner_a.is_running = False
+    registry.get_or_create(c)
+
+    assert _closed(run_worker) == [runner_a.close, runner_b.close]
+    assert registry.current is registry.get(c)
+
+
+def test_cap_defaults_to_cli_settings():
+    registry, run_worker = _make_registry(max_runners=None)
+    settings = CliSettings(max_cached_conversations=1)
+
+    with patch.object(CliSettings, "load", return_value=settings):
+        first = registry.get_or_create(uuid.uuid4())
+        registry.get_or_create(uuid.uuid4())
+
+    assert _closed(run_worker) == [first.close]
+
+
+def test_eviction_is_reported_per_conversation():
+    on_evict = MagicMock()
+    registry, _ = _make_registry(max_runners=1, on_evict=on_evict)
+    a, b = uuid.uuid4(), uuid.uuid4()
+
+    registry.get_or_create(a)
+    registry.get_or_create(b)
+
+    on_evict.assert_called_once_with(a)
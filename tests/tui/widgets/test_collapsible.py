@@ -3,10 +3,13 @@ from textual.app import App, ComposeResult
 from textual.widgets import Static
 
 from openhands_cli.theme import OPENHANDS_THEME
+from openhands_cli.tui.widgets import collapsible as collapsible_module
 from openhands_cli.tui.widgets.collapsible import (
     Collapsible,
     CollapsibleNavigationMixin,
+    CollapsibleShowMore,
     CollapsibleTitle,
+    LazyBody,
 )
 
 
@@ -188,3 +191,91 @@ async def test_enter_still_toggles_collapsible() -> None:
         await pilot.press("enter")
         await pilot.pause()
         assert first_collapsible.collapsed is True
+
+
+def test_snapshot_recreates_current_state() -> None:
+    """snapshot() rebuilds a collapsible with its current title and state."""
+    collapsible = Collapsible(
+        "old content", title="Old", collapsed=True, symbol_color="#ff0000"
+    )
+    collapsible.update_title("New")
+    collapsible.update_content("new content")
+    collapsible.styles.padding = (0, 0, 0, 1)
+
+    build = collapsible.snapshot()
+    copy = build()
+
+    assert copy is not collapsible
+    assert copy.title == "New"
+    assert copy._content == "new content"
+    assert copy.collapsed is True
+    assert copy._title.symbol_color == "#ff0000"
+    assert tuple(copy.styles.padding) == (0, 0, 0, 1)
+    assert build(collapsed=False).collapsed is False
+
+
+@pytest.mark.asyncio
+async def test_lazy_body_rendered_on_expand() -> None:
+    """A LazyBody is only rendered when the cell is expanded."""
+    calls = []
+
+    def render() -> str:
+        calls.append(1)
+        return "expensive output"
+
+    collapsible = Collapsible(LazyBody(render), title="Title", collapsed=True)
+    app = CollapsibleTestApp(collapsible)
+
+    async with app.run_test() as pilot:
+        assert calls == []
+        assert str(collapsible._content_widget.content) == ""
+
+        collapsible.collapsed = False
+        await pilot.pause()
+        assert calls == [1]
+        assert str(collapsible._content_widget.content) == "expensive output"
+
+        # Collapsing drops the displayed text; re-expanding hits the cache
+        collapsible.collapsed = True
+        await pilot.pause()
+        assert str(collapsible._content_widget.content) == ""
+        collapsible.collapsed = False
+        await pilot.pause()
+        assert calls == [1]
+
+
+def test_rendered_lazy_bodies_are_bounded() -> None:
+    """Only RENDERED_BODY_CACHE_SIZE rendered bodies are kept."""
+    collapsible_module._render_lazy_body.cache_clear()
+    bodies = [
+        LazyBody(lambda i=i: f"body {i}")
+        for i in range(collapsible_module.RENDERED_BODY_CACHE_SIZE + 5)
+    ]
+    for body in bodies:
+        body.text()
+
+    info = collapsible_module._render_lazy_body.cache_info()
+    assert info.currsize == collapsible_module.RENDERED_BODY_CACHE_SIZE
+
+
+@pytest.mark.asyncio
+async def test_large_body_is_paged(monkeypatch) -> None:
+    """Long bodies show one page at a time with a show-more link."""
+    monkeypatch.setattr(collapsible_module, "BODY_PAGE_CHARS", 10)
+    collapsible = Collapsible("x" * 25, title="Title", collapsed=False)
+    app = CollapsibleTestApp(collapsible)
+
+    async with app.run_test() as pilot:
+        show_more = collapsible.query_one(CollapsibleShowMore)
+        assert str(collapsible._content_widget.content) == "x" * 10
+        assert show_more.display is True
+        assert "15 characters left" in str(show_more.content)
+
+        await pilot.click(CollapsibleShowMore)
+        await pilot.pause()
+        assert str(collapsible._content_widget.content) == "x" * 20
+
+        await pilot.click(CollapsibleShowMore)
+        await pilot.pause()
+        assert str(collapsible._content_widget.content) == "x" * 25
+        assert show_more.display is False
@@ -0,0 +1,199 @@
+"""Tests for the virtualized transcript in ScrollableContent."""
+
+import uuid
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from openhands_cli.tui.widgets import main_display
+from openhands_cli.tui.widgets.collapsible import Collapsible
+from openhands_cli.tui.widgets.main_display import (
+    ScrollableContent,
+    TranscriptCache,
+    TranscriptRow,
+)
+
+
+class TranscriptTestApp(App):
+    def compose(self) -> ComposeResult:
+        yield ScrollableContent(id="scroll_view")
+
+
+@pytest.fixture(autouse=True)
+def small_window(monkeypatch):
+    monkeypatch.setattr(main_display, "MAX_MOUNTED_ROWS", 10)
+    monkeypatch.setattr(main_display, "ROW_PAGE_SIZE", 5)
+
+
+def _append_cells(scroll_view: ScrollableContent, count: int) -> list[Collapsible]:
+    cells = []
+    for i in range(count):
+        cell = Collapsible(f"content {i}", title=f"cell {i}", collapsed=True)
+        scroll_view.append_row(cell)
+        cells.append(cell)
+    return cells
+
+
+def _mounted_titles(scroll_view: ScrollableContent) -> list[str]:
+    return [str(c.title) for c in scroll_view.query(Collapsible)]
+
+
+@pytest.mark.asyncio
+async def test_mounted_rows_stay_bounded() -> None:
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        scroll_view = app.query_one(ScrollableContent)
+        _append_cells(scroll_view, 50)
+        await pilot.pause()
+
+        assert scroll_view.row_count == 50
+        assert scroll_view.mounted_row_count <= 15
+        assert len(scroll_view.query(Collapsible)) == scroll_view.mounted_row_count
+        assert _mounted_titles(scroll_view)[-1] == "cell 49"
+
+
+@pytest.mark.asyncio
+async def test_scrolling_up_rebuilds_earlier_rows() -> None:
+    app = TranscriptTestApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        scroll_view = app.query_one(ScrollableContent)
+        _append_cells(scroll_view, 30)
+        scroll_view.scroll_end(animate=False)
+        await pilot.pause()
+        first_mounted = _mounted_titles(scroll_view)[0]
+
+        scroll_view.scroll_home(animate=False)
+        await pilot.pause()
+        await pilot.pause()
+
+        titles = _mounted_titles(scroll_view)
+        assert titles[0] != first_mounted
+        assert titles == sorted(titles, key=lambda t: int(t.split()[1]))
+        assert scroll_view.mounted_row_count <= 10
+
+
+@pytest.mark.asyncio
+async def test_rebuilt_rows_keep_state_and_updates() -> None:
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        scroll_view = app.query_one(ScrollableContent)
+        cells = _append_cells(scroll_view, 1)
+        cells[0].collapsed = False
+        _append_cells(scroll_view, 30)
+        await pilot.pause()
+        assert "cell 0" not in _mounted_titles(scroll_view)
+
+        # The producer keeps updating the original widget while it is unmounted
+        cells[0].update_title("cell 0 done")
+        scroll_view.sync_row(cells[0])
+
+        row = scroll_view._rows[0]
+        rebuilt = row.rebuild()
+        assert isinstance(rebuilt, Collapsible)
+        assert rebuilt.title == "cell 0 done"
+        assert rebuilt.collapsed is False
+
+
+@pytest.mark.asyncio
+async def test_append_jumps_back_to_tail() -> None:
+    app = TranscriptTestApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        scroll_view = app.query_one(ScrollableContent)
+        _append_cells(scroll_view, 30)
+        scroll_view.scroll_end(animate=False)
+        await pilot.pause()
+        scroll_view.scroll_home(animate=False)
+        await pilot.pause()
+        await pilot.pause()
+
+        scroll_view.append_row(Static("latest"), lambda: Static("latest"))
+        await pilot.pause()
+
+        assert _mounted_titles(scroll_view)[-1] == "cell 29"
+        assert scroll_view.mounted_row_count <= 11
+
+
+@pytest.mark.asyncio
+async def test_unmounted_rows_follow_toggle_all() -> None:
+    app = TranscriptTestApp()
+    async with app.run_test() as pilot:
+        scroll_view = app.query_one(ScrollableContent)
+        _append_cells(scroll_view, 30)
+        await pilot.pause()
+
+        scroll_view.set_unmounted_rows_collapsed(False)
+
+        rebuilt = scroll_view._rows[0].rebuild()
+        assert isinstance(rebuilt, Collapsible)
+        assert rebuilt.collapsed is False
+
+
+@pytest.mark.asyncio
+async def test_switching_back_restores_transcript() -> None:
+    app = TranscriptTestApp()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    async with app.run_test() as pilot:
+        scroll_view = app.query_one(ScrollableContent)
+        scroll_view.conversation_id = first
+        _append_cells(scroll_view, 30)
+        await pilot.pause()
+
+        scroll_view.conversation_id = None
+        scroll_view.conversation_id = second
+        await pilot.pause()
+        assert scroll_view.row_count == 0
+        assert not _mounted_titles(scroll_view)
+
+        scroll_view.append_row(Static("other"), lambda: Static("other"))
+        scroll_view.conversation_id = first
+        await pilot.pause()
+
+        assert scroll_view.row_count == 30
+        assert _mounted_titles(scroll_view)[-1] == "cell 29"
+        assert scroll_view.mounted_row_count <= 10
+
+        scroll_view.conversation_id = second
+        await pilot.pause()
+        assert scroll_view.row_count == 1
+
+
+@pytest.mark.asyncio
+async def test_discarded_transcript_is_not_restored() -> None:
+    app = TranscriptTestApp()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    async with app.run_test() as pilot:
+        scroll_view = app.query_one(ScrollableContent)
+        scroll_view.conversation_id = first
+        _append_cells(scroll_view, 5)
+        scroll_view.conversation_id = second
+        await pilot.pause()
+
+        scroll_view.discard_transcript(first)
+        scroll_view.conversation_id = first
+        await pilot.pause()
+
+        assert scroll_view.row_count == 0
+
+
+def test_transcript_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(main_display, "MAX_CACHED_TRANSCRIPTS", 2)
+    monkeypatch.setattr(main_display, "MAX_CACHED_ROWS", 10)
+    cache = TranscriptCache()
+    ids = [uuid.uuid4() for _ in range(3)]
+
+    def rows(count: int) -> list[TranscriptRow]:
+        return [TranscriptRow(build=Static) for _ in range(count)]
+
+    cache.put(ids[0], rows(2))
+    cache.put(ids[1], rows(2))
+    cache.put(ids[2], rows(2))
+    assert ids[0] not in cache
+    assert cache.row_count == 4
+
+    # Over the row budget, older transcripts go first, then the oldest rows.
+    cache.put(ids[0], rows(12))
+    assert ids[1] not in cache and ids[2] not in cache
+    assert cache.row_count == 10
+    assert len(cache.pop(ids[0]) or []) == 10
+    assert cache.row_count == 0
@@ -1,7 +1,7 @@
 """Tests for ConversationVisualizer and Chinese character markup handling."""
 
 from typing import TYPE_CHECKING, cast
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import pytest
 from rich.errors import MarkupError
@@ -11,9 +11,10 @@ from textual.containers import VerticalScroll
 from textual.widgets import Static
 
 from openhands.sdk import Action, MessageEvent, TextContent
-from openhands.sdk.event import ActionEvent
+from openhands.sdk.event import ActionEvent, ObservationEvent
 from openhands.sdk.event.conversation_error import ConversationErrorEvent
 from openhands.sdk.llm import MessageToolCall
+from openhands.sdk.tool.builtins import FinishObservation
 from openhands.tools.terminal.definition import TerminalAction
 from openhands_cli.stores import CliSettings
 from openhands_cli.tui.textual_app import OpenHandsApp
@@ -21,6 +22,7 @@ from openhands_cli.tui.widgets.richlog_visualizer import (
     ELLIPSIS,
     MAX_LINE_LENGTH,
     ConversationVisualizer,
+    UIUpdateQueue,
 )
 
 
@@ -366,6 +368,31 @@ class TestConversationErrorEventHandling:
             assert not collapsible.collapsed
 
 
+class TestLazyEventBodies:
+    """Tests that event bodies are only rendered when displayed."""
+
+    def test_action_body_is_not_rendered_eagerly(self, visualizer):
+        action_event = create_terminal_action_event("ls -la")
+
+        with patch.object(
+            ActionEvent, "visualize", new_callable=PropertyMock
+        ) as mock_visualize:
+            collapsible = visualizer._create_event_collapsible(action_event)
+
+        assert collapsible is not None
+        mock_visualize.assert_not_called()
+
+    def test_empty_unpaired_observation_is_skipped(self, visualizer):
+        observation_event = ObservationEvent(
+            observation=FinishObservation.from_text(text="done"),
+            action_id="action_1",
+            tool_name="finish",
+            tool_call_id="call_1",
+        )
+
+        assert visualizer._create_event_collapsible(observation_event) is None
+
+
 class TestEventSymbolColor:
     """Tests for event-based symbol coloring in collapsibles."""
 
@@ -1351,3 +1378,184 @@ class TestDefaultAgentPrefixBehavior:
         assert "(Code Reviewer Agent)" in title
         # Should contain the command
         assert "git diff" in title
+
+
+class TestUIUpdateQueue:
+    """Tests for batching UI updates from the conversation thread."""
+
+    def test_main_thread_updates_apply_immediately(self):
+        from unittest.mock import MagicMock
+
+        queue = UIUpdateQueue(MagicMock())
+        applied: list[str] = []
+        scrolls: list[int] = []
+
+        def update(name: str) -> None:
+            applied.append(name)
+            queue.after_batch(lambda: scrolls.append(1))
+
+        queue.submit(update, "a")
+
+        assert applied == ["a"]
+        assert scrolls == [1]
+
+    @pytest.mark.asyncio
+    async def test_thread_updates_are_batched(self):
+        import asyncio
+        import threading
+        from unittest.mock import MagicMock
+
+        app = MagicMock()
+        queue = UIUpdateQueue(app)
+        applied: list[int] = []
+        scrolls: list[int] = []
+
+        def scroll() -> None:
+            scrolls.append(1)
+
+        def update(i: int) -> None:
+            applied.append(i)
+            queue.after_batch(scroll)
+
+        def produce() -> None:
+            for i in range(5):
+                queue.submit(update, i)
+
+        # The producer never waits on the event loop, which is blocked here.
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        await asyncio.sleep(0)
+
+        # One flush is scheduled for the whole burst, nothing applied yet
+        app.call_from_thread.assert_not_called()
+        app.set_timer.assert_called_once()
+        assert applied == []
+
+        queue.flush()
+
+        assert applied == [0, 1, 2, 3, 4]
+        assert scrolls == [1]
+
+    def test_sub_visualizer_shares_queue(self):
+        app: OpenHandsApp = cast(OpenHandsApp, App())
+        visualizer = ConversationVisualizer(VerticalScroll(), app)
+
+        sub_visualizer = visualizer.create_sub_visualizer("helper")
+
+        assert sub_visualizer._updates is visualizer._updates
+
+    @pytest.mark.asyncio
+    async def test_after_pending_updates_runs_after_queued_updates(self):
+        import threading
+        from unittest.mock import MagicMock
+
+        app = MagicMock()
+        queue = UIUpdateQueue(app)
+        visualizer = ConversationVisualizer(VerticalScroll(), app, update_queue=queue)
+        applied: list[str] = []
+
+        def produce() -> None:
+            queue.submit(applied.append, "action")
+            visualizer.after_pending_updates(applied.append, "confirmation")
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+
+        assert applied == []
+
+        queue.flush()
+
+        assert applied == ["action", "confirmation"]
+
+
+def _stream_chunk(content=None, reasoning=None, tool_calls=None):
+    """Build a minimal streamed chunk with a single choice."""
+    from types import SimpleNamespace
+
+    delta = SimpleNamespace(
+        content=content, reasoning_content=reasoning, tool_calls=tool_calls
+    )
+    return SimpleNamespace(choices=[SimpleNamespace(index=0, delta=delta)])
+
+
+class TestTokenStreaming:
+    """Tests for the live cell shown while a response is streamed."""
+
+    @pytest.fixture
+    def streaming_visualizer(self):
+        from unittest.mock import MagicMock
+
+        return ConversationVisualizer(MagicMock(), MagicMock())
+
+    def test_deltas_render_into_live_cell(self, streaming_visualizer):
+        from types import SimpleNamespace
+
+        tool_call = SimpleNamespace(
+            index=0,
+            function=SimpleNamespace(name="terminal", arguments='{"command": "ls'),
+        )
+        streaming_visualizer.on_token(_stream_chunk(reasoning="Thinking"))
+        streaming_visualizer.on_token(_stream_chunk(content="Hello"))
+        streaming_visualizer.on_token(_stream_chunk(tool_calls=[tool_call]))
+
+        live_cell = streaming_visualizer._live_cell
+        assert isinstance(live_cell, Static)
+        streaming_visualizer._container.mount.assert_called_once_with(live_cell)
+        rendered = str(live_cell.content)
+        assert "Thinking" in rendered
+        assert "Hello" in rendered
+        assert 'terminal {"command": "ls' in rendered
+
+    def test_final_event_removes_live_cell(self, streaming_visualizer):
+        streaming_visualizer.on_token(_stream_chunk(content="Hello"))
+        live_cell = streaming_visualizer._live_cell
+        assert live_cell is not None
+
+        with patch.object(live_cell, "remove") as remove:
+            streaming_visualizer._end_live_stream()
+
+        remove.assert_called_once()
+        assert streaming_visualizer._live_cell is None
+
+    @pytest.fixture
+    async def looped_visualizer(self):
+        """A visualizer created inside the running loop, like the app does."""
+        from unittest.mock import MagicMock
+
+        return ConversationVisualizer(MagicMock(), MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_deltas_from_thread_are_coalesced(self, looped_visualizer):
+        import asyncio
+        import threading
+
+        streaming_visualizer = looped_visualizer
+
+        def produce() -> None:
+            for piece in ["a", "b", "c"]:
+                streaming_visualizer.on_token(_stream_chunk(content=piece))
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0)
+
+        streaming_visualizer._app.set_timer.assert_called_once()
+        streaming_visualizer._updates.flush()
+
+        streaming_visualizer._container.mount.assert_called_once()
+        assert str(streaming_visualizer._live_cell.content) == "abc"
+
+    def test_live_cell_keeps_only_the_tail(self, streaming_visualizer):
+        from openhands_cli.tui.widgets.richlog_visualizer import LIVE_CELL_MAX_CHARS
+
+        streaming_visualizer.on_token(
+            _stream_chunk(content="x" * (LIVE_CELL_MAX_CHARS * 2))
+        )
+
+        rendered = str(streaming_visualizer._live_cell.content)
+        assert len(rendered) == LIVE_CELL_MAX_CHARS
+        assert rendered.startswith(ELLIPSIS)
@@ -78,6 +78,21 @@ def test_get_working_text_when_not_running_returns_empty(monkeypatch):
     assert text == ""
 
 
+def test_get_working_text_while_initializing(monkeypatch):
+    """While the runner is set up in the background, show an initializing hint."""
+    widget = WorkingStatusLine()
+
+    widget.running = False
+    widget.initializing = True
+    widget._working_frame = 0
+
+    assert widget._get_working_text() == "⠋ Initializing agent..."
+
+    # Once the conversation runs, the usual working text takes over.
+    widget.running = True
+    assert widget._get_working_text().startswith("⠋ Working")
+
+
 def test_watch_running_updates_text(monkeypatch):
     """Changing running state triggers text update."""
     widget = WorkingStatusLine()